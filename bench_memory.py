@@ -0,0 +1,92 @@
+import argparse
+import gc
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from pipeline import score_pillars
+from result_cache import estimate_size
+
+# ─────────────────────────────────────────────────────────
+#  MEMORY BENCHMARK  –  bytes held per scored ticker
+#
+#    python -m bench_memory --tickers 2000
+#
+#  Scores synthetic tickers offline (no network) through score_pillars
+#  and reports what the results keep alive: tracemalloc's retained bytes
+#  and result_cache.estimate_size, per ticker, for compact records and
+#  with the raw info dict kept (keep_info=True, which is what the old
+#  dict metas carried). The price frame is shared between tickers, so
+#  the numbers are the metadata's footprint.
+# ─────────────────────────────────────────────────────────
+
+INFO_KEYS = 180          # a typical yfinance quote-summary dict
+
+
+def synthetic_info(i, rng):
+    # Shaped like Yahoo's info: mostly numbers, some strings, a long
+    # business summary and a list of officer dicts
+    info = {f"field{k}": float(rng.normal()) for k in range(INFO_KEYS - 30)}
+    info.update({f"label{k}": f"value {i}-{k}" for k in range(20)})
+    info.update({
+        "longName": f"Company {i} Inc.", "shortName": f"CO{i}", "sector": "Technology", "industry": "Software",
+        "longBusinessSummary": "Designs, manufactures and markets products and services. " * 25,
+        "companyOfficers": [{"name": f"Officer {k}", "title": "Executive", "totalPay": 1e6 + k} for k in range(8)],
+        "currentPrice": 100.0 + i, "trailingPE": 20 + i % 30, "priceToBook": 4.0,
+        "returnOnEquity": 0.2, "returnOnAssets": 0.08, "debtToEquity": 60.0, "revenueGrowth": 0.1,
+        "profitMargins": 0.18, "freeCashflow": 5e8, "marketCap": 1e10, "earningsGrowth": 0.12,
+        "operatingCashflow": 7e8, "insider_buys": 2, "insider_sells": 5,
+        "insider_windows": {d: {"buys": 1, "sells": 2, "buy_value": 1e5, "sell_value": 2e5, "net_value": -1e5}
+                            for d in (90, 180, 365)},
+    })
+    return info
+
+
+def _fetched(i, rng, prices):
+    return {
+        "technical":   prices,
+        "fundamental": synthetic_info(i, rng),
+        "derivative":  {"valid": True, "pcr_vol": 0.8, "pcr_oi": 0.9, "short_float": 0.03,
+                        "short_ratio": 2.5, "avg_iv": 0.35, "term_structure": []},
+        "social":      ({"headlines": [{"title": f"Headline {k}", "sentiment": "Bullish", "score": 0.7}
+                                       for k in range(10)]}, "Real-Time AI"),
+    }
+
+
+def measure(n, keep_info):
+    rng    = np.random.default_rng(0)
+    idx    = pd.date_range("2024-01-01", periods=260, freq="B", tz="America/New_York")
+    close  = 100 + np.cumsum(rng.normal(size=260))
+    prices = pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+                           "Volume": np.full(260, 1_000_000)}, index=idx)
+    prices.attrs["ticker"] = "BENCH"
+    score_pillars(_fetched(0, rng, prices))   # warm the indicator memo outside the measurement
+
+    gc.collect()
+    tracemalloc.start()
+    before  = tracemalloc.get_traced_memory()[0]
+    results = []
+    for i in range(n):
+        results.append(score_pillars(_fetched(i, rng, prices), keep_info=keep_info))
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    meta_bytes = sum(estimate_size(r.meta) for r in results) / n
+    return retained / n, meta_bytes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report memory per scored ticker.")
+    parser.add_argument("--tickers", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    print(f"{args.tickers} tickers, {INFO_KEYS}-key info dicts")
+    for label, keep in (("compact records", False), ("with raw info  ", True)):
+        retained, meta = measure(args.tickers, keep)
+        print(f"  {label}  {retained:>9,.0f} bytes/ticker retained   {meta:>9,.0f} bytes/ticker meta (estimate_size)")
+
+
+if __name__ == "__main__":
+    main()
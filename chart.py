@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+
+# ─────────────────────────────────────────────────────────
+#  CHART PAYLOAD  –  Lightweight Charts series as JSON strings
+#
+#  Built column-wise from the price frame and the indicator columns the
+#  scorer already computed (panel.technical_history); nothing is
+#  recomputed here. Long histories are thinned with LTTB so the browser
+#  never receives more than CHART_MAX_POINTS bars per series.
+# ─────────────────────────────────────────────────────────
+
+CHART_MAX_POINTS = 1000
+CHART_DECIMALS   = 4
+SPARKLINE_POINTS = 120
+
+# payload key -> indicator column
+LINE_SERIES = {
+    'sma50':   'SMA50',
+    'sma200':  'SMA200',
+    'bb_high': 'BB_High',
+    'bb_low':  'BB_Low',
+    'score':   'score',
+}
+# The scorer's SMA200 shrinks to the available history; the chart line only
+# starts once a full window (or the whole history, if shorter) is in.
+LINE_WARMUP = {'sma200': 200}
+
+
+def lttb(y, n_out):
+    # Largest-Triangle-Three-Buckets over evenly spaced bars: indices of the
+    # n_out points that best preserve the shape of y (first and last kept).
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    every = (n - 2) / (n_out - 2)
+    edges = (np.arange(n_out) * every).astype(int) + 1   # bucket i spans edges[i]:edges[i + 1]
+    edges[-1] = n - 1
+    picks = np.empty(n_out, dtype=int)
+    picks[0], picks[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi    = edges[i], edges[i + 1]
+        nlo, nhi  = hi, edges[i + 2] if i + 2 < n_out - 1 else n
+        avg_x     = (nlo + nhi - 1) / 2
+        avg_y     = np.nanmean(y[nlo:nhi]) if nhi > nlo else y[-1]
+        xs        = np.arange(lo, hi)
+        area      = np.abs((a - avg_x) * (y[lo:hi] - y[a]) - (a - xs) * (avg_y - y[a]))
+        a         = lo + int(np.nanargmax(area)) if np.isfinite(area).any() else lo
+        picks[i + 1] = a
+    return picks
+
+
+def _records(columns, mask):
+    # One orient='records' JSON dump (C serializer) instead of a dict per row
+    frame = pd.DataFrame({k: v[mask] for k, v in columns.items()})
+    return frame.to_json(orient='records', double_precision=CHART_DECIMALS)
+
+
+def build_chart_payload(df, indicators, max_points=CHART_MAX_POINTS):
+    # df: OHLC frame; indicators: frame on the same index with the columns in
+    # LINE_SERIES. Returns {series name: JSON array string}.
+    pick = lttb(df['Close'].to_numpy(dtype=float), max_points)
+    idx  = df.index[pick]
+    time = (idx.as_unit('s').asi8 if idx.tz is not None else idx.tz_localize('UTC').as_unit('s').asi8)
+
+    ohlc = {k.lower(): np.round(df[k].to_numpy(dtype=float)[pick], CHART_DECIMALS)
+            for k in ('Open', 'High', 'Low', 'Close')}
+    payload = {'candles': _records({'time': time, **ohlc}, ~np.isnan(ohlc['open']))}
+
+    for name, col in LINE_SERIES.items():
+        values = indicators[col].to_numpy(dtype=float)
+        if name in LINE_WARMUP:
+            values = np.where(np.arange(len(values)) >= min(LINE_WARMUP[name], len(values)) - 1, values, np.nan)
+        values = values[pick]
+        payload[name] = _records({'time': time, 'value': np.round(values, CHART_DECIMALS)}, ~np.isnan(values))
+    return payload
+
+
+def sparkline_svg(values, color, width=160, height=36, max_points=SPARKLINE_POINTS):
+    # Inline SVG polyline of a 0–100 score series (oldest first), thinned
+    # with LTTB; '' when there are fewer than two points to draw
+    y = np.asarray(values, dtype=float)
+    y = y[~np.isnan(y)]
+    if len(y) < 2:
+        return ''
+    y  = y[lttb(y, max_points)]
+    xs = np.linspace(1, width - 1, len(y))
+    ys = (height - 1) - np.clip(y, 0, 100) / 100 * (height - 2)
+    points = ' '.join(f'{x:.1f},{v:.1f}' for x, v in zip(xs, ys))
+    return (f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+            f'<polyline fill="none" stroke="{color}" stroke-width="1.5" points="{points}"/>'
+            f'<circle cx="{xs[-1]:.1f}" cy="{ys[-1]:.1f}" r="2.5" fill="{color}"/></svg>')
@@ -0,0 +1,53 @@
+import os
+
+import requests
+
+from payload import frame_from_payload, result_from_payload
+
+# ─────────────────────────────────────────────────────────
+#  SCORING CLIENT  –  what the Streamlit app talks to
+#
+#  With SCORE_SERVICE_URL set (e.g. http://127.0.0.1:8000, see service.py)
+#  every analysis is a call to the HTTP service and the app holds no data
+#  loaders, stores or API keys. Without it the same pipeline runs in the
+#  app's own process, as before.
+# ─────────────────────────────────────────────────────────
+
+SCORE_SERVICE_URL = os.getenv("SCORE_SERVICE_URL", "").rstrip("/")
+SERVICE_TIMEOUT   = 90    # above the slowest pillar budget in pipeline.FETCH_TIMEOUTS
+
+_session = requests.Session()
+
+
+def analyze(ticker):
+    # (result, age in seconds); result is None when the ticker has no data
+    if not SCORE_SERVICE_URL:
+        from pipeline import analyze_ticker_cached
+        return analyze_ticker_cached(ticker)
+
+    response = _session.get(f"{SCORE_SERVICE_URL}/score/{ticker}", params={"bars": 1}, timeout=SERVICE_TIMEOUT)
+    if response.status_code == 404:
+        return None, 0.0
+    response.raise_for_status()
+    return result_from_payload(response.json())
+
+
+def resolve(query):
+    if not SCORE_SERVICE_URL:
+        from data_loader import convert_name_to_ticker
+        return convert_name_to_ticker(query)
+
+    response = _session.get(f"{SCORE_SERVICE_URL}/resolve", params={"q": query}, timeout=10)
+    response.raise_for_status()
+    return response.json()["ticker"]
+
+
+def history(ticker):
+    # Stored score runs for `ticker`, oldest first (score_history.ScoreHistory)
+    if not SCORE_SERVICE_URL:
+        from score_history import ScoreHistory
+        return ScoreHistory.default().history(ticker)
+
+    response = _session.get(f"{SCORE_SERVICE_URL}/history/{ticker}", timeout=10)
+    response.raise_for_status()
+    return frame_from_payload(response.json())
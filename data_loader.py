@@ -2,36 +2,47 @@ import yfinance as yf
 import pandas as pd
 import random
 import requests
-from bs4 import BeautifulSoup
-from groq import Groq
 import json
 import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-import streamlit as st
-from urllib.parse import urlparse
+from finviz import FinvizScraper
+from price_store import PriceStore
+from insiders import INSIDER_REFRESH_SECONDS, InsiderStore
+from options import ChainCache, aggregate, fetch_term_structure
+from statements import StatementStore, fetch_statements
+from singleflight import coalesced
+from groq_pool import GroqPool
+from sentiment import SENTIMENT_MODELS, BatchClassifier, HeadlineCache
+from ticker_index import get_index, get_resolution_cache
 
 # --- SECURE KEY LOADING ---
-api_keys_str = None
-try:
-    if "GROQ_KEYS" in st.secrets:
-        api_keys_str = st.secrets["GROQ_KEYS"]
-except: pass
+# Streamlit secrets are only consulted when running inside the Streamlit app
+# (streamlit already imported); the HTTP service and the CLI read .env/env.
+def load_api_keys():
+    api_keys_str = None
+    if "streamlit" in sys.modules:
+        try:
+            st = sys.modules["streamlit"]
+            if "GROQ_KEYS" in st.secrets:
+                api_keys_str = st.secrets["GROQ_KEYS"]
+        except: pass
 
-if not api_keys_str:
-    load_dotenv()
-    api_keys_str = os.getenv("GROQ_KEYS")
+    if not api_keys_str:
+        load_dotenv()
+        api_keys_str = os.getenv("GROQ_KEYS")
 
-if api_keys_str:
-    API_KEY_POOL = [k.strip() for k in api_keys_str.split(",") if k.strip()]
-else:
-    API_KEY_POOL = []
+    return [k.strip() for k in api_keys_str.split(",") if k.strip()] if api_keys_str else []
 
-# --- SMART SEARCH HELPER ---
-def convert_name_to_ticker(user_input):
-    clean_input = user_input.strip()
-    if len(clean_input) <= 5 and clean_input.isalpha() and clean_input.isupper():
-        return clean_input
+API_KEY_POOL = load_api_keys()
 
+# --- SMART SEARCH HELPER ---
+# Offline first: the local listings index and the persistent resolution LRU
+# answer almost every query; Yahoo search is only hit for true misses.
+def _search_yahoo(clean_input):
     search_queries = [clean_input]
     if " " in clean_input: search_queries.append(clean_input.replace(" ", "")) 
     if " and " in clean_input.lower(): search_queries.append(clean_input.lower().replace(" and ", " & "))
@@ -49,57 +60,214 @@ def convert_name_to_ticker(user_input):
                     if quote.get('quoteType') == 'EQUITY' and quote.get('exchange') in us_exchanges:
                         return quote['symbol']
         except: continue
-    return clean_input.upper()
+    return None
+
+def convert_name_to_ticker(user_input):
+    clean_input = user_input.strip()
+    if len(clean_input) <= 5 and clean_input.isalpha() and clean_input.isupper():
+        return clean_input
+
+    resolutions = get_resolution_cache()
+    symbol = resolutions.get(clean_input)
+    if symbol:
+        return symbol
+    symbol = get_index().resolve(clean_input) or _search_yahoo(clean_input)
+    if symbol is None:
+        return clean_input.upper()
+    resolutions.put(clean_input, symbol)
+    return symbol
+
+# --- PER-TICKER YAHOO SESSION ---
+# One yf.Ticker per symbol; every Yahoo payload is downloaded at most once and
+# shared by all DataLoader methods (which may run on different threads).
+class TickerSession:
+    def __init__(self, ticker):
+        self.ticker = ticker
+        self.stock = yf.Ticker(ticker)
+        self.hits = 0
+        self.misses = 0
+        self._cache = {}
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def _get(self, key, fetch):
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        # Per-key lock: a second thread asking for the same payload waits for
+        # the first download instead of starting its own.
+        with lock:
+            if key in self._cache:
+                with self._guard: self.hits += 1
+                return self._cache[key]
+            with self._guard: self.misses += 1
+            value = fetch()
+            self._cache[key] = value
+            return value
+
+    @property
+    def info(self):
+        return self._get('info', lambda: self.stock.info)
 
+    @property
+    def options(self):
+        return self._get('options', lambda: self.stock.options)
+
+    @property
+    def insider_transactions(self):
+        return self._get('insider_transactions', lambda: self.stock.insider_transactions)
+
+    @property
+    def financials(self):
+        return self._get('financials', lambda: self.stock.financials)
+
+    @property
+    def balance_sheet(self):
+        return self._get('balance_sheet', lambda: self.stock.balance_sheet)
+
+    @property
+    def cashflow(self):
+        return self._get('cashflow', lambda: self.stock.cashflow)
+
+    def history(self, **kwargs):
+        key = ('history',) + tuple(sorted(kwargs.items()))
+        return self._get(key, lambda: self.stock.history(**kwargs))
+
+    def option_chain(self, date):
+        return self._get(('option_chain', date), lambda: self.stock.option_chain(date))
+
+    def stats(self):
+        return {"ticker": self.ticker, "hits": self.hits, "misses": self.misses}
+
+
+# --- PRICE HISTORY ---
+HISTORY_DAYS = 365            # window handed to the scorers (matches period="1y")
+PRICE_REFRESH_SECONDS = 60    # stored bars younger than this are served without a fetch
+
+
+def _corporate_action_after(bars, last_ts):
+    # A dividend or split on a bar newer than last_ts (epoch seconds). The
+    # last stored bar comes back with every refresh, and its own action is
+    # already reflected in the stored prices.
+    idx   = bars.index if bars.index.tz is not None else bars.index.tz_localize('UTC')
+    newer = bars[idx.as_unit('s').asi8 > last_ts]
+    return bool(newer.reindex(columns=['Dividends', 'Stock Splits']).fillna(0).any().any())
+
+
+# Every fetch below is @coalesced: while one session is fetching a
+# (kind, ticker), other sessions asking for the same thing wait for that
+# call instead of hitting Yahoo/FinViz/Groq again.
 class DataLoader:
-    def __init__(self):
-        pass
+    def __init__(self, price_store=None, headline_cache=None, finviz=None, insider_store=None, chain_cache=None,
+                 statement_store=None):
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+        self.price_store    = price_store    if price_store    is not None else PriceStore.default()
+        self.headline_cache = headline_cache if headline_cache is not None else HeadlineCache.default()
+        self.finviz         = finviz         if finviz         is not None else FinvizScraper.shared()
+        self.insider_store  = insider_store  if insider_store  is not None else InsiderStore.default()
+        self.chain_cache    = chain_cache    if chain_cache    is not None else ChainCache.shared()
+        self.statement_store = statement_store if statement_store is not None else StatementStore.default()
+        self.groq           = GroqPool.shared(API_KEY_POOL) if API_KEY_POOL else None
+        self.classifier     = BatchClassifier(self._complete, self.headline_cache,
+                                              concurrency=max(1, 2 * len(API_KEY_POOL)))
+
+    def session(self, ticker):
+        with self._sessions_lock:
+            if ticker not in self._sessions:
+                self._sessions[ticker] = TickerSession(ticker)
+            return self._sessions[ticker]
 
+    def session_stats(self):
+        with self._sessions_lock:
+            sessions = list(self._sessions.values())
+        return {
+            "hits":   sum(s.hits for s in sessions),
+            "misses": sum(s.misses for s in sessions),
+            "tickers": [s.stats() for s in sessions],
+        }
+
+    @coalesced("technical")
     def get_technical_data(self, ticker):
         try:
-            stock = yf.Ticker(ticker)
-            df = stock.history(period="1y")
-            if df.empty: return None 
+            df = self._price_history(ticker)
+            if df is None or df.empty: return None 
+            df.attrs['ticker'] = ticker   # key for the shared indicator frame
             return df
         except: return None
 
+    def _price_history(self, ticker):
+        session = self.session(ticker)
+        store   = self.price_store
+        meta    = store.meta(ticker)
+        since   = time.time() - HISTORY_DAYS * 86400
+
+        if meta is None:
+            full = session.history(period="1y")
+            if full.empty: return None
+            store.write(ticker, full, replace=True)
+        elif time.time() - meta['fetched_at'] >= PRICE_REFRESH_SECONDS:
+            # Re-fetch from the last stored bar: it may have been an intraday
+            # partial, so it's overwritten along with any new bars.
+            last = pd.Timestamp(meta['last_ts'], unit='s', tz='UTC').tz_convert(meta['tz'])
+            tail = session.history(start=last.strftime('%Y-%m-%d'))
+            if tail.empty:
+                store.touch(ticker)
+            elif _corporate_action_after(tail, meta['last_ts']):
+                # A dividend or split re-adjusts every earlier bar: rebuild the stored span
+                first = pd.Timestamp(meta['first_ts'], unit='s', tz='UTC').tz_convert(meta['tz'])
+                store.write(ticker, session.history(start=first.strftime('%Y-%m-%d')), replace=True)
+            else:
+                store.write(ticker, tail)
+
+        return store.load(ticker, since=since)
+
+    @coalesced("fundamental")
     def get_fundamental_data(self, ticker):
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            stock = self.session(ticker)
+            # Copy: the session's info is shared with get_derivative_data
+            info = dict(stock.info)
             if 'regularMarketPrice' not in info and 'currentPrice' not in info:
                 return {}
             
-            # --- FIXED: EXTRACT INSIDER PURCHASES & SALES ---
-            insider_buys = 0
-            insider_sells = 0
-            
-            try:
-                # Pull the actual transaction log
-                transactions = stock.insider_transactions
-                
-                if transactions is not None and not transactions.empty:
-                    # Iterate through every transaction row
-                    for index, row in transactions.iterrows():
-                        # Convert the whole row to text (avoids relying on fragile column names)
-                        row_text = str(row.values).lower()
-                        
-                        # Count explicit buys and sells (Ignores "Stock Gift" entries)
-                        if 'purchase' in row_text or 'buy' in row_text:
-                            insider_buys += 1
-                        elif 'sale' in row_text or 'sell' in row_text:
-                            insider_sells += 1
-            except:
-                pass # Fail silently if no insider data exists (e.g., ETFs)
-            
-            info['insider_buys'] = insider_buys
-            info['insider_sells'] = insider_sells
+            # Insider buys/sells plus value-weighted and windowed aggregates
+            info.update(self._insider_activity(ticker, stock))
             return info
         except: return {}
 
+    @coalesced("statements")
+    def get_statements(self, ticker):
+        # {'_financials'|'_balance_sheet'|'_cashflow': DataFrame}, from the
+        # statement store until the next fiscal period is due
+        return fetch_statements(ticker, self.session(ticker), self.statement_store)
+
+    def get_statements_batch(self, tickers, workers=8):
+        # Statements for a universe (for panel.piotroski_panel); tickers
+        # whose fetch fails map to {}
+        def one(ticker):
+            try:
+                return self.get_statements(ticker)
+            except Exception:
+                return {}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(tickers, pool.map(one, tickers)))
+
+    def _insider_activity(self, ticker, stock):
+        # New filings are classified into the local store at most once per
+        # refresh interval; the aggregates are always read back from it.
+        store = self.insider_store
+        fetched_at = store.fetched_at(ticker)
+        if fetched_at is None or time.time() - fetched_at >= INSIDER_REFRESH_SECONDS:
+            try:
+                store.update(ticker, stock.insider_transactions)
+            except Exception:
+                pass # Fail silently if no insider data exists (e.g., ETFs)
+        return store.aggregates(ticker)
+
+    @coalesced("derivative")
     def get_derivative_data(self, ticker):
         try:
-            stock = yf.Ticker(ticker)
+            stock = self.session(ticker)
             info = stock.info
             
             short_float = info.get('shortPercentFloat')
@@ -114,72 +282,21 @@ class DataLoader:
             
             short_ratio = info.get('shortRatio', 0) 
             
-            options_dates = stock.options
-            if options_dates:
-                chain = stock.option_chain(options_dates[0])
-                calls_vol = chain.calls['volume'].sum()
-                puts_vol = chain.puts['volume'].sum()
-                pcr_vol = puts_vol / calls_vol if calls_vol > 0 else 0
-                
-                calls_oi = chain.calls['openInterest'].sum()
-                puts_oi = chain.puts['openInterest'].sum()
-                pcr_oi = puts_oi / calls_oi if calls_oi > 0 else 0
-                
-                avg_iv = (chain.calls['impliedVolatility'].mean() + chain.puts['impliedVolatility'].mean()) / 2
-            else: 
-                pcr_vol = pcr_oi = avg_iv = 0
+            # Put/call ratios and IV over the 1–2 month expiry window, OI-weighted
+            term = fetch_term_structure(ticker, stock, self.chain_cache)
+            flow = aggregate(term)
 
             return {
                 "short_float": short_float, "short_ratio": short_ratio,
-                "pcr_vol": pcr_vol, "pcr_oi": pcr_oi, "avg_iv": avg_iv, "valid": True
+                **flow, "term_structure": term.to_dict('records'), "valid": True
             }
         except Exception: 
             return {"valid": False}
 
-    def _get_source_name(self, url):
-        try:
-            domain = urlparse(url).netloc
-            domain = domain.replace("www.", "")
-            if "finance.yahoo" in domain: return "Yahoo Finance"
-            if "motleyfool" in domain or "fool.com" in domain: return "Motley Fool"
-            if "seekingalpha" in domain: return "Seeking Alpha"
-            if "marketwatch" in domain: return "MarketWatch"
-            if "benzinga" in domain: return "Benzinga"
-            if "barrons" in domain: return "Barron's"
-            if "bloomberg" in domain: return "Bloomberg"
-            if "cnbc" in domain: return "CNBC"
-            if "wsj" in domain: return "WSJ"
-            return domain.capitalize()
-        except:
-            return "News"
-
     def _scrape_finviz(self, ticker):
-        url = f"https://finviz.com/quote.ashx?t={ticker}"
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        try:
-            response = requests.get(url, headers=headers, timeout=5)
-            if response.status_code != 200: return []
-            soup = BeautifulSoup(response.text, 'html.parser')
-            news_table = soup.find(id='news-table')
-            if not news_table: return []
-            
-            headlines = []
-            for tr in news_table.findAll('tr'):
-                a_tag = tr.find('a')
-                if a_tag:
-                    link = a_tag['href']
-                    if not link.startswith("http"):
-                        link = "https://finviz.com/" + link.strip("/")
-                    source_name = self._get_source_name(link)
-                    headlines.append({
-                        "title": a_tag.text.strip(),
-                        "link": link,
-                        "source": source_name,
-                        "time": tr.find('td').text.strip() if tr.find('td') else ""
-                    })
-            return headlines[:30]
-        except: return []
+        return self.finviz.scrape(ticker)
 
+    @coalesced("social")
     def get_social_sentiment(self, ticker):
         if not API_KEY_POOL:
             return {"error": "API Keys are missing! Add them to Streamlit Secrets."}, "Error"
@@ -188,55 +305,44 @@ class DataLoader:
         if not raw_news:
             return {"error": "FinViz returned 0 articles. It might be a bad ticker or a temporary block."}, "No Data"
 
-        titles_only = [h['title'] for h in raw_news]
-
-        prompt = f"""
-        Analyze these headlines for "{ticker}": {json.dumps(titles_only)}
-        
-        Task:
-        1. Classify each as 'Bullish', 'Bearish', or 'Neutral/Irrelevant'.
-        2. Assign an Impact Score (0-10). 0=Irrelevant, 10=Major News.
-        
-        Output JSON ONLY:
-        {{
-            "analysis": [
-                {{"sentiment": "Bullish", "score": 8}}, 
-                {{"sentiment": "Neutral", "score": 2}}
-            ]
-        }}
-        """
-
-        for key in API_KEY_POOL:
-            client = Groq(api_key=key)
-            try:
-                completion = client.chat.completions.create(
-                    model="llama-3.3-70b-versatile",
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0,
-                    response_format={"type": "json_object"}
-                )
-                ai_response = json.loads(completion.choices[0].message.content)
-            except Exception:
-                try:
-                    completion = client.chat.completions.create(
-                        model="llama-3.1-8b-instant",
-                        messages=[{"role": "user", "content": prompt}],
-                        temperature=0,
-                        response_format={"type": "json_object"}
-                    )
-                    ai_response = json.loads(completion.choices[0].message.content)
-                except: continue 
-            
-            ai_results = ai_response.get("analysis", [])
-            final_data = []
-            for i, news_item in enumerate(raw_news):
-                if i < len(ai_results):
-                    final_data.append({**news_item, **ai_results[i]})
-            
-            return {"headlines": final_data}, "Real-Time AI"
-        
-        return {"error": "Groq AI Services are busy. Try again in 1 minute."}, "Error"
+        classified = self.classifier.classify({ticker: [h['title'] for h in raw_news]})
+        if ticker not in classified:
+            return {"error": "Groq AI Services are busy. Try again in 1 minute."}, "Error"
+        return self._merge_headlines(raw_news, classified[ticker]), "Real-Time AI"
 
+    def get_social_sentiment_batch(self, tickers, workers=8):
+        # Scrape every ticker, then classify all headlines in as few LLM
+        # requests as the token budget allows. Metrics: self.classifier.metrics
+        if not API_KEY_POOL:
+            return {t: ({"error": "API Keys are missing! Add them to Streamlit Secrets."}, "Error") for t in tickers}
+
+        news = self.finviz.scrape_many(tickers, workers=workers)
+
+        classified = self.classifier.classify({t: [h['title'] for h in n] for t, n in news.items() if n})
+        out = {}
+        for ticker in tickers:
+            if not news[ticker]:
+                out[ticker] = {"error": "FinViz returned 0 articles. It might be a bad ticker or a temporary block."}, "No Data"
+            elif ticker not in classified:
+                out[ticker] = {"error": "Groq AI Services are busy. Try again in 1 minute."}, "Error"
+            else:
+                out[ticker] = self._merge_headlines(news[ticker], classified[ticker]), "Real-Time AI"
+        return out
+
+    def _merge_headlines(self, raw_news, classified):
+        return {"headlines": [{**item, **classified[item['title']]} for item in raw_news if item['title'] in classified]}
+
+    @coalesced("llm")
+    def _complete(self, prompt, est_tokens=1000):
+        return self.groq.complete(
+            [{"role": "user", "content": prompt}], SENTIMENT_MODELS,
+            est_tokens=est_tokens,
+            parse=lambda c: json.loads(c.choices[0].message.content),
+            temperature=0,
+            response_format={"type": "json_object"}
+        )
+
+    @coalesced("competitors")
     def get_competitors(self, ticker, company_name, sector, industry):
         if not API_KEY_POOL:
             return []
@@ -244,18 +350,12 @@ class DataLoader:
 sector: {sector}, industry: {industry}, list exactly 5 of its closest publicly traded competitors on US exchanges.
 Output JSON ONLY, no explanation:
 {{"competitors": [{{"ticker": "AAPL", "name": "Apple Inc."}}, ...]}}"""
-        for key in API_KEY_POOL:
-            client = Groq(api_key=key)
-            try:
-                completion = client.chat.completions.create(
-                    model="llama-3.1-8b-instant",
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0,
-                    response_format={"type": "json_object"},
-                    max_tokens=200,
-                )
-                result = json.loads(completion.choices[0].message.content)
-                return result.get("competitors", [])
-            except:
-                continue
-        return []
\ No newline at end of file
+        reply = self.groq.complete(
+            [{"role": "user", "content": prompt}], ["llama-3.1-8b-instant"],
+            est_tokens=400,
+            parse=lambda c: json.loads(c.choices[0].message.content).get("competitors", []),
+            temperature=0,
+            response_format={"type": "json_object"},
+            max_tokens=200,
+        )
+        return reply[0] if reply else []
@@ -0,0 +1,125 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# --- SETTINGS ---
+FINVIZ_BASE_URL   = "https://finviz.com"
+REQUESTS_PER_SEC  = 2.0     # per host; FinViz blocks aggressive scrapers
+REQUEST_TIMEOUT   = 5
+MAX_HEADLINES     = 30
+HEADERS           = {'User-Agent': 'Mozilla/5.0'}
+
+SOURCE_NAMES = [
+    ("finance.yahoo", "Yahoo Finance"),
+    ("motleyfool",    "Motley Fool"),
+    ("fool.com",      "Motley Fool"),
+    ("seekingalpha",  "Seeking Alpha"),
+    ("marketwatch",   "MarketWatch"),
+    ("benzinga",      "Benzinga"),
+    ("barrons",       "Barron's"),
+    ("bloomberg",     "Bloomberg"),
+    ("cnbc",          "CNBC"),
+    ("wsj",           "WSJ"),
+]
+
+
+def source_name(url):
+    try:
+        domain = urlparse(url).netloc.replace("www.", "")
+        for needle, name in SOURCE_NAMES:
+            if needle in domain:
+                return name
+        return domain.capitalize()
+    except Exception:
+        return "News"
+
+
+def parse_news_table(html, base_url=FINVIZ_BASE_URL, limit=MAX_HEADLINES):
+    # Only the #news-table node is built into a tree; the rest of the quote
+    # page (most of its weight) is skipped by the strainer.
+    table = BeautifulSoup(html, HTML_PARSER, parse_only=SoupStrainer(id='news-table'))
+    headlines = []
+    for tr in table.find_all('tr'):
+        a_tag = tr.find('a')
+        if not a_tag or not a_tag.get('href'):
+            continue
+        link = a_tag['href']
+        if not link.startswith("http"):
+            link = base_url.rstrip("/") + "/" + link.strip("/")
+        td = tr.find('td')
+        headlines.append({
+            "title":  a_tag.get_text().strip(),
+            "link":   link,
+            "source": source_name(link),
+            "time":   td.get_text().strip() if td else "",
+        })
+        if len(headlines) >= limit:
+            break
+    return headlines
+
+
+class HostRateLimiter:
+    # Spaces requests to the same host at least 1/rate seconds apart,
+    # across all threads.
+    def __init__(self, rate=REQUESTS_PER_SEC):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next    = {}
+        self._lock    = threading.Lock()
+
+    def wait(self, host):
+        with self._lock:
+            now  = time.monotonic()
+            slot = max(now, self._next.get(host, now))
+            self._next[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# ─────────────────────────────────────────────────────────
+#  SCRAPER  –  one keep-alive session, polite per-host pacing
+# ─────────────────────────────────────────────────────────
+class FinvizScraper:
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, base_url=FINVIZ_BASE_URL, rate=REQUESTS_PER_SEC, timeout=REQUEST_TIMEOUT, pool_size=16):
+        self.base_url = base_url.rstrip("/")
+        self.timeout  = timeout
+        self.limiter  = HostRateLimiter(rate)
+        self.session  = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def scrape(self, ticker):
+        url = f"{self.base_url}/quote.ashx?t={ticker}"
+        try:
+            self.limiter.wait(urlparse(url).netloc)
+            response = self.session.get(url, timeout=self.timeout)
+            if response.status_code != 200: return []
+            return parse_news_table(response.content, self.base_url)
+        except Exception:
+            return []
+
+    def scrape_many(self, tickers, workers=8):
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            return dict(zip(tickers, pool.map(self.scrape, tickers)))
@@ -0,0 +1,156 @@
+import threading
+import time
+
+from groq import Groq, RateLimitError
+
+# ─────────────────────────────────────────────────────────
+#  GROQ KEY POOL  –  rate-limit-aware scheduler over API_KEY_POOL
+#
+#  One long-lived client per key. Every (key, model) pair has a request
+#  bucket and a token bucket refilled per minute; a call reserves from the
+#  pair that can serve it soonest, so concurrent callers spread across
+#  keys instead of all queueing on the first one. A 429 parks that pair
+#  for the server's retry-after and the call moves to the next best pair.
+# ─────────────────────────────────────────────────────────
+
+# Per key, per model (Groq free-tier defaults; override for paid plans)
+MODEL_LIMITS = {
+    "llama-3.3-70b-versatile": {"rpm": 30, "tpm": 12000},
+    "llama-3.1-8b-instant":    {"rpm": 30, "tpm": 6000},
+}
+DEFAULT_LIMITS   = {"rpm": 30, "tpm": 6000}
+MAX_QUEUE_WAIT   = 20    # seconds a call will wait for budget before falling back a model
+DEFAULT_COOLDOWN = 10    # seconds to park a pair after a 429 with no retry-after
+
+
+class TokenBucket:
+    # Reservation bucket: a reservation may drive the level negative and the
+    # caller sleeps until it would have been covered.
+    def __init__(self, per_minute):
+        self.rate     = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.level    = float(per_minute)
+        self.stamp    = time.monotonic()
+
+    def _refill(self, now):
+        self.level = min(self.capacity, self.level + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+    def wait_for(self, amount, now):
+        self._refill(now)
+        return max(0.0, (min(amount, self.capacity) - self.level) / self.rate)
+
+    def take(self, amount, now):
+        self._refill(now)
+        self.level -= amount
+
+
+class _Lane:
+    def __init__(self, key, client, model, limits):
+        self.key        = key
+        self.client     = client
+        self.model      = model
+        self.requests   = TokenBucket(limits["rpm"])
+        self.tokens     = TokenBucket(limits["tpm"])
+        self.cooldown   = 0.0
+        self.inflight   = 0
+        self.calls      = 0
+        self.rate_limited = 0
+
+    def wait_for(self, est_tokens, now):
+        return max(self.cooldown - now, self.requests.wait_for(1, now), self.tokens.wait_for(est_tokens, now))
+
+
+def _retry_after(err):
+    try:
+        return float(err.response.headers.get("retry-after"))
+    except Exception:
+        return DEFAULT_COOLDOWN
+
+
+class GroqPool:
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, keys, limits=None, max_wait=MAX_QUEUE_WAIT):
+        limits        = {**MODEL_LIMITS, **(limits or {})}
+        self.max_wait = max_wait
+        self._lock    = threading.Lock()
+        self._limits  = limits
+        # The scheduler owns retries, so the SDK's own backoff is disabled
+        self._clients = {key: Groq(api_key=key, max_retries=0) for key in keys}
+        self._lanes   = {}
+
+    @classmethod
+    def shared(cls, keys):
+        # One pool per key set for the whole process (all sessions, all loaders)
+        ident = tuple(keys)
+        with cls._shared_lock:
+            if ident not in cls._shared:
+                cls._shared[ident] = cls(keys)
+            return cls._shared[ident]
+
+    def _lanes_for(self, model):
+        if model not in self._lanes:
+            limits = self._limits.get(model, DEFAULT_LIMITS)
+            self._lanes[model] = [_Lane(k, c, model, limits) for k, c in self._clients.items()]
+        return self._lanes[model]
+
+    def _reserve(self, model, est_tokens, tried):
+        with self._lock:
+            now   = time.monotonic()
+            lanes = [l for l in self._lanes_for(model) if l.key not in tried]
+            if not lanes:
+                return None, None
+            # Soonest budget first; ties go to the key with fewest calls in flight
+            lane = min(lanes, key=lambda l: (l.wait_for(est_tokens, now), l.inflight, l.calls))
+            wait = lane.wait_for(est_tokens, now)
+            if wait > self.max_wait:
+                return None, None
+            lane.requests.take(1, now)
+            lane.tokens.take(est_tokens, now)
+            lane.calls    += 1
+            lane.inflight += 1
+            return lane, wait
+
+    def complete(self, messages, models, est_tokens=1000, parse=None, **kwargs):
+        # Returns (parse(completion), model, usage) from the first model that
+        # answers, or None once every key/model is exhausted or over budget.
+        for model in models:
+            tried = set()
+            while True:
+                lane, wait = self._reserve(model, est_tokens, tried)
+                if lane is None:
+                    break
+                if wait:
+                    time.sleep(wait)
+                tried.add(lane.key)
+                try:
+                    completion = lane.client.chat.completions.create(model=model, messages=messages, **kwargs)
+                    result = parse(completion) if parse else completion
+                except RateLimitError as e:
+                    with self._lock:
+                        lane.cooldown = time.monotonic() + _retry_after(e)
+                        lane.rate_limited += 1
+                    continue
+                except Exception:
+                    continue
+                finally:
+                    with self._lock:
+                        lane.inflight -= 1
+
+                usage = getattr(completion, "usage", None)
+                used  = getattr(usage, "total_tokens", None)
+                if used is not None:
+                    # Settle the estimate against what the request really cost
+                    with self._lock:
+                        lane.tokens.take(used - est_tokens, time.monotonic())
+                return result, model, usage
+        return None
+
+    def stats(self):
+        with self._lock:
+            return [
+                {"key": l.key[-4:], "model": l.model, "calls": l.calls, "rate_limited": l.rate_limited}
+                for lanes in self._lanes.values() for l in lanes
+            ]
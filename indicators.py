@@ -0,0 +1,147 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# ─────────────────────────────────────────────────────────
+#  INDICATORS  –  vectorised equivalents of the `ta` indicators
+#
+#  Every function takes a close Series (one ticker) or a wide DataFrame
+#  (dates × tickers) and returns the same shape, matching ta's
+#  RSIIndicator / SMAIndicator / EMAIndicator / MACD / BollingerBands
+#  with fillna=False. Leading NaNs (a ticker listed after the panel
+#  start) are skipped, so each column behaves like its own Series.
+# ─────────────────────────────────────────────────────────
+
+def sma(close, window):
+    return close.rolling(window, min_periods=window).mean()
+
+
+def capped_sma(close, window):
+    # Mean of the last min(window, bars so far): ta's
+    # SMAIndicator(close, min(window, len(close))) evaluated at every bar.
+    return close.rolling(window, min_periods=1).mean()
+
+
+def ema(close, window):
+    return close.ewm(span=window, min_periods=window, adjust=False).mean()
+
+
+def rsi(close, window=14):
+    diff  = close.diff(1)
+    valid = close.notna()
+    up    = diff.where(diff > 0, 0.0).where(valid)
+    down  = -diff.where(diff < 0, 0.0).where(valid)
+    emaup = up.ewm(alpha=1 / window, min_periods=window, adjust=False).mean()
+    emadn = down.ewm(alpha=1 / window, min_periods=window, adjust=False).mean()
+    return (100 - 100 / (1 + emaup / emadn)).where(emadn != 0, 100.0)
+
+
+def macd(close, fast=12, slow=26, sign=9):
+    line = ema(close, fast) - ema(close, slow)
+    return line, ema(line, sign)
+
+
+def bollinger(close, window=20, dev=2):
+    mavg = close.rolling(window, min_periods=window).mean()
+    mstd = close.rolling(window, min_periods=window).std(ddof=0)
+    return mavg + dev * mstd, mavg - dev * mstd
+
+
+# ─────────────────────────────────────────────────────────
+#  INDICATOR FRAME  –  every column the scorer and the chart read
+#
+#  Computed once per ticker and price window and memoised on
+#  (ticker, first bar, last bar, bars, hash of the closes) — the price
+#  store rewrites today's bar during the session, so the dates alone
+#  don't identify the prices. The ticker comes from df.attrs['ticker']
+#  (set by DataLoader); frames without one are not cached. Callers
+#  share the cached frame and must not modify it.
+# ─────────────────────────────────────────────────────────
+FRAME_COLUMNS    = ['RSI', 'SMA50', 'SMA200', 'EMA20', 'MACD', 'MACD_Signal', 'BB_High', 'BB_Low', 'Price']
+FRAME_CACHE_SIZE = 64
+
+_frames      = OrderedDict()
+_frames_lock = threading.Lock()
+
+
+def _compute_frame(close):
+    macd_line, macd_signal = macd(close)
+    bb_high, bb_low        = bollinger(close)
+    return pd.DataFrame({
+        'RSI':         rsi(close),
+        'SMA50':       sma(close, 50),
+        'SMA200':      capped_sma(close, 200),
+        'EMA20':       ema(close, 20),
+        'MACD':        macd_line,
+        'MACD_Signal': macd_signal,
+        'BB_High':     bb_high,
+        'BB_Low':      bb_low,
+        'Price':       close,
+    }, index=close.index)
+
+
+def indicator_frame(df):
+    close  = df['Close'] if isinstance(df, pd.DataFrame) else df
+    ticker = df.attrs.get('ticker')
+    if ticker is None or close.empty:
+        return _compute_frame(close)
+
+    key = (ticker, close.index[0], close.index[-1], len(close), hash(close.to_numpy(dtype=float).tobytes()))
+    with _frames_lock:
+        if key in _frames:
+            _frames.move_to_end(key)
+            return _frames[key]
+    frame = _compute_frame(close)
+    with _frames_lock:
+        _frames[key] = frame
+        while len(_frames) > FRAME_CACHE_SIZE:
+            _frames.popitem(last=False)
+    return frame
+
+
+# ─────────────────────────────────────────────────────────
+#  NumPy kernels for wide panels: pandas rolling/ewm iterate column by
+#  column, these step through the rows once and update every ticker at a
+#  time.
+# ─────────────────────────────────────────────────────────
+
+def ewm_array(values, alpha, min_periods):
+    # pandas ewm(alpha=..., adjust=False, ignore_na=False).mean(), row-stepped
+    x        = np.asarray(values, dtype=float)
+    out      = np.full_like(x, np.nan)
+    old_f    = 1.0 - alpha
+    weighted = np.full(x.shape[1:], np.nan)
+    old_wt   = np.ones(x.shape[1:])
+    nobs     = np.zeros(x.shape[1:])
+
+    for t in range(len(x)):
+        cur  = x[t]
+        obs  = ~np.isnan(cur)
+        has  = ~np.isnan(weighted)
+        nobs += obs
+        old_wt = np.where(has, old_wt * old_f, old_wt)
+        upd    = has & obs & (weighted != cur)
+        with np.errstate(invalid='ignore'):
+            blended = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+        weighted = np.where(upd, blended, np.where(obs & ~has, cur, weighted))
+        old_wt   = np.where(has & obs, 1.0, old_wt)
+        out[t]   = np.where(nobs >= min_periods, weighted, np.nan)
+    return out
+
+
+def ema_array(values, window):
+    return ewm_array(values, 2.0 / (window + 1), window)
+
+
+def rsi_array(values, window=14):
+    x    = np.asarray(values, dtype=float)
+    diff = np.vstack([np.full((1,) + x.shape[1:], np.nan), np.diff(x, axis=0)])
+    with np.errstate(invalid='ignore'):
+        up   = np.where(np.isnan(x), np.nan, np.where(diff > 0, diff, 0.0))
+        down = np.where(np.isnan(x), np.nan, np.where(diff < 0, -diff, 0.0))
+    emaup = ewm_array(up, 1.0 / window, window)
+    emadn = ewm_array(down, 1.0 / window, window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(emadn == 0, 100.0, 100 - 100 / (1 + emaup / emadn))
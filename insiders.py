@@ -0,0 +1,183 @@
+import hashlib
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils import cache_path
+
+# --- SETTINGS ---
+INSIDER_WINDOWS          = (90, 180, 365)   # days, for the time-windowed aggregates
+INSIDER_REFRESH_SECONDS  = 6 * 3600         # Form 4 filings trickle in; no need to re-pull every request
+TEXT_COLUMNS             = ['Text', 'Transaction']
+
+_BUY_PATTERN  = r'purchase|buy'
+_SELL_PATTERN = r'sale|sell'
+
+
+def _joined(df, cols, sep):
+    # Column-wise string concatenation (no per-row Python calls)
+    out = pd.Series('', index=df.index, dtype=object)
+    for i, c in enumerate(cols):
+        col = df[c].astype(object).where(df[c].notna(), '').astype(str)
+        out = col if i == 0 else out + sep + col
+    return out
+
+
+def classify_transactions(transactions):
+    # Columnar version of the old per-row test: 'buy' wins over 'sell', and
+    # anything else (gifts, grants, option exercises) is neither. Returns an
+    # int8 array: 1 buy, -1 sell, 0 other.
+    cols = [c for c in TEXT_COLUMNS if c in transactions.columns]
+    if not cols:
+        cols = list(transactions.select_dtypes(include=['object', 'string']).columns)
+    if not cols or transactions.empty:
+        return np.zeros(len(transactions), dtype=np.int8)
+    text = _joined(transactions, cols, ' ').str.lower()
+    buy  = text.str.contains(_BUY_PATTERN, regex=True).to_numpy()
+    sell = text.str.contains(_SELL_PATTERN, regex=True).to_numpy()
+    return np.where(buy, 1, np.where(sell, -1, 0)).astype(np.int8)
+
+
+def _filing_keys(ticker, dates, insiders, shares, sides):
+    # A filing has no id in the Yahoo payload. It is keyed on the fields a
+    # correction doesn't touch (who, when, how many shares, buy/sell)
+    # plus its ordinal among identical rows, so a revised value replaces
+    # the stored row while two separate identical trades stay two rows.
+    base = [hashlib.sha1(f"{ticker}|{d}|{i}|{float(n)!r}|{int(side)}".encode("utf-8")).hexdigest()
+            for d, i, n, side in zip(dates, insiders, shares, sides)]
+    nth  = pd.Series(base, dtype=object).groupby(base).cumcount()
+    return [f"{b}:{n}" for b, n in zip(base, nth)]
+
+
+def _column(df, name, default):
+    return df[name] if name in df.columns else pd.Series(default, index=df.index)
+
+
+def _epochs(df):
+    dates = pd.to_datetime(_column(df, 'Start Date', None), errors='coerce')
+    return [int(d.timestamp()) if pd.notna(d) else None for d in dates]
+
+
+# ─────────────────────────────────────────────────────────
+#  INSIDER STORE  –  classified Form 4 transactions per ticker
+#
+#  Filings are keyed on their stable fields (see _filing_keys): a refresh
+#  inserts new filings and replaces revised ones, so a correction isn't
+#  counted twice. Aggregates are SQL sums over the stored rows.
+# ─────────────────────────────────────────────────────────
+class InsiderStore:
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, path=None):
+        self.path  = path or cache_path("insiders.sqlite")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS transactions ("
+                " ticker TEXT NOT NULL, key TEXT NOT NULL, date INTEGER, insider TEXT,"
+                " shares REAL, value REAL, side INTEGER,"
+                " PRIMARY KEY (ticker, key)) WITHOUT ROWID"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fetches (ticker TEXT PRIMARY KEY, fetched_at REAL, since INTEGER)"
+            )
+            self._migrate_keys()
+
+    def _migrate_keys(self):
+        # Rows stored under the old whole-row hash (no ':' in the key) are
+        # re-keyed; copies of one filing that differed only in value collapse
+        old = self._conn.execute(
+            "SELECT ticker, date, insider, shares, value, side FROM transactions WHERE instr(key, ':') = 0"
+        ).fetchall()
+        if not old:
+            return
+        rows = [(t, _filing_keys(t, [d], [i], [n], [side])[0], d, i, n, v, side) for t, d, i, n, v, side in old]
+        self._conn.execute("DELETE FROM transactions WHERE instr(key, ':') = 0")
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO transactions (ticker, key, date, insider, shares, value, side) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+
+    @classmethod
+    def default(cls):
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def fetched_at(self, ticker):
+        with self._lock:
+            row = self._conn.execute("SELECT fetched_at FROM fetches WHERE ticker = ?", (ticker,)).fetchone()
+        return row[0] if row else None
+
+    def update(self, ticker, transactions):
+        # Returns the number of new filings stored (revisions of stored
+        # filings replace them and aren't counted)
+        records, fresh, since = [], 0, None
+        if transactions is not None and not transactions.empty:
+            dates    = _epochs(transactions)
+            since    = min((e for e in dates if e is not None), default=None)
+            insiders = _column(transactions, 'Insider', '').astype(str).tolist()
+            shares   = pd.to_numeric(_column(transactions, 'Shares', 0), errors='coerce').fillna(0).tolist()
+            values   = pd.to_numeric(_column(transactions, 'Value', 0), errors='coerce').fillna(0).tolist()
+            sides    = classify_transactions(transactions).tolist()
+            keys     = _filing_keys(ticker, dates, insiders, shares, sides)
+            with self._lock:
+                known = {k for (k,) in self._conn.execute(
+                    "SELECT key FROM transactions WHERE ticker = ?", (ticker,)
+                )}
+            fresh   = sum(k not in known for k in keys)
+            records = list(zip([ticker] * len(keys), keys, dates, insiders, shares, values, sides))
+
+        with self._lock, self._conn:
+            if records:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO transactions (ticker, key, date, insider, shares, value, side) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    records
+                )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fetches (ticker, fetched_at, since) VALUES (?, ?, ?)", (ticker, time.time(), since)
+            )
+        return fresh
+
+    def aggregates(self, ticker, windows=INSIDER_WINDOWS, now=None):
+        # Raw counts and dollar values over the span Yahoo last returned (what
+        # the scorer has always counted), plus the same over trailing windows.
+        # Older stored filings only feed the windows that reach back to them.
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._conn.execute("SELECT since FROM fetches WHERE ticker = ?", (ticker,)).fetchone()
+        span = f"date >= {int(row[0])}" if row and row[0] is not None else "1"
+        cols = [f"SUM(side = 1 AND {span})", f"SUM(side = -1 AND {span})",
+                f"SUM(CASE WHEN side = 1 AND {span} THEN value ELSE 0 END)",
+                f"SUM(CASE WHEN side = -1 AND {span} THEN value ELSE 0 END)"]
+        for days in windows:
+            since = int(now - days * 86400)
+            cols += [f"SUM(side = 1 AND date >= {since})", f"SUM(side = -1 AND date >= {since})",
+                     f"SUM(CASE WHEN side = 1 AND date >= {since} THEN value ELSE 0 END)",
+                     f"SUM(CASE WHEN side = -1 AND date >= {since} THEN value ELSE 0 END)"]
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(cols)} FROM transactions WHERE ticker = ?", (ticker,)
+            ).fetchone()
+        row = [v or 0 for v in row]
+
+        out = {
+            "insider_buys": int(row[0]), "insider_sells": int(row[1]),
+            "insider_buy_value": float(row[2]), "insider_sell_value": float(row[3]),
+            "insider_net_value": float(row[2] - row[3]),
+            "insider_windows": {},
+        }
+        for i, days in enumerate(windows):
+            b, s, bv, sv = row[4 + 4 * i: 8 + 4 * i]
+            out["insider_windows"][days] = {
+                "buys": int(b), "sells": int(s),
+                "buy_value": float(bv), "sell_value": float(sv), "net_value": float(bv - sv),
+            }
+        return out
@@ -1,7 +1,9 @@
 import streamlit as st
-from data_loader import DataLoader, convert_name_to_ticker
-from scorers import ScoringEngine
-from utils import get_rating
+import client
+from ticker_index import get_index
+from result_cache import RESULT_TTL_SECONDS
+from panel import technical_history
+from chart import build_chart_payload, sparkline_svg
 
 st.set_page_config(page_title="Thesis Prototype", layout="wide", page_icon="📈")
 
@@ -44,54 +46,65 @@ st.markdown("""
 st.markdown('<div class="main-header">AI Stock Evaluation Model</div>', unsafe_allow_html=True)
 st.markdown('<div class="sub-header">Thesis Prototype: Integrated Signal Analysis</div>', unsafe_allow_html=True)
 
+@st.cache_resource
+def ticker_labels():
+    # "AAPL — Apple Inc." for every listed common stock; empty without a listings file
+    return get_index().labels()
+
 col1, col2, col3 = st.columns([1, 2, 1])
 with col2:
     with st.form(key='search_form'):
-        user_input = st.text_input("", placeholder="Enter Ticker or Company Name (e.g. Nvidia, AAPL)...")
+        labels = ticker_labels()
+        if labels:
+            # Type-ahead is filtered in the browser from the local index; free
+            # text that matches nothing is still accepted and resolved on submit.
+            choice = st.selectbox("", labels, index=None, accept_new_options=True,
+                                  placeholder="Enter Ticker or Company Name (e.g. Nvidia, AAPL)...")
+            user_input = choice.split(" — ")[0] if choice in labels else (choice or "")
+        else:
+            user_input = st.text_input("", placeholder="Enter Ticker or Company Name (e.g. Nvidia, AAPL)...")
         submit_button = st.form_submit_button(label='Analyze Stock 🚀')
 
+# A submitted search wins; otherwise a ?ticker= link (competitor chips,
+# shared URLs) opens straight onto that ticker's analysis.
+ticker = None
 if submit_button and user_input:
-    ticker = convert_name_to_ticker(user_input)
-    loader = DataLoader()
-    engine = ScoringEngine()
+    ticker = client.resolve(user_input)
+    st.query_params["ticker"] = ticker
+elif st.query_params.get("ticker"):
+    user_input = st.query_params["ticker"]
+    ticker     = client.resolve(user_input)
 
+if ticker:
     status = st.empty()
-    status.info(f"🔄 Finding data for {ticker}...")
+    status.info(f"🔄 Fetching Real-Time Analysis for {ticker}...")
 
-    df_tech = loader.get_technical_data(ticker)
+    result, age = client.analyze(ticker)
 
-    if df_tech is None or df_tech.empty:
+    if result is None:
         status.empty()
         st.error(f"❌ Could not find data for '{user_input}' (Resolved: {ticker}). Please check the name or ticker.")
     else:
-        status.info(f"🔄 Fetching Real-Time Analysis for {ticker}...")
-
-        score_tech, meta_tech   = engine.calculate_technical(df_tech)
-        data_social, social_src = loader.get_social_sentiment(ticker)
-        data_deriv              = loader.get_derivative_data(ticker)
-        data_fund               = loader.get_fundamental_data(ticker)
-
-        score_social, meta_social = engine.calculate_social(data_social)
-        score_deriv,  meta_deriv  = engine.calculate_derivative(data_deriv)
-        score_fund,   meta_fund   = engine.calculate_fundamental(data_fund)
-
-        # Weights: Fundamentals 40% | Sentiment 25% | Technical 20% | Derivatives 15%
-        base_composite = (
-            score_fund   * 0.40 +
-            score_social * 0.25 +
-            score_tech   * 0.20 +
-            score_deriv  * 0.15
-        )
+        df_tech = result['df_tech']
+        scores, metas = result['scores'], result['meta']
+        score_tech,   meta_tech   = scores['technical'],   metas['technical']
+        score_social, meta_social = scores['social'],      metas['social']
+        score_deriv,  meta_deriv  = scores['derivative'],  metas['derivative']
+        score_fund,   meta_fund   = scores['fundamental'], metas['fundamental']
 
         insider_buys    = meta_fund.get('insider_buys', 0)
         insider_sells   = meta_fund.get('insider_sells', 0)
         insider_booster = meta_fund.get('insider_booster', 0)
-        composite       = min(100, base_composite + insider_booster)
+        insider_net     = meta_fund.get('insider_net_value', 0)
+        insider_90d     = meta_fund.get('insider_windows', {}).get(90, {})
+        composite       = result['composite']
 
-        rating_text, rating_color = get_rating(composite)
+        rating_text, rating_color = result['rating']
         status.empty()
+        if age >= 60:
+            st.caption(f"⏱️ Cached analysis from {age / 60:.0f} min ago" + (" — refreshing in the background" if age >= RESULT_TTL_SECONDS else ""))
 
-        company_name = meta_fund.get('longName') or meta_fund.get('shortName') or ticker
+        company_name = meta_fund.get('name') or ticker
         sector       = meta_fund.get('sector', '')
         industry     = meta_fund.get('industry', '')
 
@@ -100,7 +113,7 @@ if submit_button and user_input:
             st.markdown(f"<p style='text-align:center;color:#666;font-size:0.82em;margin-top:-10px;'>{sector}{' · ' + industry if industry else ''}</p>", unsafe_allow_html=True)
 
         # ── Competitors strip ──
-        competitors = loader.get_competitors(ticker, company_name, sector, industry)
+        competitors = result['competitors']
         if competitors:
             chips_html = ''.join([
                 f'<a href="?ticker={c["ticker"]}" style="display:inline-block;background:#1a1d24;border:1px solid #2e3240;'
@@ -119,11 +132,20 @@ if submit_button and user_input:
         st.markdown("---")
 
         # ── Top metrics ──
+        # Past composites come from the score history store, not recomputed
+        try:
+            past = client.history(ticker)
+        except Exception:
+            past = None
+        spark = sparkline_svg(past['composite'], rating_color) if past is not None and not past.empty else ''
+        if spark:
+            spark = f'<div style="margin-top:6px;" title="Composite over the last {len(past)} runs">{spark}</div>'
+
         m1, m2, m3 = st.columns(3)
         with m1:
             st.markdown(f"""<div class="metric-card" style="border-top:4px solid {rating_color};">
                 <div class="metric-title">Composite Score</div>
-                <div class="metric-value" style="color:{rating_color};">{composite:.1f}/100</div>
+                <div class="metric-value" style="color:{rating_color};">{composite:.1f}/100</div>{spark}
             </div>""", unsafe_allow_html=True)
         with m2:
             st.markdown(f"""<div class="metric-card">
@@ -151,7 +173,10 @@ if submit_button and user_input:
             <div style="color:#ddd;font-size:0.95em;margin-top:8px;">
                 <b>Past 12-Month Transactions:</b>
                 <span style="color:#00CC96;font-weight:bold;">{insider_buys} Buys</span> |
-                <span style="color:#FF4B4B;font-weight:bold;">{insider_sells} Sells</span><br>
+                <span style="color:#FF4B4B;font-weight:bold;">{insider_sells} Sells</span> |
+                <b>Net:</b> <span style="color:{'#00CC96' if insider_net >= 0 else '#FF4B4B'};font-weight:bold;">${insider_net / 1e6:+,.1f}M</span><br>
+                <b>Last 90 Days:</b> {insider_90d.get('buys', 0)} Buys | {insider_90d.get('sells', 0)} Sells |
+                Net ${insider_90d.get('net_value', 0) / 1e6:+,.1f}M<br>
                 <span style="font-size:0.9em;color:#aaa;"><i>Insiders only buy when they expect the price to rise.</i></span>
             </div>
             <div style="margin-top:10px;font-size:0.9em;">
@@ -209,7 +234,7 @@ if submit_button and user_input:
 
                 fc1, fc2 = st.columns(2)
                 with fc1:
-                    pe_label = f"P/E Ratio (vs ~{pe_med}x sector)" if pe_med else "P/E Ratio"
+                    pe_label = f"P/E Ratio (vs ~{pe_med:.0f}x sector)" if pe_med else "P/E Ratio"
                     st.markdown(f"<div class='data-label'>{pe_label}</div><div class='data-val'>{fmt_fn(meta_fund.get('PE'))}</div>", unsafe_allow_html=True)
                     st.markdown(f"<div class='data-label'>Return on Equity</div><div class='data-val'>{fmt_fp(meta_fund.get('ROE'))}</div>", unsafe_allow_html=True)
                     st.markdown(f"<div class='data-label'>Revenue Growth</div><div class='data-val'>{fmt_fp(meta_fund.get('RevGrowth'))}</div>", unsafe_allow_html=True)
@@ -328,6 +353,19 @@ if submit_button and user_input:
                     iv_s = "High Volatility Expected" if iv and iv > 50 else ("Normal Volatility" if iv else "N/A")
                     st.markdown(f"<div class='data-label'>Market Expectation</div><div class='data-val'>{iv_s}</div>", unsafe_allow_html=True)
 
+                term = meta_deriv.get('term_structure', [])
+                if len(term) > 1:
+                    rows_html = "".join(
+                        f'<tr><td>{t["expiry"]}</td><td>{t["days"]}d</td><td>{t["pcr_oi"]:.2f}</td>'
+                        f'<td>{t["pcr_vol"]:.2f}</td><td>{fmt_pct(t["iv"] * 100 if t["iv"] is not None and t["iv"] == t["iv"] else None)}</td></tr>'
+                        for t in term
+                    )
+                    st.markdown(
+                        f'<div style="background:#12151a;border-radius:8px;padding:12px 16px;margin:8px 0;">'
+                        f'<div style="font-size:0.72em;color:#666;text-transform:uppercase;letter-spacing:0.06em;margin-bottom:6px;">Term Structure (OI-weighted above)</div>'
+                        f'<table style="width:100%;font-size:0.82em;color:#ddd;"><tr style="color:#888;"><td>Expiry</td><td>DTE</td><td>P/C OI</td><td>P/C Vol</td><td>IV</td></tr>{rows_html}</table></div>',
+                        unsafe_allow_html=True)
+
                 st.markdown(f"""<div class="ext-link">👉 <a href="https://finance.yahoo.com/quote/{ticker}/options" target="_blank">View Options Chain Data</a></div>""", unsafe_allow_html=True)
 
         # ── Chart ──
@@ -335,46 +373,11 @@ if submit_button and user_input:
             if not df_tech.empty:
                 st.subheader("Price Action & Indicators")
 
-                from ta.volatility import BollingerBands as BB
                 import streamlit.components.v1 as components
-                import json
-
-                bb_ind   = BB(df_tech['Close'])
-                df_tech['bb_high'] = bb_ind.bollinger_hband()
-                df_tech['bb_low']  = bb_ind.bollinger_lband()
-                df_tech['sma_50']  = df_tech['Close'].rolling(50).mean()
-                df_tech['sma_200'] = df_tech['Close'].rolling(min(200, len(df_tech))).mean()
-
-                # Build data arrays for Lightweight Charts
-                def to_ts(idx):
-                    return int(idx.timestamp())
-
-                candles = [
-                    {"time": to_ts(row.Index), "open": round(float(row.Open), 4),
-                     "high": round(float(row.High), 4), "low": round(float(row.Low), 4),
-                     "close": round(float(row.Close), 4)}
-                    for row in df_tech.itertuples() if not (
-                        hasattr(row, 'Open') and str(row.Open) == 'nan'
-                    )
-                ]
-
-                def line_data(col):
-                    return [
-                        {"time": to_ts(idx), "value": round(float(v), 4)}
-                        for idx, v in df_tech[col].items()
-                        if str(v) != 'nan'
-                    ]
-
-                sma50_data  = line_data('sma_50')
-                sma200_data = line_data('sma_200')
-                bb_hi_data  = line_data('bb_high')
-                bb_lo_data  = line_data('bb_low')
-
-                candles_json  = json.dumps(candles)
-                sma50_json    = json.dumps(sma50_data)
-                sma200_json   = json.dumps(sma200_data)
-                bb_hi_json    = json.dumps(bb_hi_data)
-                bb_lo_json    = json.dumps(bb_lo_data)
+
+                # Indicator columns come from the scorer's history pass; the
+                # payload is serialised column-wise and thinned for long histories
+                payload = build_chart_payload(df_tech, technical_history(df_tech))
 
                 chart_html = f"""
 <!DOCTYPE html>
@@ -402,6 +405,7 @@ if submit_button and user_input:
     <div class="leg"><div class="dot" style="background:#3783FF;"></div>SMA 50</div>
     <div class="leg"><div class="dot" style="background:#FF4B4B; border-top:2px dashed #FF4B4B; height:0;"></div>SMA 200</div>
     <div class="leg"><div class="dot" style="background:rgba(255,255,255,0.25);"></div>BB Band</div>
+    <div class="leg"><div class="dot" style="background:#FFD700;"></div>Tech Score</div>
   </div>
   <div id="chart"></div>
 </div>
@@ -413,7 +417,7 @@ if submit_button and user_input:
     layout: {{ background: {{ color: '#0e1117' }}, textColor: '#aaa' }},
     grid:   {{ vertLines: {{ color: 'rgba(255,255,255,0.04)' }}, horzLines: {{ color: 'rgba(255,255,255,0.04)' }} }},
     crosshair: {{ mode: LightweightCharts.CrosshairMode.Normal }},
-    rightPriceScale: {{ borderColor: 'rgba(255,255,255,0.1)' }},
+    rightPriceScale: {{ borderColor: 'rgba(255,255,255,0.1)', scaleMargins: {{ top: 0.08, bottom: 0.25 }} }},
     timeScale: {{ borderColor: 'rgba(255,255,255,0.1)', timeVisible: true, secondsVisible: false }},
     handleScroll:  {{ mouseWheel: true, pressedMouseMove: true, horzTouchDrag: true }},
     handleScale:   {{ mouseWheel: true, pinch: true, axisPressedMouseMove: true }},
@@ -425,23 +429,28 @@ if submit_button and user_input:
     borderUpColor: '#26a69a', borderDownColor: '#ef5350',
     wickUpColor: '#26a69a', wickDownColor: '#ef5350',
   }});
-  cSeries.setData({candles_json});
+  cSeries.setData({payload['candles']});
 
   // BB upper
   const bbHi = chart.addLineSeries({{ color: 'rgba(255,255,255,0.18)', lineWidth: 1, priceLineVisible: false, lastValueVisible: false }});
-  bbHi.setData({bb_hi_json});
+  bbHi.setData({payload['bb_high']});
 
   // BB lower (filled)
   const bbLo = chart.addLineSeries({{ color: 'rgba(255,255,255,0.18)', lineWidth: 1, priceLineVisible: false, lastValueVisible: false }});
-  bbLo.setData({bb_lo_json});
+  bbLo.setData({payload['bb_low']});
 
   // SMA 50
   const sma50 = chart.addLineSeries({{ color: '#3783FF', lineWidth: 1.5, priceLineVisible: false, lastValueVisible: false }});
-  sma50.setData({sma50_json});
+  sma50.setData({payload['sma50']});
 
   // SMA 200
   const sma200 = chart.addLineSeries({{ color: '#FF4B4B', lineWidth: 1.5, lineStyle: LightweightCharts.LineStyle.Dashed, priceLineVisible: false, lastValueVisible: false }});
-  sma200.setData({sma200_json});
+  sma200.setData({payload['sma200']});
+
+  // Technical score history (0-100) in its own band under the price
+  const techScore = chart.addLineSeries({{ color: '#FFD700', lineWidth: 1, priceScaleId: 'score', priceLineVisible: false }});
+  chart.priceScale('score').applyOptions({{ scaleMargins: {{ top: 0.8, bottom: 0 }} }});
+  techScore.setData({payload['score']});
 
   chart.timeScale().fitContent();
 
@@ -0,0 +1,142 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# --- SETTINGS ---
+EXPIRY_MIN_DAYS   = 7      # skip expiries this close: pinning/gamma noise dominates
+EXPIRY_MAX_DAYS   = 60
+MAX_EXPIRIES      = 4
+CHAIN_TTL_SECONDS = 300    # option quotes move intraday; keep chains for a few minutes only
+
+TERM_COLUMNS = ['expiry', 'days', 'call_volume', 'put_volume', 'call_oi', 'put_oi', 'pcr_vol', 'pcr_oi', 'iv']
+
+
+def select_expiries(dates, today=None, min_days=EXPIRY_MIN_DAYS, max_days=EXPIRY_MAX_DAYS, limit=MAX_EXPIRIES):
+    # Expiries inside [min_days, max_days], nearest first. When nothing is
+    # listed in the window, fall back to the nearest expiry (the old behaviour).
+    if not dates:
+        return []
+    today = pd.Timestamp(today or pd.Timestamp.now()).normalize()
+    days  = (pd.to_datetime(list(dates)) - today).days
+    inside = [d for d, n in zip(dates, days) if min_days <= n <= max_days]
+    return inside[:limit] or [dates[0]]
+
+
+def term_structure(chains, today=None):
+    # chains: {expiry: (calls, puts)} as returned by yfinance option_chain.
+    # One row per expiry, computed with a single groupby over every contract.
+    frames = []
+    for expiry, (calls, puts) in chains.items():
+        for side, df in (('call', calls), ('put', puts)):
+            if df is None or df.empty:
+                continue
+            frames.append(pd.DataFrame({
+                'expiry': expiry, 'side': side,
+                'volume': pd.to_numeric(df.get('volume'), errors='coerce'),
+                'oi':     pd.to_numeric(df.get('openInterest'), errors='coerce'),
+                'iv':     pd.to_numeric(df.get('impliedVolatility'), errors='coerce'),
+            }))
+    if not frames:
+        return pd.DataFrame(columns=TERM_COLUMNS)
+
+    g = pd.concat(frames, ignore_index=True).groupby(['expiry', 'side']).agg(
+        volume=('volume', 'sum'), oi=('oi', 'sum'), iv=('iv', 'mean')
+    ).unstack('side')
+    g = g.reindex(columns=pd.MultiIndex.from_product([['volume', 'oi', 'iv'], ['call', 'put']]))
+
+    out = pd.DataFrame({
+        'call_volume': g[('volume', 'call')].fillna(0), 'put_volume': g[('volume', 'put')].fillna(0),
+        'call_oi':     g[('oi', 'call')].fillna(0),     'put_oi':     g[('oi', 'put')].fillna(0),
+    })
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out['pcr_vol'] = np.where(out['call_volume'] > 0, out['put_volume'] / out['call_volume'], 0.0)
+        out['pcr_oi']  = np.where(out['call_oi'] > 0, out['put_oi'] / out['call_oi'], 0.0)
+    # Same IV definition as the single-chain version: mean of the call and put averages
+    out['iv'] = g['iv'].mean(axis=1, skipna=False)
+
+    today = pd.Timestamp(today or pd.Timestamp.now()).normalize()
+    out['days'] = (pd.to_datetime(out.index) - today).days
+    out = out.rename_axis('expiry').reset_index().sort_values('days', ignore_index=True)
+    return out[TERM_COLUMNS]
+
+
+def aggregate(ts):
+    # Whole-window put/call ratios from the summed volumes/OI; IV weighted by
+    # each expiry's total open interest (equal weights if there's none).
+    if ts is None or ts.empty:
+        return {"pcr_vol": 0, "pcr_oi": 0, "avg_iv": 0}
+    call_vol, put_vol = ts['call_volume'].sum(), ts['put_volume'].sum()
+    call_oi,  put_oi  = ts['call_oi'].sum(), ts['put_oi'].sum()
+    iv  = ts['iv'].to_numpy(dtype=float)
+    wts = (ts['call_oi'] + ts['put_oi']).to_numpy(dtype=float)
+    ok  = ~np.isnan(iv)
+    if not ok.any():
+        avg_iv = np.nan
+    elif wts[ok].sum() > 0:
+        avg_iv = float(np.average(iv[ok], weights=wts[ok]))
+    else:
+        avg_iv = float(iv[ok].mean())
+    return {
+        "pcr_vol": float(put_vol / call_vol) if call_vol > 0 else 0,
+        "pcr_oi":  float(put_oi / call_oi) if call_oi > 0 else 0,
+        "avg_iv":  avg_iv,
+    }
+
+
+# ─────────────────────────────────────────────────────────
+#  CHAIN CACHE  –  process-wide, short TTL
+#
+#  Shared by every DataLoader, so a screener run or a second browser
+#  session asking for the same ticker within the TTL reuses the chains.
+# ─────────────────────────────────────────────────────────
+class ChainCache:
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, ttl=CHAIN_TTL_SECONDS):
+        self.ttl     = ttl
+        self._chains = {}
+        self._lock   = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def get(self, ticker, expiry, fetch):
+        key = (ticker, expiry)
+        now = time.monotonic()
+        with self._lock:
+            hit = self._chains.get(key)
+            if hit and now - hit[0] < self.ttl:
+                return hit[1]
+        chain = fetch(expiry)
+        with self._lock:
+            self._chains[key] = (time.monotonic(), chain)
+            # Drop expired entries so the dict doesn't grow with the universe
+            for k in [k for k, (t, _) in self._chains.items() if now - t >= self.ttl]:
+                del self._chains[k]
+        return chain
+
+
+def fetch_term_structure(ticker, session, cache=None, expiries=None, today=None):
+    # session: anything with .options and .option_chain(expiry) (TickerSession).
+    # Selected chains are fetched concurrently.
+    cache = cache if cache is not None else ChainCache.shared()
+    dates = expiries if expiries is not None else select_expiries(session.options, today)
+    if not dates:
+        return pd.DataFrame(columns=TERM_COLUMNS)
+    def fetch(expiry):
+        try:
+            return cache.get(ticker, expiry, session.option_chain)
+        except Exception:
+            return None   # one bad expiry shouldn't sink the rest
+
+    with ThreadPoolExecutor(max_workers=len(dates)) as pool:
+        chains = list(pool.map(fetch, dates))
+    return term_structure({d: (c.calls, c.puts) for d, c in zip(dates, chains) if c is not None}, today)
@@ -0,0 +1,338 @@
+import numpy as np
+import pandas as pd
+
+import indicators as ind
+from rules import RULES, ladder_for
+from scorers import PIOTROSKI_ROWS, TECH_SIGNALS
+from statements import STATEMENT_KINDS
+from utils import PILLAR_WEIGHTS
+
+# ─────────────────────────────────────────────────────────
+#  PANEL SCORING  –  vectorised scorers for a whole universe
+#
+#  Same rules as ScoringEngine, evaluated over a wide price matrix
+#  (dates × tickers) in a handful of array operations instead of one
+#  set of indicator objects per ticker.
+# ─────────────────────────────────────────────────────────
+
+TECH_MIN_BARS = 50
+TECH_LABELS   = [lbl for lbl, _ in TECH_SIGNALS]
+TECH_WEIGHTS  = np.array([w for _, w in TECH_SIGNALS], dtype=float)
+TECH_META     = ['RSI', 'SMA50', 'SMA200', 'EMA20', 'MACD', 'MACD_Signal', 'BB_High', 'BB_Low', 'Price', 'Trend']
+
+
+def _technical_bits(a):
+    # a: indicator arrays of any (matching) shape. Same rules as
+    # ScoringEngine.calculate_technical, stacked as signals × ...
+    price, rsi = a['Price'], a['RSI']
+    up = price > a['SMA50']
+    return up, np.stack([
+        price > a['SMA200'],
+        up,
+        a['SMA50'] > a['SMA200'],
+        a['MACD'] > a['MACD_Signal'],
+        a['MACD'] > 0,
+        (up & (rsi >= 50) & (rsi <= 82)) | (~up & (rsi < 45)),
+        price > a['EMA20'],
+        (up & (price >= a['BB_High'] * 0.98)) | (~up & (price < a['BB_High'])),
+    ])
+
+
+def _last_bar_indicators(c):
+    # c: close array (dates × tickers). The EMAs need the full recursion; the
+    # rolling windows are only evaluated at the last bar.
+    n_valid = (~np.isnan(c)).sum(axis=0)
+    nan_row = np.full(c.shape[1], np.nan)
+    with np.errstate(invalid='ignore'):
+        macd_line = ind.ema_array(c, 12) - ind.ema_array(c, 26)
+        sma_50    = c[-50:].mean(axis=0) if len(c) >= 50 else nan_row
+        # SMA200 shrinks to the available history; at exactly 50 bars it is
+        # the SMA50 and must compare equal to it (Golden Cross = False).
+        sma_200   = np.where(n_valid == 50, sma_50, np.nanmean(c[-200:], axis=0))
+        bb_mid    = c[-20:].mean(axis=0) if len(c) >= 20 else nan_row
+        bb_std    = c[-20:].std(axis=0)  if len(c) >= 20 else nan_row
+        return {
+            'RSI':         ind.rsi_array(c)[-1],
+            'SMA50':       sma_50,
+            'SMA200':      sma_200,
+            'EMA20':       ind.ema_array(c, 20)[-1],
+            'MACD':        macd_line[-1],
+            'MACD_Signal': ind.ema_array(macd_line, 9)[-1],
+            'BB_High':     bb_mid + 2 * bb_std,
+            'BB_Low':      bb_mid - 2 * bb_std,
+            'Price':       c[-1],
+        }, n_valid
+
+
+def _scores(bits, valid):
+    score = np.tensordot(TECH_WEIGHTS, bits, axes=1) / TECH_WEIGHTS.sum() * 100
+    signed = np.where(bits, 1, -1)
+    return np.where(valid, score, 0.0), np.where(valid, signed, 0)
+
+
+def technical_panel(close):
+    # close: wide DataFrame of closing prices (dates × tickers), NaN before a
+    # ticker's first bar. Returns one row per ticker: score, the eight signal
+    # bits (1 bullish / -1 bearish, 0 when history is too short) and the last
+    # indicator values — the same numbers calculate_technical returns.
+    close = close.sort_index()
+    c     = close.to_numpy(dtype=float)
+    a, n_valid = _last_bar_indicators(c)
+    up, bits   = _technical_bits(a)
+    a['Trend'] = up
+    score, signed = _scores(bits, n_valid >= TECH_MIN_BARS)
+
+    out = pd.DataFrame(signed.T, index=close.columns, columns=TECH_LABELS)
+    out.insert(0, 'score', score)
+    for k in TECH_META:
+        out[k] = a[k]
+    return out
+
+
+def technical_history(df):
+    # Daily technical score, signal bits and indicator columns over a
+    # ticker's whole history in one pass. Row t equals
+    # calculate_technical(df.iloc[:t + 1]): every indicator is causal, and
+    # the SMA200 window grows with the history exactly as the per-call
+    # min(200, len(df)) does.
+    frame = ind.indicator_frame(df)
+    a     = {k: frame[k].to_numpy(dtype=float) for k in frame.columns}
+    up, bits = _technical_bits(a)
+    valid    = np.arange(1, len(frame) + 1) >= TECH_MIN_BARS
+    score, signed = _scores(bits, valid)
+
+    out = pd.DataFrame(signed.T, index=frame.index, columns=TECH_LABELS)
+    out.insert(0, 'score', np.where(valid, score, np.nan))
+    out[frame.columns] = frame
+    out['Trend'] = up
+    return out
+
+
+# ─────────────────────────────────────────────────────────
+#  FUNDAMENTAL / DERIVATIVE PANELS  –  the rules.py ladders over a
+#  DataFrame of tickers, one np.select per ladder. Components and pillars
+#  are accumulated in the table order, as ScoringEngine does, so each row
+#  equals the scalar score exactly.
+# ─────────────────────────────────────────────────────────
+def _column(frame, name, fill=np.nan):
+    if name not in frame:
+        return np.full(len(frame), fill, dtype=float)
+    col = frame[name].to_numpy(dtype=float, na_value=np.nan)
+    return col if np.isnan(fill) else np.where(np.isnan(col), fill, col)
+
+
+def _weighted(parts):
+    # parts: [(score array with NaN = absent, weight)] -> weighted mean over
+    # the present ones, NaN where none is
+    num = den = 0
+    for s, w in parts:
+        present = ~np.isnan(s)
+        num = num + np.where(present, s * w, 0)
+        den = den + np.where(present, w, 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(den > 0, num / den, np.nan)
+
+
+def fundamental_panel(info, rules=RULES, sector_stats=None):
+    # info: one row per ticker, columns as in the yfinance info dict (plus
+    # insider_buys / insider_sells). Returns the component scores, the
+    # unrounded pillar scores, is_distressed, insider_booster and 'score' —
+    # what calculate_fundamental returns ticker by ticker. sector_stats:
+    # live sector P/E medians, ahead of the static table.
+    rules  = rules['fundamental']
+    median = {**rules['sector_pe_median'], **(sector_stats.medians() if sector_stats is not None else {})}
+    sector = info['sector'] if 'sector' in info else pd.Series(np.nan, index=info.index)
+    pe_median = sector.map(median).astype(float).fillna(rules['default_pe_median']).to_numpy()
+
+    pe, fcf, mcap = _column(info, 'trailingPE'), _column(info, 'freeCashflow'), _column(info, 'marketCap')
+    roe, margins  = _column(info, 'returnOnEquity'), _column(info, 'profitMargins')
+    pb            = _column(info, 'priceToBook')
+    with np.errstate(invalid='ignore', divide='ignore'):
+        frame = info.assign(pe_ratio=pe / pe_median, fcf_yield=np.where(mcap > 0, fcf / mcap, np.nan))
+        distressed = (roe < 0) | (margins < 0)
+
+        pen = rules['pb_penalty']
+        penalised = (pb > pen['pb_above']) & (np.isnan(roe) | (roe < pen['roe_below']))
+
+    out = pd.DataFrame(index=info.index)
+    pillars = []
+    for pillar, spec in rules['pillars'].items():
+        parts = []
+        for name, weight in spec['components'].items():
+            s = rules['ladders'][name].evaluate(frame)
+            if name == 'valuation':
+                s = np.where(penalised, np.maximum(pen['floor'], s - pen['points']), s)
+            out[name] = s
+            parts.append((s, weight))
+        out[pillar] = _weighted(parts)
+        pillars.append((out[pillar].to_numpy(), spec['weight']))
+
+    score = _weighted(pillars)
+    score = np.where(distressed, np.minimum(score, rules['distressed_cap']), score)
+    hi, lo, k = rules['stretch']['high'], rules['stretch']['low'], rules['stretch']['factor']
+    score = np.where(score >= hi, hi + (score - hi) * k, np.where(score <= lo, lo - (lo - score) * k, score))
+
+    boost   = rules['insider_booster']
+    booster = np.minimum(_column(info, 'insider_buys', 0) * boost['per_buy'], boost['max'])
+    out['is_distressed']   = distressed
+    no_boost = np.isnan(score) | (distressed & (_column(info, 'insider_sells', 0) > boost['distressed_sells_above']))
+    out['insider_booster'] = np.where(no_boost, 0, booster)
+    out['score'] = np.where(np.isnan(score), 0, np.clip(score, 0, 100))
+    return out
+
+
+def derivative_panel(data, trend=True, rules=RULES):
+    # data: one row per ticker with short_float, short_ratio, pcr_oi, pcr_vol,
+    # avg_iv (and optionally 'valid'); trend: bool or one bool per row.
+    # Returns the component scores and 'score', as calculate_derivative.
+    rules = rules['derivative']
+    trend = np.broadcast_to(np.asarray(trend, dtype=bool), (len(data),))
+    frame = pd.DataFrame({
+        'short_float_pct': _column(data, 'short_float') * 100,
+        'short_ratio':     _column(data, 'short_ratio'),
+        'pcr_oi':          _column(data, 'pcr_oi'),
+        'pcr_vol':         _column(data, 'pcr_vol'),
+        'iv_pct':          _column(data, 'avg_iv') * 100,
+    }, index=data.index)
+
+    out, parts = pd.DataFrame(index=data.index), []
+    for name, weight in rules['weights'].items():
+        s = np.where(trend, ladder_for(rules['ladders'], name, True).evaluate(frame),
+                            ladder_for(rules['ladders'], name, False).evaluate(frame))
+        out[name] = s
+        parts.append((s, weight))
+
+    score = _weighted(parts)
+    valid = data['valid'].fillna(False).to_numpy(dtype=bool) if 'valid' in data else True
+    out['score'] = np.where(valid & ~np.isnan(score), score, 0.0)
+    return out
+
+
+# ─────────────────────────────────────────────────────────
+#  PIOTROSKI PANEL  –  the F-Score signals for many tickers at once
+#
+#  Each line item becomes a tickers × 3 array (current, prior, two years
+#  back) and every signal is one vectorised comparison. A signal counts
+#  for a ticker exactly when ScoringEngine._piotroski would record it.
+# ─────────────────────────────────────────────────────────
+PIOTROSKI_LABELS = [
+    'ROA Positive', 'CFO Positive', 'ΔROA Improving', 'Earnings Quality (CFO > NI)',
+    'Leverage Stable/Falling', 'Liquidity Improving', 'No Share Dilution',
+    'Gross Margin Stable/Rising', 'Asset Turnover Improving',
+]
+
+
+def _line_items(statements, tickers):
+    # -> (values {item: n × 3}, has {item: n}, ncols {statement: n})
+    n = len(tickers)
+    values = {k: np.full((n, 3), np.nan) for k in PIOTROSKI_ROWS}
+    has    = {k: np.zeros(n, dtype=bool) for k in PIOTROSKI_ROWS}
+    ncols  = {k: np.zeros(n, dtype=int) for k in STATEMENT_KINDS}
+    by_kind = {kind: [(item, labels) for item, (k, labels) in PIOTROSKI_ROWS.items() if k == kind]
+               for kind in STATEMENT_KINDS}
+    for i, t in enumerate(tickers):
+        frames = statements.get(t) or {}
+        for kind, items in by_kind.items():
+            frame = frames.get(kind)
+            if frame is None:
+                continue
+            ncols[kind][i] = frame.shape[1]
+            # One array per statement; the row of each item's first label present
+            try:
+                arr = frame.to_numpy(dtype=float)[:, :3]
+            except (TypeError, ValueError):
+                arr = frame.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)[:, :3]
+            pos = {label: p for p, label in enumerate(frame.index)}
+            for item, labels in items:
+                p = next((pos[l] for l in labels if l in pos), None)
+                if p is not None:
+                    values[item][i, :arr.shape[1]] = arr[p]
+                    has[item][i] = True
+    return values, has, ncols
+
+
+def piotroski_panel(statements, info=None):
+    # statements: {ticker: {'_financials'|'_balance_sheet'|'_cashflow': DataFrame}}
+    # (DataLoader.get_statements_batch). info: optional DataFrame indexed by
+    # ticker with returnOnAssets / operatingCashflow for the two level
+    # signals. Returns one row per ticker: each signal as 1/0 (NaN when it
+    # can't be computed), piotroski_raw, piotroski_max and piotroski (0–100).
+    tickers = list(statements)
+    v, has, ncols = _line_items(statements, tickers)
+    info  = info.reindex(tickers) if info is not None else pd.DataFrame(index=tickers)
+    multi = (ncols['_financials'] >= 2) & (ncols['_balance_sheet'] >= 2)
+    deep  = ncols['_balance_sheet'] > 2
+    ni, ta, rev, gp = v['ni'], v['ta'], v['rev'], v['gp']
+    ltd, ca, cl, sh, cfo = v['ltd'], v['ca'], v['cl'], v['sh'], v['cfo']
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        roa, ocf = _column(info, 'returnOnAssets'), _column(info, 'operatingCashflow')
+        ta_abs, rev_abs = np.abs(ta), np.abs(rev)
+        signals = {
+            'ROA Positive': (~np.isnan(roa), roa > 0),
+            'CFO Positive': (~np.isnan(ocf), ocf > 0),
+            'ΔROA Improving': (
+                multi & has['ni'] & has['ta'] & deep & (ta[:, 1] != 0) & (ta[:, 2] != 0),
+                ni[:, 0] / ta_abs[:, 1] > ni[:, 1] / ta_abs[:, 2]),
+            'Earnings Quality (CFO > NI)': (
+                multi & has['cfo'] & has['ta'] & has['ni'] & (ncols['_cashflow'] >= 1) & (ta_abs[:, 1] != 0),
+                cfo[:, 0] / ta_abs[:, 1] > ni[:, 0] / ta_abs[:, 1]),
+            'Leverage Stable/Falling': (
+                multi & has['ltd'] & has['ta'] & (ta[:, 0] != 0) & (ta[:, 1] != 0),
+                ltd[:, 0] / ta_abs[:, 0] <= ltd[:, 1] / ta_abs[:, 1]),
+            'Liquidity Improving': (
+                multi & has['ca'] & has['cl'] & (cl[:, 0] != 0) & (cl[:, 1] != 0),
+                ca[:, 0] / np.abs(cl[:, 0]) >= ca[:, 1] / np.abs(cl[:, 1])),
+            'No Share Dilution': (
+                multi & has['sh'],
+                sh[:, 0] <= sh[:, 1] * 1.02),
+            'Gross Margin Stable/Rising': (
+                multi & has['gp'] & has['rev'] & (rev[:, 0] != 0) & (rev[:, 1] != 0),
+                gp[:, 0] / rev_abs[:, 0] >= gp[:, 1] / rev_abs[:, 1]),
+            'Asset Turnover Improving': (
+                multi & has['rev'] & has['ta'] & deep & (ta[:, 1] != 0) & (ta[:, 2] != 0),
+                rev_abs[:, 0] / ta_abs[:, 1] >= rev_abs[:, 1] / ta_abs[:, 2]),
+        }
+
+    out = pd.DataFrame({lbl: np.where(ok, hit.astype(float), np.nan) for lbl, (ok, hit) in signals.items()},
+                       index=pd.Index(tickers, name='ticker'))
+    out['piotroski_raw'] = out[PIOTROSKI_LABELS].sum(axis=1).astype(int)
+    out['piotroski_max'] = out[PIOTROSKI_LABELS].notna().sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        out['piotroski'] = np.where(out['piotroski_max'] > 0, out['piotroski_raw'] / out['piotroski_max'] * 100, np.nan)
+    return out
+
+
+# ─────────────────────────────────────────────────────────
+#  CROSS-SECTIONAL RANKS  –  pillar scores as sector-neutral percentiles
+#
+#  An absolute 70 means different things in different markets; a rank
+#  says where a ticker stands against its sector today. One groupby-rank
+#  per batch, so ranks can be refreshed on every screen.
+# ─────────────────────────────────────────────────────────
+RANK_MIN_SECTOR = 10      # smaller sectors are ranked against the whole universe
+
+
+def rank_panel(scores, sector=None, weights=PILLAR_WEIGHTS, min_sector=RANK_MIN_SECTOR):
+    # scores: one row per ticker, one column per pillar (ScoringEngine's
+    # pillar scores, NaN where a pillar is missing). sector: Series on the
+    # same index; tickers without one, or in a sector of fewer than
+    # min_sector names, are ranked against the universe. Returns each
+    # pillar as a percentile (0–100, higher is better) within its sector,
+    # 'composite' — the weighted mean of the present pillar percentiles,
+    # renormalised as in utils.composite_score (no insider booster) — and
+    # 'rank' (1 = best composite).
+    pillars = [p for p in weights if p in scores]
+    values  = scores[pillars].astype(float)
+    ranks   = values.rank(pct=True).to_numpy() * 100
+    if sector is not None:
+        codes, _ = pd.factorize(sector.reindex(values.index))     # -1 where no sector
+        size  = np.bincount(codes + 1)[codes + 1]
+        small = (codes < 0) | (size < min_sector)
+        in_sector = values.groupby(codes).rank(pct=True).to_numpy() * 100
+        ranks = np.where(small[:, None], ranks, in_sector)
+
+    out = pd.DataFrame(ranks, index=values.index, columns=pillars)
+    out['composite'] = _weighted([(ranks[:, i], weights[p]) for i, p in enumerate(pillars)])
+    out['rank']      = out['composite'].rank(ascending=False, method='min')
+    return out
@@ -0,0 +1,79 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from records import PILLAR_META, AnalysisResult, Record
+
+# ─────────────────────────────────────────────────────────
+#  WIRE FORMAT  –  analysis results as plain JSON (HTTP service/client)
+#
+#  Kept free of the data layer so the client can decode without
+#  importing loaders, stores or yfinance.
+# ─────────────────────────────────────────────────────────
+def _jsonable(obj):
+    # NumPy scalars -> Python, NaN/inf -> None, tuples -> lists, records -> objects
+    if isinstance(obj, Record):
+        obj = obj.to_dict()
+    if isinstance(obj, dict):
+        return {str(k): _jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(v) for v in obj]
+    if isinstance(obj, np.generic):
+        obj = obj.item()
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    if isinstance(obj, (str, int, float, bool)) or obj is None:
+        return obj
+    return str(obj)
+
+
+def result_to_payload(result, age=0.0, bars=True):
+    # result: an AnalysisResult, or a plain dict summary of one
+    items   = result.to_dict() if isinstance(result, Record) else result
+    payload = {k: v for k, v in items.items() if k != 'df_tech'}
+    payload['age'] = age
+    if bars:
+        df  = result['df_tech']
+        idx = df.index if df.index.tz is not None else df.index.tz_localize('UTC')
+        payload['bars'] = {
+            'tz':      str(idx.tz),
+            'time':    idx.as_unit('s').asi8.tolist(),
+            'columns': {c: df[c].tolist() for c in df.columns},
+        }
+    return _jsonable(payload)
+
+
+def result_from_payload(payload):
+    # Inverse of result_to_payload (bars required): (result, age)
+    result = dict(payload)
+    age    = result.pop('age', 0.0)
+    bars   = result.pop('bars')
+    index  = pd.to_datetime(bars['time'], unit='s', utc=True).tz_convert(bars['tz']).rename('Date')
+    df     = pd.DataFrame({c: np.array(v, dtype=float) for c, v in bars['columns'].items()}, index=index)
+    df.attrs['ticker'] = result.get('ticker')
+    result['df_tech'] = df
+    result['rating']  = tuple(result['rating'])
+
+    # JSON object keys are strings; restore the integer day windows
+    fund = result.get('meta', {}).get('fundamental', {})
+    if 'insider_windows' in fund:
+        fund['insider_windows'] = {int(k): v for k, v in fund['insider_windows'].items()}
+    result['meta'] = {p: PILLAR_META[p].from_dict(m) for p, m in result.get('meta', {}).items()}
+    return AnalysisResult.from_dict(result), age
+
+
+def frame_to_payload(df):
+    # Score history / cross-section frame -> {"index": ..., "rows": [...]};
+    # timestamps travel as epoch seconds
+    out = df.reset_index()
+    out['ts'] = out['ts'].dt.as_unit('s').astype('int64')
+    return _jsonable({'index': df.index.name, 'rows': out.to_dict(orient='records')})
+
+
+def frame_from_payload(payload):
+    df = pd.DataFrame(payload['rows'])
+    if df.empty:
+        return df
+    df['ts'] = pd.to_datetime(df['ts'], unit='s', utc=True)
+    return df.set_index(payload['index'])
@@ -0,0 +1,214 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from data_loader import DataLoader
+from records import AnalysisResult
+from result_cache import DEGRADED_TTL_SECONDS, RESULT_STALE_SECONDS, RESULT_TTL_SECONDS, ResultCache
+from score_history import ScoreHistory
+from scorers import ScoringEngine
+from sector_stats import SectorStats
+from utils import composite_score, get_rating
+
+# ─────────────────────────────────────────────────────────
+#  FETCH ORCHESTRATOR  –  all pillar downloads run concurrently
+#
+#  Wall-clock latency becomes the slowest call instead of the sum.
+#  Competitors need the company profile returned by the fundamentals
+#  call, so that one is chained and its clock starts when the profile
+#  arrives. The annual statements (Piotroski badge) are fetched next to
+#  the fundamentals whenever those are included.
+# ─────────────────────────────────────────────────────────
+
+# Per-call budgets in seconds
+FETCH_TIMEOUTS = {
+    "technical":   15,
+    "social":      45,
+    "derivative":  20,
+    "fundamental": 20,
+    "statements":  20,
+    "competitors": 15,
+}
+
+# What the scorers receive when a call fails or overruns its budget
+# (mirrors what each DataLoader method returns on its own errors)
+FETCH_FALLBACKS = {
+    "technical":   lambda: None,
+    "social":      lambda: ({"error": "Sentiment request timed out. Try again in 1 minute."}, "Error"),
+    "derivative":  lambda: {"valid": False},
+    "fundamental": lambda: {},
+    "statements":  lambda: {},
+    "competitors": lambda: [],
+}
+
+# Threads can't be cancelled mid-request, so a timed-out call keeps running
+# in the background; one bounded shared pool stops stragglers piling up.
+_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="pillar-fetch")
+
+
+def _wait(future, deadline, kind):
+    try:
+        return future.result(timeout=max(0, deadline - time.monotonic()))
+    except Exception:
+        future.cancel()
+        return FETCH_FALLBACKS[kind]()
+
+
+def _included(include):
+    # The calls fetch_pillars makes for `include` (default: all of them)
+    include = set(include or FETCH_TIMEOUTS)
+    if "fundamental" in include:
+        include.add("statements")
+    return include
+
+
+def fetch_pillars(ticker, loader=None, timeouts=None, include=None, executor=None):
+    loader   = loader or DataLoader()
+    executor = executor or _executor
+    timeouts = {**FETCH_TIMEOUTS, **(timeouts or {})}
+    include  = _included(include)
+
+    jobs = {
+        "technical":   lambda: loader.get_technical_data(ticker),
+        "social":      lambda: loader.get_social_sentiment(ticker),
+        "derivative":  lambda: loader.get_derivative_data(ticker),
+        "fundamental": lambda: loader.get_fundamental_data(ticker),
+        "statements":  lambda: loader.get_statements(ticker),
+    }
+
+    start   = time.monotonic()
+    futures = {k: executor.submit(fn) for k, fn in jobs.items() if k in include}
+    results = {}
+
+    if "fundamental" in futures:
+        results["fundamental"] = _wait(futures["fundamental"], start + timeouts["fundamental"], "fundamental")
+
+    if "competitors" in include:
+        info = results.get("fundamental") or {}
+        if info:
+            company_name = info.get('longName') or info.get('shortName') or ticker
+            comp_future  = executor.submit(
+                loader.get_competitors, ticker, company_name,
+                info.get('sector', ''), info.get('industry', '')
+            )
+            comp_start = time.monotonic()
+        else:
+            comp_future = None
+
+    for kind, future in futures.items():
+        if kind not in results:
+            results[kind] = _wait(future, start + timeouts[kind], kind)
+
+    if "competitors" in include:
+        results["competitors"] = (
+            _wait(comp_future, comp_start + timeouts["competitors"], "competitors")
+            if comp_future is not None else FETCH_FALLBACKS["competitors"]()
+        )
+
+    for kind in include:
+        results.setdefault(kind, FETCH_FALLBACKS[kind]())
+    results["elapsed"] = time.monotonic() - start
+    return results
+
+
+# ─────────────────────────────────────────────────────────
+#  ANALYSIS  –  fetch + score + composite for one ticker
+#  Shared by the Streamlit page and the batch screener.
+# ─────────────────────────────────────────────────────────
+# The engine is stateless, so every analysis and thread shares one. It
+# reads sector P/E medians from the process-wide SectorStats, which every
+# analysis feeds.
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def default_engine():
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = ScoringEngine(sector_stats=SectorStats.default())
+        return _engine
+
+
+def score_pillars(fetched, engine=None, keep_info=False):
+    # keep_info: keep the raw Yahoo info dict on the fundamental meta
+    engine  = engine or default_engine()
+    df_tech = fetched.get('technical')
+    if df_tech is None or df_tech.empty:
+        return None
+
+    scores, meta = {}, {}
+    scores['technical'], meta['technical'] = engine.calculate_technical(df_tech)
+    if 'social' in fetched:
+        scores['social'], meta['social'] = engine.calculate_social(fetched['social'][0])
+    if 'derivative' in fetched:
+        # The derivative scorer reads short interest in light of the trend
+        trend = meta['technical'].get('Trend', True)
+        scores['derivative'], meta['derivative'] = engine.calculate_derivative(fetched['derivative'], trend)
+    if 'fundamental' in fetched:
+        info = fetched['fundamental']
+        if info and fetched.get('statements'):
+            info = {**info, **fetched['statements']}
+        scores['fundamental'], meta['fundamental'] = engine.calculate_fundamental(info, keep_info)
+
+    insider_booster = meta.get('fundamental', {}).get('insider_booster', 0)
+    composite       = composite_score(scores, insider_booster)
+    rating_text, rating_color = get_rating(composite)
+
+    return AnalysisResult(
+        df_tech=df_tech,
+        scores=scores,
+        meta=meta,
+        social_src=fetched['social'][1] if 'social' in fetched else None,
+        competitors=fetched.get('competitors', []),
+        composite=composite,
+        rating=(rating_text, rating_color),
+    )
+
+
+def analyze_ticker(ticker, loader=None, engine=None, timeouts=None, include=None, executor=None, keep_info=False,
+                   source="app"):
+    # source: who asked ("app", "service", ...), stored with the run in the score history
+    fetched = fetch_pillars(ticker, loader, timeouts=timeouts, include=include, executor=executor)
+    SectorStats.default().observe(ticker, fetched.get('fundamental'))
+    result  = score_pillars(fetched, engine, keep_info)
+    if result is not None:
+        result.ticker  = ticker
+        result.elapsed = fetched["elapsed"]
+        record_history(result, source)
+    return result
+
+
+def record_history(result, source, history=None):
+    # Best effort: a locked or full history database mustn't fail the analysis
+    try:
+        (history or ScoreHistory.default()).append(result, source)
+    except Exception:
+        pass
+
+
+def result_ttl(result):
+    # A result built from fallbacks (sentiment error, no options data) is
+    # kept only briefly so the next request retries the failed pillar
+    meta     = result.get('meta', {})
+    degraded = meta.get('social', {}).get('summary', '').startswith('⚠️') or not meta.get('derivative', True)
+    return DEGRADED_TTL_SECONDS if degraded else RESULT_TTL_SECONDS
+
+
+def analyze_ticker_cached(ticker, cache=None, ttl=result_ttl, stale=RESULT_STALE_SECONDS, **kwargs):
+    # analyze_ticker through the process-wide result cache: returns
+    # (result, age in seconds). A stale result comes back immediately while
+    # a background refresh replaces it. The options that change the result
+    # (include, keep_info, timeouts) are part of the cache key; a custom
+    # engine can't be keyed, so it isn't accepted here.
+    if "engine" in kwargs:
+        raise TypeError("analyze_ticker_cached() does not take an engine; call analyze_ticker")
+    cache = cache or ResultCache.shared()
+    key = (
+        "analysis", ticker,
+        frozenset(_included(kwargs.get("include"))),
+        bool(kwargs.get("keep_info")),
+        tuple(sorted({**FETCH_TIMEOUTS, **(kwargs.get("timeouts") or {})}.items())),
+    )
+    return cache.get(key, lambda: analyze_ticker(ticker, **kwargs), ttl=ttl, stale=stale)
+
@@ -0,0 +1,98 @@
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+from utils import cache_path
+
+BAR_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume', 'Dividends', 'Stock Splits']
+_SQL_COLUMNS = ['open', 'high', 'low', 'close', 'volume', 'dividends', 'splits']
+
+
+# ─────────────────────────────────────────────────────────
+#  PRICE STORE  –  persistent daily OHLCV, one row per (ticker, bar)
+#
+#  Bars are keyed by their epoch timestamp; the exchange timezone is kept
+#  per ticker so frames come back exactly as yfinance returned them.
+# ─────────────────────────────────────────────────────────
+class PriceStore:
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, path=None):
+        self.path  = path or cache_path("prices.sqlite")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS bars ("
+                " ticker TEXT NOT NULL, ts INTEGER NOT NULL,"
+                " open REAL, high REAL, low REAL, close REAL, volume REAL,"
+                " dividends REAL, splits REAL,"
+                " PRIMARY KEY (ticker, ts)) WITHOUT ROWID"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS series ("
+                " ticker TEXT PRIMARY KEY, tz TEXT, first_ts INTEGER, last_ts INTEGER, fetched_at REAL)"
+            )
+
+    @classmethod
+    def default(cls):
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def meta(self, ticker):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tz, first_ts, last_ts, fetched_at FROM series WHERE ticker = ?", (ticker,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"tz": row[0], "first_ts": row[1], "last_ts": row[2], "fetched_at": row[3]}
+
+    def load(self, ticker, since=None):
+        meta = self.meta(ticker)
+        if meta is None:
+            return None
+        query, args = f"SELECT ts, {', '.join(_SQL_COLUMNS)} FROM bars WHERE ticker = ?", [ticker]
+        if since is not None:
+            query += " AND ts >= ?"
+            args.append(int(since))
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY ts", args).fetchall()
+
+        df = pd.DataFrame(rows, columns=['ts'] + BAR_COLUMNS)
+        df.index = pd.to_datetime(df.pop('ts'), unit='s', utc=True).dt.tz_convert(meta['tz']).rename('Date')
+        df['Volume'] = df['Volume'].fillna(0).astype('int64')
+        return df
+
+    def write(self, ticker, df, replace=False):
+        if df is None or df.empty:
+            return
+        bars = df.reindex(columns=BAR_COLUMNS).fillna({'Dividends': 0, 'Stock Splits': 0})
+        idx  = bars.index if bars.index.tz is not None else bars.index.tz_localize('UTC')
+        ts   = idx.as_unit('s').asi8
+        rows = [(ticker, int(t), *vals) for t, vals in zip(ts, bars.itertuples(index=False, name=None))]
+
+        with self._lock, self._conn:
+            if replace:
+                self._conn.execute("DELETE FROM bars WHERE ticker = ?", (ticker,))
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO bars (ticker, ts, {', '.join(_SQL_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            first, last = self._conn.execute(
+                "SELECT MIN(ts), MAX(ts) FROM bars WHERE ticker = ?", (ticker,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO series (ticker, tz, first_ts, last_ts, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (ticker, str(idx.tz), first, last, time.time())
+            )
+
+    def touch(self, ticker):
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE series SET fetched_at = ? WHERE ticker = ?", (time.time(), ticker))
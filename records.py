@@ -0,0 +1,120 @@
+from dataclasses import dataclass, field, fields
+
+import pandas as pd
+
+# ─────────────────────────────────────────────────────────
+#  RESULT RECORDS  –  compact, typed pillar metadata and analysis results
+#
+#  Slotted dataclasses instead of dicts: each record holds only the
+#  fields the UI, the screener and the API read. Field names are the old
+#  dict keys, so the JSON wire format is unchanged, and records still
+#  answer rec.get(key, default) / rec[key] the way the dicts did. A field
+#  left at None counts as absent for get(). A record with every field
+#  at its default is falsy, like the empty dict a scorer used to return
+#  for "no data".
+# ─────────────────────────────────────────────────────────
+class Record:
+    __slots__ = ()
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return key in self.__dataclass_fields__
+
+    def __bool__(self):
+        return self != type(self)()
+
+    def to_dict(self):
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(**{k: v for k, v in d.items() if k in cls.__dataclass_fields__})
+
+
+@dataclass(slots=True, eq=True)
+class TechnicalMeta(Record):
+    RSI:         float = None
+    SMA50:       float = None
+    SMA200:      float = None
+    EMA20:       float = None
+    MACD:        float = None
+    MACD_Signal: float = None
+    BB_High:     float = None
+    BB_Low:      float = None
+    Price:       float = None
+    Trend:       bool  = None
+    signal_details: list = field(default_factory=list)    # [(label, 1 | -1)]
+
+
+@dataclass(slots=True, eq=True)
+class SocialMeta(Record):
+    summary: str  = ""
+    details: list = field(default_factory=list)
+    counts:  dict = field(default_factory=lambda: {"bull": 0, "bear": 0, "neut": 0})
+
+
+@dataclass(slots=True, eq=True)
+class DerivativeMeta(Record):
+    pcr_vol:     float = None
+    pcr_oi:      float = None
+    short_float: float = None     # percent
+    short_ratio: float = None
+    avg_iv:      float = None     # percent
+    term_structure: list = field(default_factory=list)
+
+
+@dataclass(slots=True, eq=True)
+class FundamentalMeta(Record):
+    name:     str = None          # longName, else shortName
+    sector:   str = None
+    industry: str = None
+    PE:        float = None
+    PB:        float = None
+    ROE:       float = None
+    DebtEq:    float = None
+    RevGrowth: float = None
+    Margins:   float = None
+    insider_buys:       int   = 0
+    insider_sells:      int   = 0
+    insider_buy_value:  float = 0
+    insider_sell_value: float = 0
+    insider_net_value:  float = 0
+    insider_windows:    dict  = field(default_factory=dict)   # {days: {buys, sells, *_value}}
+    insider_booster:    float = 0
+    is_distressed:      bool  = False
+    sector_pe_median:   float = None
+    piotroski_signals:  dict  = field(default_factory=dict)
+    piotroski_raw:      int   = 0
+    piotroski_max:      int   = 0
+    pillar_scores:      dict  = field(default_factory=dict)
+    info:               dict  = None   # the raw Yahoo info dict, only when asked for (keep_info)
+
+
+PILLAR_META = {
+    'technical':   TechnicalMeta,
+    'social':      SocialMeta,
+    'derivative':  DerivativeMeta,
+    'fundamental': FundamentalMeta,
+}
+
+
+@dataclass(slots=True, eq=False)
+class AnalysisResult(Record):
+    ticker:      str   = None
+    composite:   float = 0
+    rating:      tuple = None             # (text, colour)
+    scores:      dict  = field(default_factory=dict)     # pillar -> score
+    meta:        dict  = field(default_factory=dict)     # pillar -> *Meta record
+    df_tech:     pd.DataFrame = None
+    social_src:  str   = None
+    competitors: list  = field(default_factory=list)
+    elapsed:     float = None             # seconds spent fetching
@@ -0,0 +1,152 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from records import Record
+from singleflight import SingleFlight
+
+# --- SETTINGS ---
+RESULT_TTL_SECONDS   = 300             # fresh: served as-is
+RESULT_STALE_SECONDS = 3600            # stale but servable: returned at once, refreshed in the background
+DEGRADED_TTL_SECONDS = 30              # results missing a pillar (timeout, rate limit) retry sooner
+RESULT_CACHE_BYTES   = int(os.getenv("RESULT_CACHE_MB", "256")) * 2**20
+
+
+def estimate_size(obj, _seen=None):
+    # Rough deep size in bytes; DataFrames report their own buffers
+    _seen = _seen if _seen is not None else set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(v, _seen) for v in obj)
+    elif isinstance(obj, Record):
+        size += sum(estimate_size(getattr(obj, f), _seen) for f in obj.__dataclass_fields__)
+    return size
+
+
+class _Entry:
+    __slots__ = ("value", "created", "ttl", "stale", "size")
+
+    def __init__(self, value, ttl, stale):
+        self.value   = value
+        self.created = time.time()
+        self.ttl     = ttl(value) if callable(ttl) else ttl
+        self.stale   = stale
+        self.size    = estimate_size(value)
+
+
+# ─────────────────────────────────────────────────────────
+#  RESULT CACHE  –  process-wide, stale-while-revalidate
+#
+#  Lives at module level, so every Streamlit session in the server
+#  process shares it. An entry younger than its TTL is returned as-is;
+#  older but within its stale window it is still returned immediately
+#  while one background refresh recomputes it; past that it is
+#  recomputed on the caller's thread. Least-recently-used entries are
+#  evicted once the estimated total size passes the byte budget.
+#  Cached values are shared between sessions: callers must not mutate them.
+# ─────────────────────────────────────────────────────────
+class ResultCache:
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_bytes=RESULT_CACHE_BYTES, workers=4):
+        self.max_bytes   = max_bytes
+        self.bytes       = 0
+        self.hits = self.stale_hits = self.misses = self.refreshes = self.evictions = 0
+        self._entries    = OrderedDict()
+        self._refreshing = set()
+        self._lock       = threading.Lock()
+        self._pool       = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="result-refresh")
+        self._flight     = SingleFlight()
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def get(self, key, compute, ttl=RESULT_TTL_SECONDS, stale=RESULT_STALE_SECONDS):
+        # Returns (value, age in seconds; 0 when just computed). A None
+        # result is passed through but never cached. ttl may be a function
+        # of the computed value.
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = now - entry.created
+                if age < entry.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.value, age
+                if age < entry.ttl + entry.stale:
+                    self._entries.move_to_end(key)
+                    self.stale_hits += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        self._pool.submit(self._refresh, key, compute, ttl, stale)
+                    return entry.value, age
+            self.misses += 1
+
+        # Simultaneous misses for one key (a burst on a cold ticker) compute once
+        value = self._flight.do(key, lambda: self._compute_and_put(key, compute, ttl, stale))
+        return value, 0.0
+
+    def _compute_and_put(self, key, compute, ttl, stale):
+        value = compute()
+        self.put(key, value, ttl, stale)
+        return value
+
+    def _refresh(self, key, compute, ttl, stale):
+        try:
+            if self._flight.do(key, lambda: self._compute_and_put(key, compute, ttl, stale)) is not None:
+                with self._lock:
+                    self.refreshes += 1
+        except Exception:
+            pass   # keep serving the stale entry until it ages out
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def put(self, key, value, ttl=RESULT_TTL_SECONDS, stale=RESULT_STALE_SECONDS):
+        if value is None:
+            return
+        entry = _Entry(value, ttl, stale)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old.size
+            self._entries[key] = entry
+            self.bytes += entry.size
+            # Always keep the newest entry, even if it alone is over budget
+            while self.bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted.size
+                self.evictions += 1
+
+    def invalidate(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.bytes -= entry.size
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries), "bytes": self.bytes, "hits": self.hits,
+                "stale_hits": self.stale_hits, "misses": self.misses,
+                "refreshes": self.refreshes, "evictions": self.evictions,
+            }
@@ -0,0 +1,254 @@
+import copy
+import json
+import operator
+import os
+
+import numpy as np
+
+# ─────────────────────────────────────────────────────────
+#  SCORING RULES  –  the fundamental and derivative ladders as data
+#
+#  A Ladder maps one metric to a score: its rules are tried in order and
+#  the first whose conditions all hold wins, otherwise `default`. A rule
+#  is (conditions, score) with conditions as (field, op, threshold)
+#  triples, so compound rules ("days to cover > 8 and short float > 10%")
+#  fit the same table. The ladder's own field must be present (not
+#  None/NaN) or the component is skipped; any other field that is missing
+#  just fails its condition.
+#
+#  ScoringEngine evaluates a table one ticker at a time (Ladder.score);
+#  panel.py evaluates the same table over a DataFrame of tickers
+#  (Ladder.evaluate, one np.select per ladder). Both give the same scores.
+#
+#  Thresholds can be tuned without code changes: point SCORING_RULES at a
+#  JSON file and its entries are merged over RULES, e.g.
+#
+#    {"fundamental": {"ladders": {"health": {"op": "<",
+#        "steps": [[50, 95], [100, 80], [200, 62], [300, 40]], "default": 20}},
+#      "distressed_cap": 30},
+#     "derivative": {"weights": {"oi": 0.25}}}
+#
+#  A ladder given in JSON replaces the built-in one (its field is kept
+#  unless "field" is set); trend-dependent ladders take "true"/"false" keys.
+# ─────────────────────────────────────────────────────────
+
+_OPS = {'>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le}
+
+
+def missing(value):
+    # NaN counts as absent, like None (a DataFrame can't tell them apart,
+    # so this is also what panel.py sees). The if/elif ladders these tables
+    # replaced only skipped None: a NaN fell through to the default rung,
+    # so options.aggregate's avg_iv = NaN (no contract with an IV) scored
+    # as the lowest-IV bucket. Now that component is left out.
+    return value is None or (isinstance(value, float) and value != value)
+
+
+class Ladder:
+    __slots__ = ('field', 'rules', 'default')
+
+    def __init__(self, field, rules, default):
+        self.field   = field
+        self.rules   = [(tuple(tuple(c) for c in conds), score) for conds, score in rules]
+        self.default = default
+        for conds, _ in self.rules:
+            for _, op, _ in conds:
+                if op not in _OPS:
+                    raise ValueError(f"Unknown operator {op!r} in ladder for {field}")
+
+    @classmethod
+    def steps(cls, field, op, steps, default):
+        # The common case: one field, one operator, (threshold, score) pairs
+        return cls(field, [(((field, op, t),), s) for t, s in steps], default)
+
+    @classmethod
+    def from_spec(cls, spec, field=None):
+        field = spec.get('field', field)
+        if 'steps' in spec:
+            return cls.steps(field, spec['op'], spec['steps'], spec['default'])
+        return cls(field, spec['rules'], spec['default'])
+
+    def score(self, row):
+        # row: any mapping (an info dict). None when the field is missing.
+        if missing(row.get(self.field)):
+            return None
+        for conditions, score in self.rules:
+            if all(not missing(row.get(f)) and _OPS[op](row.get(f), t) for f, op, t in conditions):
+                return score
+        return self.default
+
+    def evaluate(self, frame):
+        # frame: DataFrame, one row per ticker. Float array, NaN where the
+        # ladder's field is missing.
+        def column(f):
+            if f not in frame:
+                return np.full(len(frame), np.nan)
+            return frame[f].to_numpy(dtype=float, na_value=np.nan)
+
+        conds = []
+        with np.errstate(invalid='ignore'):
+            for conditions, _ in self.rules:
+                c = np.ones(len(frame), dtype=bool)
+                for f, op, t in conditions:
+                    c &= _OPS[op](column(f), t)   # NaN compares False
+                conds.append(c)
+        out = np.select(conds, [float(s) for _, s in self.rules], float(self.default))
+        return np.where(np.isnan(column(self.field)), np.nan, out)
+
+
+# ─────────────────────────────────────────────────────────
+#  FUNDAMENTALS
+#  Fields are yfinance info keys plus two derived ratios:
+#  pe_ratio  = trailingPE / sector median P/E
+#  fcf_yield = freeCashflow / marketCap (only when marketCap > 0)
+# ─────────────────────────────────────────────────────────
+FUNDAMENTAL_LADDERS = {
+    'roe':        Ladder.steps('returnOnEquity', '>',  [(0.40, 100), (0.20, 85), (0.10, 65), (0, 45)], 5),
+    'margins':    Ladder.steps('profitMargins',  '>',  [(0.30, 100), (0.20, 85), (0.10, 70), (0, 45)], 5),
+    'roa':        Ladder.steps('returnOnAssets', '>',  [(0.15, 100), (0.08, 80), (0.03, 60), (0, 40)], 5),
+    'rev_growth': Ladder.steps('revenueGrowth',  '>=', [(0.40, 100), (0.20, 88), (0.10, 72), (0.05, 55), (0, 40)], 8),
+    'eps_growth': Ladder.steps('earningsGrowth', '>=', [(0.40, 100), (0.20, 85), (0.05, 65), (0, 45)], 10),
+    'valuation':  Ladder.steps('pe_ratio',       '<',  [(0.5, 100), (0.8, 88), (1.1, 74), (1.5, 52), (2.0, 32)], 15),
+    'health':     Ladder.steps('debtToEquity',   '<',  [(30, 95), (80, 80), (150, 62), (250, 40)], 20),
+    'fcf':        Ladder.steps('fcf_yield',      '>',  [(0.06, 100), (0.03, 82), (0.01, 62), (0, 42)], 10),
+}
+
+FUNDAMENTAL = {
+    'ladders': FUNDAMENTAL_LADDERS,
+    # Pillar weight and the ladders it averages (with their weights).
+    # Order matters: it is the accumulation order of both scoring paths.
+    'pillars': {
+        'Profitability': {'weight': 0.35, 'components': {'roe': 0.45, 'margins': 0.35, 'roa': 0.20}},
+        'Growth':        {'weight': 0.30, 'components': {'rev_growth': 0.65, 'eps_growth': 0.35}},
+        'Valuation':     {'weight': 0.15, 'components': {'valuation': 1.0}},
+        'Health':        {'weight': 0.10, 'components': {'health': 1.0}},
+        'FCF Quality':   {'weight': 0.10, 'components': {'fcf': 1.0}},
+    },
+    # High P/B costs valuation points unless ROE justifies it
+    'pb_penalty': {'pb_above': 10, 'roe_below': 0.20, 'points': 20, 'floor': 5},
+    'distressed_cap': 35,
+    # Scores above `high` are pushed up, below `low` pushed down, by `factor`
+    'stretch': {'high': 70, 'low': 35, 'factor': 1.3},
+    'sector_pe_median': {
+        'Technology': 32, 'Communication Services': 22,
+        'Consumer Cyclical': 25, 'Consumer Defensive': 22,
+        'Healthcare': 28, 'Biotechnology': 35,
+        'Financial Services': 14, 'Financials': 14,
+        'Industrials': 20, 'Basic Materials': 16,
+        'Energy': 13, 'Utilities': 18, 'Real Estate': 38,
+        'Semiconductor': 30, 'Software': 35, 'Retail': 20, 'Automotive': 14,
+    },
+    'default_pe_median': 20,
+    'insider_booster': {'per_buy': 1.5, 'max': 10, 'distressed_sells_above': 20},
+}
+
+
+# ─────────────────────────────────────────────────────────
+#  DERIVATIVES
+#  Short interest and IV read differently in up- and downtrends, so those
+#  ladders are keyed by the technical trend (True = price above SMA50).
+#  Fields: short_float_pct, short_ratio, pcr_oi, pcr_vol, iv_pct.
+# ─────────────────────────────────────────────────────────
+DERIVATIVE = {
+    'ladders': {
+        'float': {
+            True:  Ladder('short_float_pct', [((('short_float_pct', '<', 3),), 85),
+                                              ((('short_float_pct', '>', 15),), 30)], 55),
+            False: Ladder.steps('short_float_pct', '>', [(10, 15)], 50),
+        },
+        'ratio': {
+            True:  Ladder('short_ratio', [((('short_ratio', '>', 8), ('short_float_pct', '>', 10)), 95),
+                                          ((('short_ratio', '<', 3),), 70)], 35),
+            False: Ladder.steps('short_ratio', '>', [(5, 20)], 50),
+        },
+        'oi':  Ladder('pcr_oi', [((('pcr_oi', '<', 0.6),), 95), ((('pcr_oi', '<', 0.9),), 75),
+                                 ((('pcr_oi', '>', 1.2),), 25)], 50),
+        'vol': Ladder('pcr_vol', [((('pcr_vol', '<', 0.7),), 85), ((('pcr_vol', '>', 1.1),), 35)], 50),
+        'iv': {
+            True:  Ladder.steps('iv_pct', '>', [(80, 25), (60, 42), (40, 60), (20, 78)], 90),
+            False: Ladder.steps('iv_pct', '>', [(70, 15), (50, 30), (35, 50), (20, 70)], 85),
+        },
+    },
+    'weights': {'float': 0.20, 'ratio': 0.20, 'oi': 0.30, 'vol': 0.15, 'iv': 0.15},
+}
+
+
+def ladder_for(ladders, name, trend):
+    # A component's ladder, picking the trend variant where there is one
+    entry = ladders[name]
+    return entry[bool(trend)] if isinstance(entry, dict) else entry
+
+
+# ─────────────────────────────────────────────────────────
+#  SCALAR HELPERS  –  one ticker (ScoringEngine); panel.py has the
+#  column versions
+# ─────────────────────────────────────────────────────────
+def fundamental_fields(info, pe_median):
+    # The info dict plus the derived ratios the fundamental ladders read
+    pe, fcf, mcap = info.get('trailingPE'), info.get('freeCashflow'), info.get('marketCap')
+    return {
+        **info,
+        'pe_ratio':  None if missing(pe) else pe / pe_median,
+        'fcf_yield': fcf / mcap if not missing(fcf) and not missing(mcap) and mcap > 0 else None,
+    }
+
+
+def derivative_fields(data):
+    short_float, avg_iv = data.get('short_float'), data.get('avg_iv')
+    return {
+        'short_float_pct': None if missing(short_float) else short_float * 100,
+        'short_ratio':     data.get('short_ratio'),
+        'pcr_oi':          data.get('pcr_oi'),
+        'pcr_vol':         data.get('pcr_vol'),
+        'iv_pct':          None if missing(avg_iv) else avg_iv * 100,
+    }
+
+
+def pb_penalty(score, pb, roe, penalty):
+    if not missing(pb) and pb > penalty['pb_above'] and (missing(roe) or roe < penalty['roe_below']):
+        return max(penalty['floor'], score - penalty['points'])
+    return score
+
+
+def stretch(score, distressed, rules):
+    # Distressed cap, then push scores away from the middle, clipped to 0–100
+    if distressed:
+        score = min(score, rules['distressed_cap'])
+    hi, lo, k = rules['stretch']['high'], rules['stretch']['low'], rules['stretch']['factor']
+    if score >= hi:
+        score = hi + (score - hi) * k
+    elif score <= lo:
+        score = lo - (lo - score) * k
+    return max(0, min(100, score))
+
+
+def _merge(base, override):
+    # Deep-merge a JSON override over a rules dict; ladder specs become Ladders
+    out = dict(base)
+    for key, value in override.items():
+        current = out.get(key)
+        if isinstance(current, Ladder):
+            out[key] = Ladder.from_spec(value, current.field)
+        elif isinstance(current, dict) and any(isinstance(k, bool) for k in current):
+            trend = {k.lower() == 'true' if isinstance(k, str) else bool(k): v for k, v in value.items()}
+            out[key] = {t: Ladder.from_spec(trend[t], l.field) if t in trend else l for t, l in current.items()}
+        elif isinstance(current, dict) and isinstance(value, dict):
+            out[key] = _merge(current, value)
+        elif current is None and isinstance(value, dict) and ('steps' in value or 'rules' in value):
+            out[key] = Ladder.from_spec(value, key)
+        else:
+            out[key] = value
+    return out
+
+
+def load_rules(path=None):
+    # Built-in tables, with the JSON file at `path` (or $SCORING_RULES) merged over them
+    rules = {'fundamental': copy.deepcopy(FUNDAMENTAL), 'derivative': copy.deepcopy(DERIVATIVE)}
+    path = path or os.getenv('SCORING_RULES')
+    if path:
+        with open(path, encoding='utf-8') as f:
+            rules = _merge(rules, json.load(f))
+    return rules
+
+
+RULES = load_rules()
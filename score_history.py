@@ -0,0 +1,98 @@
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+from utils import PILLAR_WEIGHTS, cache_path
+
+# --- SETTINGS ---
+HISTORY_PILLARS = list(PILLAR_WEIGHTS)      # one REAL column per pillar
+_COLUMNS = ['ts', 'composite'] + HISTORY_PILLARS + ['rating', 'source']
+
+
+def _date(ts):
+    return time.strftime('%Y-%m-%d', time.gmtime(ts))
+
+
+# ─────────────────────────────────────────────────────────
+#  SCORE HISTORY  –  every scoring run, one row per (ticker, run)
+#
+#  Appended by pipeline.analyze_ticker (the app and the HTTP service)
+#  and by the screener; never recomputed. Composite and pillar scores are
+#  plain columns, indexed by (ticker, date) for a ticker's history and by
+#  date for a day's cross-section. Dates are UTC calendar days.
+# ─────────────────────────────────────────────────────────
+class ScoreHistory:
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, path=None):
+        self.path  = path or cache_path("scores.sqlite")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                " ticker TEXT NOT NULL, date TEXT NOT NULL, ts REAL NOT NULL, composite REAL,"
+                + "".join(f" {p} REAL," for p in HISTORY_PILLARS) +
+                " rating TEXT, source TEXT)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS scores_ticker_date ON scores (ticker, date)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS scores_date ON scores (date)")
+
+    @classmethod
+    def default(cls):
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def append(self, result, source=None, ts=None):
+        # result: an AnalysisResult (ticker, composite, scores, rating)
+        self.append_many([result], source, ts)
+
+    def append_many(self, results, source=None, ts=None):
+        ts   = time.time() if ts is None else ts
+        rows = [
+            (r.ticker, _date(ts), ts, r.composite,
+             *[r.scores.get(p) for p in HISTORY_PILLARS],
+             r.rating[0] if r.rating else None, source)
+            for r in results
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO scores (ticker, date, {', '.join(_COLUMNS)}) VALUES ({', '.join('?' * (len(_COLUMNS) + 2))})",
+                rows
+            )
+
+    def history(self, ticker, start=None, end=None):
+        # One row per run, oldest first, indexed by UTC timestamp.
+        # start/end: 'YYYY-MM-DD' dates, inclusive.
+        query, args = f"SELECT {', '.join(_COLUMNS)} FROM scores WHERE ticker = ?", [ticker]
+        if start is not None:
+            query += " AND date >= ?"
+            args.append(str(start))
+        if end is not None:
+            query += " AND date <= ?"
+            args.append(str(end))
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY date, ts", args).fetchall()
+        return self._frame(rows, 'ts')
+
+    def cross_section(self, date):
+        # Each ticker's last run on `date` ('YYYY-MM-DD'), by descending composite
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT ticker, {', '.join(_COLUMNS)} FROM scores s WHERE date = ? AND ts = "
+                "(SELECT MAX(ts) FROM scores WHERE ticker = s.ticker AND date = s.date) "
+                "ORDER BY composite DESC", (str(date),)
+            ).fetchall()
+        return self._frame(rows, 'ticker', ['ticker'])
+
+    @staticmethod
+    def _frame(rows, index, extra=()):
+        df = pd.DataFrame(rows, columns=list(extra) + _COLUMNS)
+        df['ts'] = pd.to_datetime(df['ts'], unit='s', utc=True)
+        return df.set_index(index)
@@ -1,11 +1,53 @@
-from ta.momentum import RSIIndicator
-from ta.trend import SMAIndicator, MACD, EMAIndicator
-from ta.volatility import BollingerBands
-
-
+from indicators import indicator_frame
+from records import DerivativeMeta, FundamentalMeta, SocialMeta, TechnicalMeta
+from rules import (RULES, derivative_fields, fundamental_fields, ladder_for,
+                   pb_penalty, stretch)
+from statements import statements_of
+
+# Technical signals: (label, weight). Order is the display order in the UI.
+TECH_SIGNALS = [
+    ('Price Above SMA 200', 25),
+    ('Price Above SMA 50',  20),
+    ('Golden Cross Active', 15),
+    ('MACD Bullish Cross',  15),
+    ('MACD Above Zero',     10),
+    ('RSI Momentum',         8),
+    ('Price Above EMA 20',   5),
+    ('BB Band Position',     2),
+]
+
+# Piotroski line items: name -> (statement, row labels to try in order).
+# Statements are yfinance annual frames, newest period first.
+PIOTROSKI_ROWS = {
+    'ni':  ('_financials',    ['Net Income', 'Net Income Common Stockholders']),
+    'ta':  ('_balance_sheet', ['Total Assets']),
+    'rev': ('_financials',    ['Total Revenue']),
+    'gp':  ('_financials',    ['Gross Profit']),
+    'ltd': ('_balance_sheet', ['Long Term Debt', 'Long Term Debt And Capital Lease Obligation']),
+    'ca':  ('_balance_sheet', ['Current Assets', 'Total Current Assets']),
+    'cl':  ('_balance_sheet', ['Current Liabilities', 'Total Current Liabilities']),
+    'sh':  ('_balance_sheet', ['Ordinary Shares Number', 'Share Issued']),
+    'cfo': ('_cashflow',      ['Operating Cash Flow', 'Total Cash From Operating Activities']),
+}
+
+
+# Stateless: every input a scorer needs is passed in, so one engine can
+# score many tickers (and pillars) concurrently from any thread. `rules`
+# (see rules.py) holds the fundamental and derivative ladders; it is
+# read-only configuration. `sector_stats` (sector_stats.SectorStats), if
+# given, supplies live sector P/E medians; the engine only reads it.
 class ScoringEngine:
-    def __init__(self):
-        self.current_tech_trend = True
+    def __init__(self, rules=None, sector_stats=None):
+        self.rules = rules or RULES
+        self.sector_stats = sector_stats
+
+    def sector_pe_median(self, sector):
+        # Live median of the universe, else the static table in rules.py
+        live = self.sector_stats.median(sector) if self.sector_stats is not None else None
+        if live is not None:
+            return live
+        rules = self.rules['fundamental']
+        return rules['sector_pe_median'].get(sector, rules['default_pe_median'])
 
     def _row(self, df, candidates):
         for name in candidates:
@@ -21,64 +63,57 @@ class ScoringEngine:
     # ─────────────────────────────────────────────────────────
     def calculate_technical(self, df):
         if df.empty or len(df) < 50:
-            return 0, {}
-
-        close = df['Close']
-        price = close.iloc[-1]
-
-        rsi       = RSIIndicator(close).rsi().iloc[-1]
-        sma_50    = SMAIndicator(close, window=50).sma_indicator().iloc[-1]
-        ema_20    = EMAIndicator(close, window=20).ema_indicator().iloc[-1]
-        sma_200   = SMAIndicator(close, window=min(200, len(df))).sma_indicator().iloc[-1]
-
-        macd_calc   = MACD(close)
-        macd_line   = macd_calc.macd().iloc[-1]
-        macd_signal = macd_calc.macd_signal().iloc[-1]
-
-        bb        = BollingerBands(close)
-        bb_high   = bb.bollinger_hband().iloc[-1]
-        bb_low    = bb.bollinger_lband().iloc[-1]
+            return 0, TechnicalMeta()
+
+        # Last row of the shared indicator frame (the chart reads the same frame)
+        last = indicator_frame(df).iloc[-1]
+        price       = last['Price']
+        rsi         = last['RSI']
+        sma_50      = last['SMA50']
+        ema_20      = last['EMA20']
+        sma_200     = last['SMA200']
+        macd_line   = last['MACD']
+        macd_signal = last['MACD_Signal']
+        bb_high     = last['BB_High']
+        bb_low      = last['BB_Low']
 
         is_uptrend = price > sma_50
-        self.current_tech_trend = is_uptrend
 
-        # (label, bullish=1/bearish=-1, weight)
-        signals = [
-            ('Price Above SMA 200',  1 if price > sma_200        else -1, 25),
-            ('Price Above SMA 50',   1 if price > sma_50         else -1, 20),
-            ('Golden Cross Active',  1 if sma_50 > sma_200       else -1, 15),
-            ('MACD Bullish Cross',   1 if macd_line > macd_signal else -1, 15),
-            ('MACD Above Zero',      1 if macd_line > 0           else -1, 10),
-            ('RSI Momentum',         1 if (is_uptrend and 50 <= rsi <= 82) or (not is_uptrend and rsi < 45) else -1, 8),
-            ('Price Above EMA 20',   1 if price > ema_20          else -1,  5),
-            ('BB Band Position',     1 if (is_uptrend and price >= bb_high * 0.98) or (not is_uptrend and price < bb_high) else -1, 2),
+        bullish = [
+            price > sma_200,
+            price > sma_50,
+            sma_50 > sma_200,
+            macd_line > macd_signal,
+            macd_line > 0,
+            (is_uptrend and 50 <= rsi <= 82) or (not is_uptrend and rsi < 45),
+            price > ema_20,
+            (is_uptrend and price >= bb_high * 0.98) or (not is_uptrend and price < bb_high),
         ]
+        # (label, bullish=1/bearish=-1, weight)
+        signals = [(lbl, 1 if b else -1, w) for (lbl, w), b in zip(TECH_SIGNALS, bullish)]
 
         total_w     = sum(w for _, _, w in signals)
         bull_w      = sum(w for _, s, w in signals if s == 1)
         final_score = (bull_w / total_w) * 100
 
-        meta = {
-            "RSI": rsi, "SMA50": sma_50, "SMA200": sma_200, "EMA20": ema_20,
-            "MACD": macd_line, "MACD_Signal": macd_signal,
-            "BB_High": bb_high, "BB_Low": bb_low,
-            "Price": price, "Trend": is_uptrend,
-            "signal_details": [(lbl, s) for lbl, s, _ in signals]
-        }
+        meta = TechnicalMeta(
+            RSI=rsi, SMA50=sma_50, SMA200=sma_200, EMA20=ema_20,
+            MACD=macd_line, MACD_Signal=macd_signal,
+            BB_High=bb_high, BB_Low=bb_low,
+            Price=price, Trend=is_uptrend,
+            signal_details=[(lbl, s) for lbl, s, _ in signals],
+        )
         return final_score, meta
 
     # ─────────────────────────────────────────────────────────
     #  SENTIMENT
     # ─────────────────────────────────────────────────────────
     def calculate_social(self, social_data):
-        empty_meta = {"summary": "", "details": [], "counts": {"bull": 0, "bear": 0, "neut": 0}}
         if "error" in social_data:
-            empty_meta["summary"] = f"⚠️ ERROR: {social_data['error']}"
-            return 0, empty_meta
+            return 0, SocialMeta(summary=f"⚠️ ERROR: {social_data['error']}")
         headlines = social_data.get('headlines', [])
         if not headlines:
-            empty_meta["summary"] = "No relevant news found."
-            return 0, empty_meta
+            return 0, SocialMeta(summary="No relevant news found.")
 
         bull_pow = bear_pow = bull_cnt = bear_cnt = neut_cnt = 0
         for item in headlines:
@@ -96,17 +131,19 @@ class ScoringEngine:
         elif final_score < 40: summary = f"Bearish Bias — {bear_cnt} negative signals"
         else:                  summary = "Mixed / Neutral Sentiment"
 
-        return final_score, {
-            "summary": summary, "details": headlines,
-            "counts": {"bull": bull_cnt, "bear": bear_cnt, "neut": neut_cnt}
-        }
+        return final_score, SocialMeta(
+            summary=summary, details=headlines,
+            counts={"bull": bull_cnt, "bear": bear_cnt, "neut": neut_cnt},
+        )
 
     # ─────────────────────────────────────────────────────────
     #  DERIVATIVES
     # ─────────────────────────────────────────────────────────
-    def calculate_derivative(self, data):
+    def calculate_derivative(self, data, tech_trend=True):
+        # tech_trend: the technical meta's 'Trend' (price above SMA50).
+        # Short interest and IV read differently in up- and downtrends.
         if not data.get('valid'):
-            return 0, {}
+            return 0, DerivativeMeta()
 
         pcr_vol     = data.get('pcr_vol')
         pcr_oi      = data.get('pcr_oi')
@@ -114,66 +151,28 @@ class ScoringEngine:
         short_ratio = data.get('short_ratio')
         avg_iv      = data.get('avg_iv')
 
+        rules  = self.rules['derivative']
+        row    = derivative_fields(data)
         scores = {}
-
-        if short_float is not None:
-            sf = short_float * 100
-            if not self.current_tech_trend:
-                float_score = 15 if sf > 10 else 50
-            else:
-                float_score = 85 if sf < 3 else 30 if sf > 15 else 55
-            scores['float'] = (float_score, 0.20)
-
-        if short_ratio is not None:
-            sf_pct = short_float * 100 if short_float is not None else 0
-            if not self.current_tech_trend:
-                ratio_score = 20 if short_ratio > 5 else 50
-            else:
-                ratio_score = 95 if short_ratio > 8 and sf_pct > 10 else 70 if short_ratio < 3 else 35
-            scores['ratio'] = (ratio_score, 0.20)
-
-        if pcr_oi is not None:
-            if pcr_oi < 0.6:    oi_score = 95
-            elif pcr_oi < 0.9:  oi_score = 75
-            elif pcr_oi > 1.2:  oi_score = 25
-            else:               oi_score = 50
-            scores['oi'] = (oi_score, 0.30)
-
-        if pcr_vol is not None:
-            if pcr_vol < 0.7:   vol_score = 85
-            elif pcr_vol > 1.1: vol_score = 35
-            else:               vol_score = 50
-            scores['vol'] = (vol_score, 0.15)
-
-        if avg_iv is not None:
-            iv_pct = avg_iv * 100
-            if self.current_tech_trend:
-                if iv_pct > 80:   iv_score = 25
-                elif iv_pct > 60: iv_score = 42
-                elif iv_pct > 40: iv_score = 60
-                elif iv_pct > 20: iv_score = 78
-                else:             iv_score = 90
-            else:
-                if iv_pct > 70:   iv_score = 15
-                elif iv_pct > 50: iv_score = 30
-                elif iv_pct > 35: iv_score = 50
-                elif iv_pct > 20: iv_score = 70
-                else:             iv_score = 85
-            scores['iv'] = (iv_score, 0.15)
+        for name, weight in rules['weights'].items():
+            s = ladder_for(rules['ladders'], name, tech_trend).score(row)
+            if s is not None:
+                scores[name] = (s, weight)
 
         if not scores:
-            return 0, {}
+            return 0, DerivativeMeta()
 
         total_w     = sum(w for _, w in scores.values())
         final_score = sum(s * w for s, w in scores.values()) / total_w
 
-        meta = {
-            "pcr_vol":     pcr_vol,
-            "pcr_oi":      pcr_oi,
-            "short_float": short_float * 100 if short_float is not None else None,
-            "short_ratio": short_ratio,
-            "avg_iv":      avg_iv * 100 if avg_iv is not None else None
-        }
+        meta = DerivativeMeta(
+            pcr_vol=pcr_vol,
+            pcr_oi=pcr_oi,
+            short_float=short_float * 100 if short_float is not None else None,
+            short_ratio=short_ratio,
+            avg_iv=avg_iv * 100 if avg_iv is not None else None,
+            term_structure=data.get('term_structure', []),
+        )
         return final_score, meta
 
     # ─────────────────────────────────────────────────────────
@@ -187,216 +186,89 @@ class ScoringEngine:
     #
     #  Piotroski kept as a display-only quality badge, not a scoring driver.
     # ─────────────────────────────────────────────────────────
-    def calculate_fundamental(self, info):
+    def calculate_fundamental(self, info, keep_info=False):
+        # keep_info: also keep the raw info dict on the meta (meta.info);
+        # off by default, it is hundreds of keys per ticker
         if not info:
-            return 0, {}
+            return 0, FundamentalMeta()
 
         sector     = info.get('sector', 'Unknown')
         pe         = info.get('trailingPE')
         pb         = info.get('priceToBook')
         roe        = info.get('returnOnEquity')
-        roa        = info.get('returnOnAssets')
         debt_eq    = info.get('debtToEquity')
         rev_growth = info.get('revenueGrowth')
         margins    = info.get('profitMargins')
         op_margins = info.get('operatingMargins')
-        fcf        = info.get('freeCashflow')
-        market_cap = info.get('marketCap')
-        eps_growth = info.get('earningsGrowth')
 
         insider_buys  = info.get('insider_buys', 0)
         insider_sells = info.get('insider_sells', 0)
+        insider_flow  = {k: info.get(k, 0) for k in ('insider_buy_value', 'insider_sell_value', 'insider_net_value')}
+        insider_flow['insider_windows'] = info.get('insider_windows', {})
 
         is_distressed = (roe is not None and roe < 0) or (margins is not None and margins < 0)
 
-        sector_pe_median = {
-            'Technology': 32, 'Communication Services': 22,
-            'Consumer Cyclical': 25, 'Consumer Defensive': 22,
-            'Healthcare': 28, 'Biotechnology': 35,
-            'Financial Services': 14, 'Financials': 14,
-            'Industrials': 20, 'Basic Materials': 16,
-            'Energy': 13, 'Utilities': 18, 'Real Estate': 38,
-            'Semiconductor': 30, 'Software': 35, 'Retail': 20, 'Automotive': 14,
-        }
-        pe_median = sector_pe_median.get(sector, 20)
+        rules     = self.rules['fundamental']
+        pe_median = self.sector_pe_median(sector)
 
         # ── Piotroski (display badge only) ───────────────────
         p_score, p_signals, p_raw, p_max = self._piotroski(info)
 
         # ─────────────────────────────────────────────────────
-        #  PILLAR 1: PROFITABILITY  (35%)
-        #  Based on ROE, net margin, operating margin, ROA
-        # ─────────────────────────────────────────────────────
-        prof_components = []
-
-        if roe is not None:
-            if roe > 0.40:   roe_s = 100
-            elif roe > 0.20: roe_s = 85
-            elif roe > 0.10: roe_s = 65
-            elif roe > 0:    roe_s = 45
-            else:            roe_s = 5
-            prof_components.append((roe_s, 0.45))
-
-        if margins is not None:
-            if margins > 0.30:   mg_s = 100
-            elif margins > 0.20: mg_s = 85
-            elif margins > 0.10: mg_s = 70
-            elif margins > 0:    mg_s = 45
-            else:                mg_s = 5
-            prof_components.append((mg_s, 0.35))
-
-        if roa is not None:
-            if roa > 0.15:   roa_s = 100
-            elif roa > 0.08: roa_s = 80
-            elif roa > 0.03: roa_s = 60
-            elif roa > 0:    roa_s = 40
-            else:            roa_s = 5
-            prof_components.append((roa_s, 0.20))
-
-        if prof_components:
-            tw   = sum(w for _, w in prof_components)
-            prof_score = sum(s * w for s, w in prof_components) / tw
-        else:
-            prof_score = None
-
-        # ─────────────────────────────────────────────────────
-        #  PILLAR 2: GROWTH  (30%)
-        #  Revenue growth (primary) + EPS growth (secondary)
-        # ─────────────────────────────────────────────────────
-        growth_components = []
-
-        if rev_growth is not None:
-            if rev_growth >= 0.40:   rg_s = 100
-            elif rev_growth >= 0.20: rg_s = 88
-            elif rev_growth >= 0.10: rg_s = 72
-            elif rev_growth >= 0.05: rg_s = 55
-            elif rev_growth >= 0:    rg_s = 40
-            else:                    rg_s = 8
-            growth_components.append((rg_s, 0.65))
-
-        if eps_growth is not None:
-            if eps_growth >= 0.40:   eg_s = 100
-            elif eps_growth >= 0.20: eg_s = 85
-            elif eps_growth >= 0.05: eg_s = 65
-            elif eps_growth >= 0:    eg_s = 45
-            else:                    eg_s = 10
-            growth_components.append((eg_s, 0.35))
-
-        if growth_components:
-            tw          = sum(w for _, w in growth_components)
-            growth_score = sum(s * w for s, w in growth_components) / tw
-        else:
-            growth_score = None
-
-        # ─────────────────────────────────────────────────────
-        #  PILLAR 3: VALUATION  (15%)
-        #  Sector-relative PE.  High P/B only penalised if ROE < 20%.
-        # ─────────────────────────────────────────────────────
-        val_score = None
-        if pe is not None:
-            ratio = pe / pe_median
-            if ratio < 0.5:   val_score = 100
-            elif ratio < 0.8: val_score = 88
-            elif ratio < 1.1: val_score = 74
-            elif ratio < 1.5: val_score = 52
-            elif ratio < 2.0: val_score = 32
-            else:             val_score = 15
-            # Only penalise high PB when ROE doesn't justify it
-            if pb is not None and pb > 10 and (roe is None or roe < 0.20):
-                val_score = max(5, val_score - 20)
-
-        # ─────────────────────────────────────────────────────
-        #  PILLAR 4: FINANCIAL HEALTH  (10%)
-        #  Debt-to-equity
-        # ─────────────────────────────────────────────────────
-        health_score = None
-        if debt_eq is not None:
-            if debt_eq < 30:    health_score = 95
-            elif debt_eq < 80:  health_score = 80
-            elif debt_eq < 150: health_score = 62
-            elif debt_eq < 250: health_score = 40
-            else:               health_score = 20
-
-        # ─────────────────────────────────────────────────────
-        #  PILLAR 5: FCF QUALITY  (10%)
-        # ─────────────────────────────────────────────────────
-        fcf_score = None
-        if fcf is not None and market_cap is not None and market_cap > 0:
-            yield_ = fcf / market_cap
-            if yield_ > 0.06:   fcf_score = 100
-            elif yield_ > 0.03: fcf_score = 82
-            elif yield_ > 0.01: fcf_score = 62
-            elif yield_ > 0:    fcf_score = 42
-            else:               fcf_score = 10
-
-        # ─────────────────────────────────────────────────────
-        #  COMPOSITE (weighted, only over available pillars)
+        #  PILLARS  (ladders and weights in rules.FUNDAMENTAL)
+        #  Each pillar averages the components that are present;
+        #  the composite averages the pillars that are present.
         # ─────────────────────────────────────────────────────
-        pool = {}
-        if prof_score   is not None: pool['prof']   = (prof_score,   0.35)
-        if growth_score is not None: pool['growth']  = (growth_score, 0.30)
-        if val_score    is not None: pool['val']     = (val_score,    0.15)
-        if health_score is not None: pool['health']  = (health_score, 0.10)
-        if fcf_score    is not None: pool['fcf']     = (fcf_score,    0.10)
-
-        empty_meta = {
-            **info, "PE": pe, "PB": pb, "ROE": roe,
-            "DebtEq": debt_eq, "RevGrowth": rev_growth, "Margins": margins,
-            "insider_buys": insider_buys, "insider_sells": insider_sells,
-            "insider_booster": 0, "is_distressed": is_distressed,
-            "sector_pe_median": pe_median,
-            "piotroski_signals": p_signals, "piotroski_raw": p_raw, "piotroski_max": p_max,
-            "pillar_scores": {}
-        }
+        row     = fundamental_fields(info, pe_median)
+        pillars = {}
+        for pillar, spec in rules['pillars'].items():
+            components = []
+            for name, weight in spec['components'].items():
+                s = rules['ladders'][name].score(row)
+                if s is None:
+                    continue
+                if name == 'valuation':
+                    s = pb_penalty(s, pb, roe, rules['pb_penalty'])
+                components.append((s, weight))
+            if components:
+                tw = sum(w for _, w in components)
+                pillars[pillar] = sum(s * w for s, w in components) / tw
+
+        pool = {p: (s, rules['pillars'][p]['weight']) for p, s in pillars.items()}
+
+        meta = FundamentalMeta(
+            name=info.get('longName') or info.get('shortName'),
+            sector=info.get('sector'), industry=info.get('industry'),
+            PE=pe, PB=pb, ROE=roe,
+            DebtEq=debt_eq, RevGrowth=rev_growth, Margins=margins,
+            insider_buys=insider_buys, insider_sells=insider_sells, **insider_flow,
+            is_distressed=is_distressed,
+            sector_pe_median=pe_median,
+            piotroski_signals=p_signals, piotroski_raw=p_raw, piotroski_max=p_max,
+            info={k: v for k, v in info.items() if not k.startswith('_')} if keep_info else None,
+        )
 
         if not pool:
-            return 0, empty_meta
+            return 0, meta
 
         total_w     = sum(w for _, w in pool.values())
-        final_score = sum(s * w for s, w in pool.values()) / total_w
-
-        # Distressed company hard cap
-        if is_distressed:
-            final_score = min(final_score, 35)
-
-        # Stretch scores away from the middle (same as before)
-        if final_score >= 70:
-            final_score = 70 + (final_score - 70) * 1.3
-        elif final_score <= 35:
-            final_score = 35 - (35 - final_score) * 1.3
-        final_score = max(0, min(100, final_score))
+        final_score = stretch(sum(s * w for s, w in pool.values()) / total_w, is_distressed, rules)
 
-        booster = min(insider_buys * 1.5, 10)
-        if is_distressed and insider_sells > 20:
+        boost   = rules['insider_booster']
+        booster = min(insider_buys * boost['per_buy'], boost['max'])
+        if is_distressed and insider_sells > boost['distressed_sells_above']:
             booster = 0
 
-        pillar_scores = {
-            "Profitability": round(prof_score)   if prof_score   is not None else None,
-            "Growth":        round(growth_score) if growth_score is not None else None,
-            "Valuation":     round(val_score)    if val_score    is not None else None,
-            "Health":        round(health_score) if health_score is not None else None,
-            "FCF Quality":   round(fcf_score)    if fcf_score    is not None else None,
-        }
-
-        meta = {
-            **info,
-            "PE": pe, "PB": pb, "ROE": roe,
-            "DebtEq": debt_eq, "RevGrowth": rev_growth, "Margins": margins,
-            "insider_buys": insider_buys, "insider_sells": insider_sells,
-            "insider_booster": booster, "is_distressed": is_distressed,
-            "sector_pe_median": pe_median,
-            "piotroski_signals": p_signals, "piotroski_raw": p_raw, "piotroski_max": p_max,
-            "pillar_scores": pillar_scores
-        }
+        meta.insider_booster = booster
+        meta.pillar_scores   = {p: round(pillars[p]) if p in pillars else None for p in rules['pillars']}
         return final_score, meta
 
     # ─────────────────────────────────────────────────────────
     #  PIOTROSKI helper (display badge only, not composite driver)
     # ─────────────────────────────────────────────────────────
     def _piotroski(self, info):
-        fin = info.get('_financials')
-        bs  = info.get('_balance_sheet')
-        cf  = info.get('_cashflow')
+        # Statement frames already in info (see pipeline.score_pillars); no I/O here
+        fin, bs, cf = statements_of(info)
 
         score   = 0
         signals = {}
@@ -418,15 +290,12 @@ class ScoringEngine:
         )
 
         if has_multi:
-            ni      = self._row(fin, ['Net Income', 'Net Income Common Stockholders'])
-            ta      = self._row(bs,  ['Total Assets'])
-            rev     = self._row(fin, ['Total Revenue'])
-            gp      = self._row(fin, ['Gross Profit'])
-            ltd     = self._row(bs,  ['Long Term Debt', 'Long Term Debt And Capital Lease Obligation'])
-            ca      = self._row(bs,  ['Current Assets', 'Total Current Assets'])
-            cl      = self._row(bs,  ['Current Liabilities', 'Total Current Liabilities'])
-            sh      = self._row(bs,  ['Ordinary Shares Number', 'Share Issued'])
-            cf_row  = self._row(cf,  ['Operating Cash Flow', 'Total Cash From Operating Activities']) if cf is not None else None
+            frames  = {'_financials': fin, '_balance_sheet': bs, '_cashflow': cf}
+            rows    = {k: self._row(frames[st], labels) if frames[st] is not None else None
+                       for k, (st, labels) in PIOTROSKI_ROWS.items()}
+            ni, ta, rev, gp = rows['ni'], rows['ta'], rows['rev'], rows['gp']
+            ltd, ca, cl, sh = rows['ltd'], rows['ca'], rows['cl'], rows['sh']
+            cf_row  = rows['cfo']
 
             if ni is not None and ta is not None and len(ta) > 2:
                 try:
@@ -0,0 +1,196 @@
+import argparse
+import importlib.util
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+from data_loader import DataLoader
+from panel import rank_panel
+from pipeline import _included, fetch_pillars, record_history, score_pillars
+from sector_stats import SectorStats
+
+# ─────────────────────────────────────────────────────────
+#  BATCH SCREENER  –  headless scoring of a whole ticker universe
+#
+#    python -m screener --universe sp500.txt --workers 16 --out scores.csv
+#
+#  Each ticker runs the same fetch + score path as the Streamlit page;
+#  the composite comes from utils.composite_score. The run's fundamentals
+#  are summarised into per-sector quantile sketches (sector_stats.py),
+#  saved at the end for the next run's sector P/E medians. --rank adds
+#  sector-neutral percentile ranks (panel.rank_panel) and sorts by them.
+# ─────────────────────────────────────────────────────────
+
+PILLARS = ['fundamental', 'social', 'technical', 'derivative']
+
+
+def load_universe(path):
+    tickers = []
+    with open(path) as fh:
+        for line in fh:
+            line = line.split('#', 1)[0]
+            tickers += [t.strip().upper() for t in line.replace(',', ' ').split() if t.strip()]
+    return list(dict.fromkeys(tickers))
+
+
+def score_one(ticker, include, executor, social=None, shards=None, known=()):
+    # shards: {thread id: SectorStats}, each worker thread feeds its own;
+    # tickers in `known` are already in the sector stats being extended
+    start = time.monotonic()
+    try:
+        # Fresh loader per ticker so Yahoo payloads don't accumulate over the run
+        fetched = fetch_pillars(ticker, DataLoader(), include=include, executor=executor)
+        if social is not None:
+            fetched['social'] = social
+        if shards is not None and ticker not in known:
+            shards.setdefault(threading.get_ident(), SectorStats()).observe(ticker, fetched.get('fundamental'))
+        result = score_pillars(fetched)
+    except Exception as e:
+        return {"ticker": ticker, "error": str(e), "seconds": time.monotonic() - start}
+    if result is None:
+        return {"ticker": ticker, "error": "no price data", "seconds": time.monotonic() - start}
+    result.ticker = ticker
+    record_history(result, "screener")
+
+    meta_fund = result['meta'].get('fundamental', {})
+    row = {
+        "ticker":          ticker,
+        "composite":       round(result['composite'], 2),
+        "rating":          result['rating'][0],
+        "insider_booster": meta_fund.get('insider_booster', 0),
+        "sector":          meta_fund.get('sector'),
+    }
+    for pillar in PILLARS:
+        score = result['scores'].get(pillar)
+        row[pillar] = round(score, 2) if score is not None else None
+    row["error"]   = None
+    row["seconds"] = round(time.monotonic() - start, 3)
+    return row
+
+
+def run_screen(tickers, workers=16, include=None, progress=True):
+    include = list(include or PILLARS)
+    rows, start, metrics = [], time.monotonic(), None
+
+    # Sentiment is classified up front for the whole universe: headlines
+    # from many tickers share each LLM request.
+    social = {}
+    if 'social' in include:
+        loader = DataLoader()
+        social = loader.get_social_sentiment_batch(tickers, workers=workers)
+        metrics = loader.classifier.metrics
+        include = [p for p in include if p != 'social']
+
+    # This run's sector quantiles: one SectorStats shard per worker thread.
+    # A run smaller than the saved snapshot extends it instead of replacing it.
+    shards = {}
+    base   = SectorStats.load()
+    if len(tickers) >= len(base.tickers):
+        base = None
+
+    # Inner pool for the concurrent pillar calls: sized so every worker's
+    # calls start immediately and the per-call timeouts aren't spent queueing.
+    # fetch_pillars may add calls of its own (statements with fundamentals).
+    inner = ThreadPoolExecutor(max_workers=workers * len(_included(include)), thread_name_prefix="screen-fetch")
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screen") as pool:
+            futures = [pool.submit(score_one, t, include, inner, social.get(t), shards,
+                                   base.tickers if base is not None else ()) for t in tickers]
+            for n, future in enumerate(as_completed(futures), 1):
+                rows.append(future.result())
+                if progress and (n % 25 == 0 or n == len(futures)):
+                    elapsed = time.monotonic() - start
+                    print(f"  {n}/{len(futures)} scored  ({n / elapsed:.2f} tickers/sec)", file=sys.stderr)
+    finally:
+        inner.shutdown(wait=False, cancel_futures=True)
+
+    save_sector_stats(shards.values(), base)
+
+    elapsed = time.monotonic() - start
+    df = pd.DataFrame(rows)
+    if not df.empty and 'composite' in df:
+        df = df.sort_values('composite', ascending=False, na_position='last').reset_index(drop=True)
+    return df, elapsed, metrics
+
+
+def save_sector_stats(shards, base=None):
+    # Merge the worker shards into a new universe snapshot, or into `base`
+    # (the saved snapshot, keeping its age so its values still expire).
+    # Best effort: a failed write keeps the previous snapshot.
+    stats = base if base is not None else SectorStats()
+    added = False
+    for shard in shards:
+        added |= bool(shard.tickers)
+        stats.merge(shard)
+    if added:
+        try:
+            stats.save(saved_at=base.saved_at if base is not None else None)
+        except Exception as e:
+            print(f"Sector stats not saved: {e}", file=sys.stderr)
+    return stats
+
+
+def rank_scores(df):
+    # Adds <pillar>_pct, composite_pct and rank (1 = best), sorted by rank
+    if df.empty or 'sector' not in df:
+        return df
+    ranks = rank_panel(df[[p for p in PILLARS if p in df]], df['sector'])
+    df = df.join(ranks.round(2).add_suffix('_pct').rename(columns={'rank_pct': 'rank'}))
+    return df.sort_values('rank', na_position='last').reset_index(drop=True)
+
+
+def parquet_engine_available():
+    # DataFrame.to_parquet needs pyarrow or fastparquet
+    return any(importlib.util.find_spec(m) is not None for m in ("pyarrow", "fastparquet"))
+
+
+def write_scores(df, path):
+    if path.endswith('.parquet'):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="screener", description="Score a ticker universe headlessly.")
+    parser.add_argument("--universe", required=True, help="file of tickers (one per line, or comma/space separated)")
+    parser.add_argument("--workers", type=int, default=16, help="tickers scored in parallel")
+    parser.add_argument("--out", default="scores.csv", help="output path (.csv or .parquet)")
+    parser.add_argument("--no-sentiment", action="store_true", help="skip the FinViz + LLM sentiment pillar")
+    parser.add_argument("--rank", action="store_true", help="add sector-neutral percentile ranks and sort by them")
+    parser.add_argument("--quiet", action="store_true", help="no progress output")
+    args = parser.parse_args(argv)
+
+    # Fail now, not after the whole universe has been scored
+    if args.out.endswith('.parquet') and not parquet_engine_available():
+        parser.error("--out *.parquet needs pyarrow (pip install pyarrow)")
+
+    tickers = load_universe(args.universe)
+    if not tickers:
+        parser.error(f"no tickers found in {args.universe}")
+
+    include = [p for p in PILLARS if not (args.no_sentiment and p == 'social')]
+
+    df, elapsed, metrics = run_screen(tickers, args.workers, include, progress=not args.quiet)
+    if args.rank:
+        rank_start = time.perf_counter()
+        df = rank_scores(df)
+        print(f"Ranked within sectors in {(time.perf_counter() - rank_start) * 1000:.1f} ms")
+    write_scores(df, args.out)
+
+    if metrics:
+        print(f"Sentiment: {metrics['headlines']} headlines ({metrics['cached']} cached) in "
+              f"{metrics['requests']} LLM requests — {metrics['requests_per_ticker']:.3f} requests/ticker, "
+              f"{metrics['tokens_per_headline']:.1f} tokens/headline")
+
+    failed = int(df['error'].notna().sum()) if 'error' in df else 0
+    print(f"Scored {len(df) - failed}/{len(tickers)} tickers in {elapsed:.1f}s "
+          f"({len(tickers) / elapsed:.2f} tickers/sec) -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+import json
+import math
+import os
+import threading
+import time
+
+from utils import cache_path
+
+# --- SETTINGS ---
+SECTOR_FIELDS        = ('trailingPE', 'priceToBook')   # info keys summarised per sector
+SKETCH_ACCURACY      = 0.01          # relative error of any quantile (1%)
+SECTOR_MIN_COUNT     = 20            # names a sector needs before its live quantiles are used
+SECTOR_STATS_MAX_AGE = 7 * 86400     # an older saved snapshot is ignored
+SECTOR_STATS_PATH    = cache_path("sector_stats.json")
+
+
+# ─────────────────────────────────────────────────────────
+#  QUANTILE SKETCH  –  log-bucketed counts (DDSketch)
+#
+#  A value x > 0 falls in bucket ceil(log_γ x), γ = (1+α)/(1−α); every
+#  quantile comes back within relative error α. add() is one log and one
+#  dict increment, and two sketches with the same α merge by adding their
+#  bucket counts, so shards built in parallel combine exactly. Ratios
+#  like P/E span 0.1–10,000, a few hundred buckets at α = 1%.
+# ─────────────────────────────────────────────────────────
+class QuantileSketch:
+    __slots__ = ('accuracy', '_log_gamma', 'bins', 'count')
+
+    def __init__(self, accuracy=SKETCH_ACCURACY):
+        self.accuracy   = accuracy
+        self._log_gamma = math.log((1 + accuracy) / (1 - accuracy))
+        self.bins  = {}
+        self.count = 0
+
+    def add(self, value):
+        # Non-positive and non-finite values are not counted
+        if not (0 < value < math.inf):
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.bins[key] = self.bins.get(key, 0) + 1
+        self.count += 1
+
+    def merge(self, other):
+        if other.accuracy != self.accuracy:
+            raise ValueError("sketches with different accuracy cannot be merged")
+        for key, n in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0) + n
+        self.count += other.count
+        return self
+
+    def quantile(self, q):
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                break
+        # Bucket (γ^(k-1), γ^k] is represented by the point within α of both ends
+        gamma = math.exp(self._log_gamma)
+        return 2 * gamma ** key / (gamma + 1)
+
+    def to_dict(self):
+        return {'accuracy': self.accuracy, 'bins': {str(k): n for k, n in self.bins.items()}}
+
+    @classmethod
+    def from_dict(cls, d):
+        sketch = cls(d['accuracy'])
+        sketch.bins  = {int(k): n for k, n in d['bins'].items()}
+        sketch.count = sum(sketch.bins.values())
+        return sketch
+
+
+# ─────────────────────────────────────────────────────────
+#  SECTOR STATS  –  per-sector quantiles of the fundamentals we fetch
+#
+#  observe() adds a ticker's info once (later observations of the same
+#  ticker are ignored, so repeat lookups don't skew a sector). The
+#  screener gives each worker thread its own shard and merges them at the
+#  end of the run; shards must cover disjoint tickers. A screen at least
+#  as large as the saved snapshot replaces it; a smaller one only adds
+#  the tickers the snapshot lacks. A sector's quantiles are reported only
+#  once SECTOR_MIN_COUNT names have been seen; callers fall back to the
+#  static table in rules.py until then.
+# ─────────────────────────────────────────────────────────
+class SectorStats:
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, fields=SECTOR_FIELDS, accuracy=SKETCH_ACCURACY):
+        self.fields   = tuple(fields)
+        self.accuracy = accuracy
+        self.tickers  = set()
+        self.saved_at = None          # when the snapshot this came from was taken
+        self._sketches = {}           # (sector, field) -> QuantileSketch
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls):
+        # Process-wide instance, seeded from the last saved snapshot
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls.load()
+            return cls._default
+
+    def _sketch(self, sector, field):
+        key = (sector, field)
+        if key not in self._sketches:
+            self._sketches[key] = QuantileSketch(self.accuracy)
+        return self._sketches[key]
+
+    def observe(self, ticker, info):
+        # info: the yfinance info dict. Returns True if the ticker was counted.
+        sector = info.get('sector') if info else None
+        if not sector:
+            return False
+        with self._lock:
+            if ticker in self.tickers:
+                return False
+            self.tickers.add(ticker)
+            for field in self.fields:
+                value = info.get(field)
+                if isinstance(value, (int, float)):
+                    self._sketch(sector, field).add(value)
+        return True
+
+    def merge(self, other):
+        with self._lock:
+            self.tickers |= other.tickers
+            for (sector, field), sketch in other._sketches.items():
+                self._sketch(sector, field).merge(sketch)
+        return self
+
+    def count(self, sector, field='trailingPE'):
+        sketch = self._sketches.get((sector, field))
+        return sketch.count if sketch else 0
+
+    def quantile(self, sector, q, field='trailingPE', min_count=SECTOR_MIN_COUNT):
+        # None when the sector has fewer than min_count values
+        with self._lock:
+            sketch = self._sketches.get((sector, field))
+            if sketch is None or sketch.count < min_count:
+                return None
+            return sketch.quantile(q)
+
+    def median(self, sector, field='trailingPE', min_count=SECTOR_MIN_COUNT):
+        return self.quantile(sector, 0.5, field, min_count)
+
+    def medians(self, field='trailingPE', min_count=SECTOR_MIN_COUNT):
+        # {sector: median} for every sector with enough values
+        with self._lock:
+            sectors = [s for s, f in self._sketches if f == field]
+        medians = {s: self.median(s, field, min_count) for s in sectors}
+        return {s: m for s, m in medians.items() if m is not None}
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                'fields':   list(self.fields),
+                'accuracy': self.accuracy,
+                'tickers':  sorted(self.tickers),
+                'sketches': [{'sector': s, 'field': f, **sk.to_dict()} for (s, f), sk in self._sketches.items()],
+            }
+
+    @classmethod
+    def from_dict(cls, d):
+        stats = cls(d['fields'], d['accuracy'])
+        stats.tickers = set(d['tickers'])
+        for row in d['sketches']:
+            stats._sketches[(row['sector'], row['field'])] = QuantileSketch.from_dict(row)
+        return stats
+
+    def save(self, path=SECTOR_STATS_PATH, saved_at=None):
+        # saved_at: the snapshot's age for load(); defaults to now
+        snapshot = {'saved_at': time.time() if saved_at is None else saved_at, **self.to_dict()}
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(snapshot, fh)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=SECTOR_STATS_PATH, max_age=SECTOR_STATS_MAX_AGE):
+        # Empty stats when there is no snapshot, or it is older than max_age
+        try:
+            with open(path, encoding="utf-8") as fh:
+                snapshot = json.load(fh)
+            if time.time() - snapshot['saved_at'] <= max_age:
+                stats = cls.from_dict(snapshot)
+                stats.saved_at = snapshot['saved_at']
+                return stats
+        except Exception:
+            pass
+        return cls()
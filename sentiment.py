@@ -0,0 +1,199 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import cache_path
+
+# --- LLM SETTINGS ---
+SENTIMENT_MODELS = ["llama-3.3-70b-versatile", "llama-3.1-8b-instant"]   # primary, fallback
+PROMPT_VERSION   = 2   # bump whenever build_prompt changes: old cache entries stop matching
+
+# Token budgeting (rough: ~4 characters per token for English headlines)
+TOKEN_BUDGET         = 6000   # prompt + expected completion, per request
+PROMPT_BASE_TOKENS   = 150    # instructions + schema
+ITEM_OVERHEAD_TOKENS = 12     # id/ticker/JSON punctuation per headline in the prompt
+ITEM_OUTPUT_TOKENS   = 18     # one {"id", "sentiment", "score"} object in the reply
+
+
+def estimate_tokens(text):
+    return len(text) // 4 + 1
+
+
+def build_prompt(items):
+    # items: [{"id", "ticker", "title"}]. Results are matched back by id,
+    # never by position, so headlines from many tickers can share a request.
+    return f"""
+        Analyze these headlines. Judge each one for the ticker it is listed with:
+        {json.dumps(items, ensure_ascii=False)}
+
+        Task:
+        1. Classify each as 'Bullish', 'Bearish', or 'Neutral/Irrelevant'.
+        2. Assign an Impact Score (0-10). 0=Irrelevant, 10=Major News.
+
+        Output JSON ONLY, one entry per id:
+        {{
+            "analysis": [
+                {{"id": "h1", "sentiment": "Bullish", "score": 8}},
+                {{"id": "h2", "sentiment": "Neutral", "score": 2}}
+            ]
+        }}
+        """
+
+
+def pack_batches(pending, token_budget=TOKEN_BUDGET):
+    # pending: [(ticker, title)] -> lists that each fit one request's budget
+    batches, batch, used = [], [], PROMPT_BASE_TOKENS
+    for ticker, title in pending:
+        cost = estimate_tokens(title) + estimate_tokens(ticker) + ITEM_OVERHEAD_TOKENS + ITEM_OUTPUT_TOKENS
+        if batch and used + cost > token_budget:
+            batches.append(batch)
+            batch, used = [], PROMPT_BASE_TOKENS
+        batch.append((ticker, title))
+        used += cost
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+# ─────────────────────────────────────────────────────────
+#  HEADLINE CACHE  –  content-addressed LLM classifications
+#
+#  Key = sha256(prompt version, model, ticker, headline). The ticker is
+#  part of the key because the prompt asks for sentiment *for that
+#  ticker*: the same headline can be bullish for one name and bearish for
+#  a competitor.
+# ─────────────────────────────────────────────────────────
+def headline_key(ticker, title, model):
+    raw = json.dumps([PROMPT_VERSION, model, ticker.upper(), title.strip()], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class HeadlineCache:
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, path=None):
+        self.path  = path or cache_path("headlines.sqlite")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS classifications ("
+                " key TEXT PRIMARY KEY, sentiment TEXT, score NUMERIC, model TEXT, created_at REAL)"
+            )
+
+    @classmethod
+    def default(cls):
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def lookup(self, ticker, titles, models=SENTIMENT_MODELS):
+        # {title: {"sentiment", "score"}} for every title classified before by
+        # any of `models`; earlier models in the list win.
+        found = {}
+        for model in reversed(models):
+            keys = {headline_key(ticker, t, model): t for t in titles}
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT key, sentiment, score FROM classifications WHERE key IN ({','.join('?' * len(keys))})",
+                    list(keys)
+                ).fetchall() if keys else []
+            for key, sentiment, score in rows:
+                found[keys[key]] = {"sentiment": sentiment, "score": score}
+        return found
+
+    def store(self, ticker, model, results):
+        # results: {title: {"sentiment", "score"}}
+        now  = time.time()
+        rows = [
+            (headline_key(ticker, title, model), r.get("sentiment"), r.get("score"), model, now)
+            for title, r in results.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO classifications (key, sentiment, score, model, created_at) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+
+# ─────────────────────────────────────────────────────────
+#  BATCH CLASSIFIER  –  headlines from many tickers per LLM request
+#
+#  `complete(prompt, est_tokens)` returns (parsed JSON, model, usage) or
+#  None when every key/model is exhausted; the DataLoader supplies it.
+#  Batches are sent `concurrency` at a time so a multi-key pool can serve
+#  them in parallel.
+# ─────────────────────────────────────────────────────────
+class BatchClassifier:
+    def __init__(self, complete, cache=None, token_budget=TOKEN_BUDGET, retries=1, concurrency=4):
+        self.complete     = complete
+        self.cache        = cache
+        self.token_budget = token_budget
+        self.retries      = retries
+        self.concurrency  = concurrency
+        self.metrics      = {}
+
+    def _request(self, batch):
+        ids    = {f"h{i}": item for i, item in enumerate(batch, 1)}
+        prompt = build_prompt([{"id": k, "ticker": t, "title": h} for k, (t, h) in ids.items()])
+        return ids, self.complete(prompt, estimate_tokens(prompt) + ITEM_OUTPUT_TOKENS * len(batch))
+
+    def classify(self, titles_by_ticker):
+        # {ticker: [titles]} -> {ticker: {title: {"sentiment", "score"}}}.
+        # A ticker whose request failed and that has nothing cached is left
+        # out of the result.
+        results = {t: {} for t in titles_by_ticker}
+        pending = []
+        for ticker, titles in titles_by_ticker.items():
+            titles = list(dict.fromkeys(titles))
+            if self.cache is not None:
+                results[ticker].update(self.cache.lookup(ticker, titles))
+            pending += [(ticker, t) for t in titles if t not in results[ticker]]
+
+        m = {"tickers": len(titles_by_ticker), "headlines": sum(len(v) for v in titles_by_ticker.values()),
+             "cached": sum(len(v) for v in results.values()), "requests": 0,
+             "prompt_tokens": 0, "completion_tokens": 0, "failed": set()}
+
+        for _ in range(1 + self.retries):
+            if not pending:
+                break
+            batches = pack_batches(pending, self.token_budget)
+            with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(batches)))) as pool:
+                replies = list(pool.map(self._request, batches))
+
+            missed = []
+            for batch, (ids, reply) in zip(batches, replies):
+                m["requests"] += 1
+                if reply is None:
+                    m["failed"].update(t for t, _ in batch)
+                    continue
+                parsed, model, usage = reply
+                m["prompt_tokens"]     += getattr(usage, "prompt_tokens", 0) or 0
+                m["completion_tokens"] += getattr(usage, "completion_tokens", 0) or 0
+
+                fresh = {}
+                for r in parsed.get("analysis", []) if isinstance(parsed, dict) else []:
+                    if isinstance(r, dict) and r.get("id") in ids:
+                        ticker, title = ids[r["id"]]
+                        fresh.setdefault(ticker, {})[title] = {
+                            "sentiment": r.get("sentiment", "Neutral"), "score": r.get("score", 0)
+                        }
+                for ticker, got in fresh.items():
+                    results[ticker].update(got)
+                    if self.cache is not None:
+                        self.cache.store(ticker, model, got)
+                missed += [(t, h) for t, h in batch if h not in fresh.get(t, {})]
+            # A dropped id gets another request; a dead key pool does not
+            pending = [(t, h) for t, h in missed if t not in m["failed"]]
+
+        classified = sum(len(v) for v in results.values()) - m["cached"]
+        m["requests_per_ticker"] = m["requests"] / max(1, m["tickers"])
+        m["tokens_per_headline"] = (m["prompt_tokens"] + m["completion_tokens"]) / max(1, classified)
+        self.metrics = m
+        return {t: r for t, r in results.items() if t not in m["failed"] or r}
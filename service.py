@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+import os
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from data_loader import convert_name_to_ticker
+from payload import frame_to_payload, result_to_payload
+from pipeline import analyze_ticker_cached
+from score_history import ScoreHistory
+
+# ─────────────────────────────────────────────────────────
+#  SCORING SERVICE  –  headless HTTP API over the analysis pipeline
+#
+#  GET  /score/{ticker}[?bars=1]   one analysis (bars=1 adds the OHLCV the UI charts)
+#  POST /score/batch               {"tickers": [...]} -> summaries, in order
+#  GET  /history/{ticker}[?start=&end=]   stored score runs (no recomputation)
+#  GET  /history?date=YYYY-MM-DD   every ticker's last run that day
+#  GET  /resolve?q=...             company name -> ticker
+#  GET  /health
+#
+#  The pipeline is thread-based (blocking HTTP clients), so each analysis
+#  runs in the threadpool; the event loop only schedules and serialises.
+#  Results come from the shared ResultCache, so the service and anything
+#  else in the same process reuse each other's work.
+# ─────────────────────────────────────────────────────────
+
+BATCH_MAX_TICKERS = 500
+BATCH_CONCURRENCY = int(os.getenv("SCORE_BATCH_CONCURRENCY", "8"))
+
+
+def _summary(result, age):
+    return {
+        "ticker":    result["ticker"],
+        "composite": result["composite"],
+        "rating":    result["rating"][0],
+        "scores":    result["scores"],
+        "age":       age,
+    }
+
+
+async def _analyze(ticker):
+    return await run_in_threadpool(analyze_ticker_cached, ticker.strip().upper(), source="service")
+
+
+async def score(request):
+    ticker = request.path_params["ticker"]
+    result, age = await _analyze(ticker)
+    if result is None:
+        return JSONResponse({"error": f"No price data for {ticker.upper()}"}, status_code=404)
+    bars = request.query_params.get("bars") in ("1", "true")
+    return JSONResponse(await run_in_threadpool(result_to_payload, result, age, bars))
+
+
+async def score_batch(request):
+    try:
+        body = await request.json()
+        tickers = [str(t) for t in body["tickers"]]
+    except Exception:
+        return JSONResponse({"error": 'Expected JSON body {"tickers": [...]}'}, status_code=400)
+    if len(tickers) > BATCH_MAX_TICKERS:
+        return JSONResponse({"error": f"At most {BATCH_MAX_TICKERS} tickers per batch"}, status_code=413)
+
+    gate = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def one(ticker):
+        async with gate:
+            try:
+                result, age = await _analyze(ticker)
+            except Exception as e:
+                return {"ticker": ticker.upper(), "error": str(e)}
+        if result is None:
+            return {"ticker": ticker.upper(), "error": "No price data"}
+        return result_to_payload(_summary(result, age), age, bars=False)
+
+    return JSONResponse({"results": await asyncio.gather(*(one(t) for t in tickers))})
+
+
+async def history(request):
+    store = ScoreHistory.default()
+    if "ticker" in request.path_params:
+        ticker = request.path_params["ticker"].strip().upper()
+        q = request.query_params
+        df = await run_in_threadpool(store.history, ticker, q.get("start"), q.get("end"))
+    elif request.query_params.get("date"):
+        df = await run_in_threadpool(store.cross_section, request.query_params["date"])
+    else:
+        return JSONResponse({"error": "Missing ?date="}, status_code=400)
+    return JSONResponse(frame_to_payload(df))
+
+
+async def resolve(request):
+    query = request.query_params.get("q", "")
+    if not query.strip():
+        return JSONResponse({"error": "Missing ?q="}, status_code=400)
+    return JSONResponse({"query": query, "ticker": await run_in_threadpool(convert_name_to_ticker, query)})
+
+
+async def health(request):
+    return JSONResponse({"status": "ok"})
+
+
+app = Starlette(routes=[
+    Route("/score/batch", score_batch, methods=["POST"]),
+    Route("/score/{ticker}", score),
+    Route("/history/{ticker}", history),
+    Route("/history", history),
+    Route("/resolve", resolve),
+    Route("/health", health),
+])
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run the headless scoring API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    uvicorn.run(app, host=args.host, port=args.port)
@@ -0,0 +1,81 @@
+import functools
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done   = threading.Event()
+        self.result = None
+        self.error  = None
+
+
+# ─────────────────────────────────────────────────────────
+#  SINGLE-FLIGHT  –  concurrent identical calls share one execution
+#
+#  The first caller for a key runs the function; anyone asking for the
+#  same key while it runs waits and gets the same result (or exception).
+#  Nothing is kept afterwards — caching is the stores' job. Waiters share
+#  the returned object, so callers must not mutate it.
+# ─────────────────────────────────────────────────────────
+class SingleFlight:
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self):
+        self.calls     = 0
+        self.coalesced = 0
+        self._inflight = {}
+        self._lock     = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._inflight.get(key)
+            if call is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._inflight[key] = _Call()
+                self.calls += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            call.done.set()
+
+    def stats(self):
+        with self._lock:
+            return {"calls": self.calls, "coalesced": self.coalesced, "inflight": len(self._inflight)}
+
+
+def coalesced(kind):
+    # Method decorator: concurrent calls with the same arguments, from any
+    # instance, go through the process-wide group as one (kind, *args) key.
+    def wrap(method):
+        @functools.wraps(method)
+        def inner(self, *args, **kwargs):
+            key = (kind,) + args + tuple(sorted(kwargs.items()))
+            return SingleFlight.shared().do(key, lambda: method(self, *args, **kwargs))
+        return inner
+    return wrap
@@ -0,0 +1,138 @@
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils import cache_path
+
+# --- SETTINGS ---
+# info key the scorer reads -> TickerSession attribute (annual statements)
+STATEMENT_KINDS = {
+    '_financials':    'financials',
+    '_balance_sheet': 'balance_sheet',
+    '_cashflow':      'cashflow',
+}
+FISCAL_YEAR_DAYS        = 365
+FILING_LAG_DAYS         = 100        # 10-K deadline is 60–90 days after year end
+STATEMENT_RETRY_SECONDS = 86400      # re-check daily once the next filing is due (or none was found)
+
+
+def _encode(frame):
+    # Line items × period-end columns (newest first, as yfinance returns them)
+    frame = frame.apply(pd.to_numeric, errors='coerce')
+    return json.dumps({
+        'index':   [str(i) for i in frame.index],
+        'columns': [pd.Timestamp(c).isoformat() for c in frame.columns],
+        'data':    frame.astype(float).replace({np.nan: None}).to_numpy().tolist(),
+    })
+
+
+def _decode(text):
+    d = json.loads(text)
+    return pd.DataFrame(d['data'], index=d['index'], columns=pd.to_datetime(d['columns']), dtype=float)
+
+
+def next_period_due(frames):
+    # Epoch seconds when the next annual filing should be out, or None
+    ends = [pd.Timestamp(c) for f in frames.values() if f is not None for c in f.columns]
+    if not ends:
+        return None
+    latest = max(ends)
+    if latest.tzinfo is not None:
+        latest = latest.tz_convert(None)
+    return (latest + pd.Timedelta(days=FISCAL_YEAR_DAYS + FILING_LAG_DAYS)).timestamp()
+
+
+# ─────────────────────────────────────────────────────────
+#  STATEMENT STORE  –  annual statements per ticker, kept until the next
+#  fiscal period's filing is due
+#
+#  Statements change once a year (quarterly at most), so each ticker's
+#  three frames are stored with an expiry at the expected date of the
+#  next 10-K. Past that date, or when Yahoo had none, the ticker is
+#  re-checked at most once per STATEMENT_RETRY_SECONDS.
+# ─────────────────────────────────────────────────────────
+class StatementStore:
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, path=None):
+        self.path  = path or cache_path("statements.sqlite")
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS statements ("
+                " ticker TEXT NOT NULL, kind TEXT NOT NULL, frame TEXT,"
+                " PRIMARY KEY (ticker, kind)) WITHOUT ROWID"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fetches (ticker TEXT PRIMARY KEY, fetched_at REAL, expires_at REAL)"
+            )
+
+    @classmethod
+    def default(cls):
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def expires_at(self, ticker):
+        with self._lock:
+            row = self._conn.execute("SELECT expires_at FROM fetches WHERE ticker = ?", (ticker,)).fetchone()
+        return row[0] if row else None
+
+    def load(self, ticker):
+        # {info key: DataFrame} for the statements stored (possibly empty)
+        with self._lock:
+            rows = self._conn.execute("SELECT kind, frame FROM statements WHERE ticker = ?", (ticker,)).fetchall()
+        return {kind: _decode(frame) for kind, frame in rows}
+
+    def write(self, ticker, frames, now=None):
+        now = time.time() if now is None else now
+        due = next_period_due(frames)
+        expires = max(due or 0, now + STATEMENT_RETRY_SECONDS)
+        rows = [(ticker, kind, _encode(f)) for kind, f in frames.items() if f is not None and not f.empty]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM statements WHERE ticker = ?", (ticker,))
+            self._conn.executemany("INSERT INTO statements (ticker, kind, frame) VALUES (?, ?, ?)", rows)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fetches (ticker, fetched_at, expires_at) VALUES (?, ?, ?)", (ticker, now, expires)
+            )
+
+
+def fetch_statements(ticker, session, store=None, now=None):
+    # session: anything with .financials/.balance_sheet/.cashflow
+    # (TickerSession). Served from the store until the next filing is due;
+    # otherwise the three statements are fetched concurrently. If every
+    # fetch fails the stored copy (if any) is kept and returned.
+    store = store if store is not None else StatementStore.default()
+    now   = time.time() if now is None else now
+    expires = store.expires_at(ticker)
+    if expires is not None and now < expires:
+        return store.load(ticker)
+
+    def fetch(attr):
+        try:
+            return getattr(session, attr)
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=len(STATEMENT_KINDS)) as pool:
+        frames = dict(zip(STATEMENT_KINDS, pool.map(fetch, STATEMENT_KINDS.values())))
+    if any(f is not None for f in frames.values()):
+        store.write(ticker, frames, now)
+    # Read back, so fresh and stored statements are typed the same way
+    return store.load(ticker)
+
+
+def statements_of(info):
+    # (financials, balance sheet, cash flow) from the info dict; None for
+    # any that is unavailable. pipeline.fetch_pillars fetches them as their
+    # own timed job and score_pillars adds them to the fundamental info.
+    return tuple(info.get(k) for k in STATEMENT_KINDS)
@@ -0,0 +1,8 @@
+import os
+import sys
+import tempfile
+
+# Repo modules are imported top-level (no package); keep their on-disk
+# caches out of the working tree.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("STOCK_CACHE_DIR", tempfile.mkdtemp(prefix="stock-cache-"))
@@ -0,0 +1,76 @@
+import http.server
+import os
+import threading
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from finviz import FinvizScraper, parse_news_table
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "finviz_quote_AAPL.html")
+
+EXPECTED = [
+    {"title": "Apple iPhone sales beat estimates",
+     "link": "https://finance.yahoo.com/news/apple-iphone-sales-beat-093000.html",
+     "source": "Yahoo Finance", "time": "Oct-17-26 09:30AM"},
+    {"title": "Apple services revenue hits a record",
+     "link": "{base}/news/265001/apple-services-revenue",
+     "source": "{host}", "time": "08:15AM"},
+    {"title": "Apple faces new EU probe",
+     "link": "https://www.marketwatch.com/story/apple-faces-eu-probe-2026",
+     "source": "MarketWatch", "time": "Oct-16-26 06:02PM"},
+]
+
+
+def _expected(base_url):
+    host = urlparse(base_url).netloc.replace("www.", "").capitalize()
+    return [{k: v.format(base=base_url, host=host) for k, v in row.items()} for row in EXPECTED]
+
+
+def _fixture():
+    with open(FIXTURE, "rb") as fh:
+        return fh.read()
+
+
+class QuotePage(http.server.BaseHTTPRequestHandler):
+    # Local stand-in for finviz.com: the saved AAPL quote page, 404 otherwise
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/quote.ashx" and parse_qs(url.query).get("t") == ["AAPL"]:
+            body, status = _fixture(), 200
+        else:
+            body, status = b"not found", 404
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def finviz_url():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), QuotePage)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_parse_news_table_extracts_headlines_links_and_dates():
+    assert parse_news_table(_fixture(), "https://finviz.com") == _expected("https://finviz.com")
+
+
+def test_parse_news_table_respects_limit():
+    assert [h["title"] for h in parse_news_table(_fixture(), limit=2)] == [
+        "Apple iPhone sales beat estimates", "Apple services revenue hits a record"]
+
+
+def test_scrape_against_local_stand_in(finviz_url):
+    scraper = FinvizScraper(base_url=finviz_url, rate=0)
+    assert scraper.scrape("AAPL") == _expected(finviz_url)
+    assert scraper.scrape("MISSING") == []
+    assert scraper.scrape_many(["AAPL", "MISSING"], workers=2) == {"AAPL": _expected(finviz_url), "MISSING": []}
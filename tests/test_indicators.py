@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+from indicators import indicator_frame
+from scorers import ScoringEngine
+
+
+def _prices(close, ticker="TEST"):
+    idx = pd.date_range("2025-01-02", periods=len(close), freq="B")
+    df  = pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+                        "Volume": np.full(len(close), 1_000_000)}, index=idx)
+    df.attrs["ticker"] = ticker
+    return df
+
+
+def test_rewritten_last_bar_is_not_served_from_cache():
+    # The price store rewrites today's bar in place: same dates, same
+    # length, different close
+    close = 100 + np.linspace(0, 1.5, 260)
+    df    = _prices(close)
+    engine = ScoringEngine()
+    score, meta = engine.calculate_technical(df)
+    assert meta.Price == close[-1]
+
+    dropped = close.copy()
+    dropped[-1] *= 0.8
+    df2 = _prices(dropped)
+    score2, meta2 = engine.calculate_technical(df2)
+
+    assert meta2.Price == dropped[-1]
+    assert indicator_frame(df2)["Price"].iloc[-1] == dropped[-1]
+    uncached = _prices(dropped, ticker=None)     # no ticker: never cached
+    assert score2 == engine.calculate_technical(uncached)[0]
+    assert score2 != score
@@ -0,0 +1,50 @@
+import sqlite3
+
+import pandas as pd
+
+from insiders import InsiderStore
+
+
+def _filings(*rows):
+    return pd.DataFrame(rows, columns=["Start Date", "Insider", "Shares", "Value", "Text", "Transaction"])
+
+
+SALE    = ("2026-03-02", "COOK TIMOTHY D", 10_000, 2_400_000, "Sale at price 240.00 per share.", "Sale")
+REVISED = ("2026-03-02", "COOK TIMOTHY D", 10_000, 2_410_000, "Sale at price 241.00 per share.", "Sale")
+
+
+def _rows(store, ticker):
+    return store._conn.execute(
+        "SELECT insider, shares, value, side FROM transactions WHERE ticker = ?", (ticker,)
+    ).fetchall()
+
+
+def test_revised_filing_replaces_the_stored_one(tmp_path):
+    store = InsiderStore(str(tmp_path / "insiders.sqlite"))
+    assert store.update("AAPL", _filings(SALE)) == 1
+    assert store.update("AAPL", _filings(REVISED)) == 0
+    assert _rows(store, "AAPL") == [("COOK TIMOTHY D", 10_000.0, 2_410_000.0, -1)]
+    agg = store.aggregates("AAPL")
+    assert agg["insider_sells"] == 1 and agg["insider_sell_value"] == 2_410_000.0
+
+
+def test_identical_separate_transactions_are_both_kept(tmp_path):
+    store = InsiderStore(str(tmp_path / "insiders.sqlite"))
+    assert store.update("AAPL", _filings(SALE, SALE)) == 2
+    assert store.update("AAPL", _filings(SALE, SALE)) == 0
+    assert store.aggregates("AAPL")["insider_sells"] == 2
+
+
+def test_rows_under_the_old_whole_row_keys_are_rekeyed(tmp_path):
+    path = str(tmp_path / "insiders.sqlite")
+    InsiderStore(path)._conn.close()
+    with sqlite3.connect(path) as conn:
+        conn.executemany(
+            "INSERT INTO transactions (ticker, key, date, insider, shares, value, side) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [("AAPL", "0" * 40, 1772409600, "COOK TIMOTHY D", 10_000, 2_400_000, -1),
+             ("AAPL", "1" * 40, 1772409600, "COOK TIMOTHY D", 10_000, 2_410_000, -1)],
+        )
+    store = InsiderStore(path)
+    assert len(_rows(store, "AAPL")) == 1
+    assert store.update("AAPL", _filings(REVISED)) == 0
+    assert _rows(store, "AAPL") == [("COOK TIMOTHY D", 10_000.0, 2_410_000.0, -1)]
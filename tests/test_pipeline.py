@@ -0,0 +1,87 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from pipeline import fetch_pillars, score_pillars
+
+
+def _prices():
+    idx   = pd.date_range("2025-01-02", periods=260, freq="B")
+    close = 100 + np.linspace(0, 20, 260)
+    return pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+                         "Volume": 1_000_000}, index=idx)
+
+
+def _statements():
+    periods = pd.to_datetime(["2024-12-31", "2023-12-31", "2022-12-31"])
+    frame   = lambda rows: pd.DataFrame(rows, index=periods).T
+    return {
+        '_financials':    frame({'Net Income': [12, 10, 9], 'Total Revenue': [120, 100, 95], 'Gross Profit': [60, 45, 40]}),
+        '_balance_sheet': frame({'Total Assets': [200, 190, 180], 'Long Term Debt': [40, 50, 55],
+                                 'Current Assets': [80, 70, 60], 'Current Liabilities': [40, 40, 40],
+                                 'Ordinary Shares Number': [10, 10, 10]}),
+        '_cashflow':      frame({'Operating Cash Flow': [20, 15, 14]}),
+    }
+
+
+class FakeLoader:
+    def __init__(self, statements_delay=0.0):
+        self.statements_delay = statements_delay
+        self.release = threading.Event()
+
+    def get_technical_data(self, ticker):
+        return _prices()
+
+    def get_fundamental_data(self, ticker):
+        return {"sector": "Technology", "trailingPE": 25.0, "returnOnEquity": 0.25,
+                "returnOnAssets": 0.06, "operatingCashflow": 2e9, "currentPrice": 120.0}
+
+    def get_statements(self, ticker):
+        if self.statements_delay:
+            self.release.wait(self.statements_delay)
+        return _statements()
+
+
+def test_statements_are_fetched_next_to_fundamentals():
+    fetched = fetch_pillars("ACME", FakeLoader(), include=["technical", "fundamental"])
+    assert set(fetched["statements"]) == {'_financials', '_balance_sheet', '_cashflow'}
+
+    result = score_pillars(fetched)
+    assert result.meta["fundamental"].piotroski_max == 9
+    assert "_financials" not in fetched["fundamental"]       # the fetched info isn't modified
+
+
+def test_slow_statements_fall_back_within_their_budget():
+    loader = FakeLoader(statements_delay=5)
+    start  = time.monotonic()
+    fetched = fetch_pillars("ACME", loader, include=["technical", "fundamental"], timeouts={"statements": 0.2})
+    result  = score_pillars(fetched)
+    loader.release.set()
+
+    assert time.monotonic() - start < 2
+    assert fetched["statements"] == {}
+    # Only the two level signals from the info dict; no fetch from the scorer
+    assert result.meta["fundamental"].piotroski_max == 2
+
+
+def test_cached_analysis_is_keyed_on_result_shaping_options(monkeypatch):
+    from pipeline import analyze_ticker_cached
+    from result_cache import ResultCache
+    import pipeline
+
+    monkeypatch.setattr(pipeline, "record_history", lambda result, source: None)
+    cache  = ResultCache()
+    loader = FakeLoader()
+
+    narrow, _ = analyze_ticker_cached("ACME", cache=cache, loader=loader, include=["technical"])
+    full, _   = analyze_ticker_cached("ACME", cache=cache, loader=loader, include=["technical", "fundamental"])
+    kept, _   = analyze_ticker_cached("ACME", cache=cache, loader=loader, include=["technical", "fundamental"],
+                                      keep_info=True)
+    again, age = analyze_ticker_cached("ACME", cache=cache, loader=loader, include=["fundamental", "technical"])
+
+    assert "fundamental" not in narrow.scores
+    assert "fundamental" in full.scores and full.meta["fundamental"].info is None
+    assert kept.meta["fundamental"].info is not None
+    assert again is full and age > 0
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+import data_loader
+from data_loader import DataLoader
+from price_store import PriceStore
+
+
+class FakeSession:
+    # Daily bars ending on an ex-dividend day; records each history() call
+    def __init__(self, bars):
+        self.bars  = bars
+        self.calls = []
+
+    def history(self, **kwargs):
+        self.calls.append(kwargs)
+        if 'start' in kwargs:
+            return self.bars[self.bars.index >= pd.Timestamp(kwargs['start'], tz=self.bars.index.tz)]
+        return self.bars
+
+
+def _bars(n=250):
+    idx   = pd.date_range("2025-01-02", periods=n, freq="B", tz="America/New_York")
+    close = 100 + np.arange(n, dtype=float)
+    bars  = pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+                          "Volume": 1_000_000, "Dividends": 0.0, "Stock Splits": 0.0}, index=idx)
+    bars.iloc[-1, bars.columns.get_loc("Dividends")] = 0.25
+    return bars
+
+
+def test_dividend_on_last_stored_bar_does_not_rebuild_every_refresh(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_loader, "PRICE_REFRESH_SECONDS", -1)    # refresh on every call
+    session = FakeSession(_bars())
+    loader  = DataLoader(price_store=PriceStore(str(tmp_path / "prices.sqlite")))
+    monkeypatch.setattr(loader, "session", lambda ticker: session)
+
+    loader._price_history("DIV")
+    loader._price_history("DIV")
+    loader._price_history("DIV")
+
+    last = session.bars.index[-1].strftime('%Y-%m-%d')
+    assert session.calls == [{'period': '1y'}, {'start': last}, {'start': last}]
+
+
+def test_dividend_on_new_bar_rebuilds(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_loader, "PRICE_REFRESH_SECONDS", -1)
+    bars    = _bars()
+    session = FakeSession(bars.iloc[:-1])
+    loader  = DataLoader(price_store=PriceStore(str(tmp_path / "prices.sqlite")))
+    monkeypatch.setattr(loader, "session", lambda ticker: session)
+
+    loader._price_history("DIV")
+    session.bars = bars                     # the ex-dividend bar arrives
+    loader._price_history("DIV")
+
+    first = bars.index[0].strftime('%Y-%m-%d')
+    assert session.calls[-1] == {'start': first}
@@ -0,0 +1,52 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from options import aggregate
+from panel import derivative_panel, fundamental_panel
+from rules import missing
+from scorers import ScoringEngine
+
+DERIVATIVE = {"valid": True, "pcr_vol": 0.8, "pcr_oi": 0.9, "short_float": 0.04, "short_ratio": 3.0}
+INFO = {"sector": "Technology", "trailingPE": 28.0, "returnOnEquity": 0.22, "profitMargins": 0.18,
+        "returnOnAssets": 0.09, "revenueGrowth": 0.12, "debtToEquity": 60.0}
+
+
+def test_missing_is_none_or_nan():
+    assert missing(None) and missing(float("nan")) and missing(np.nan)
+    assert not missing(0) and not missing(0.0) and not missing(-1.5)
+
+
+@pytest.mark.parametrize("trend", [True, False])
+def test_nan_iv_leaves_the_iv_component_out(trend):
+    # options.aggregate reports avg_iv = NaN when no contract has an IV.
+    # The IV component is dropped, as for None; it is not scored as the
+    # lowest-IV bucket (what a NaN fell through to before the rule tables).
+    engine = ScoringEngine()
+    nan_iv  = engine.calculate_derivative({**DERIVATIVE, "avg_iv": float("nan")}, trend)[0]
+    no_iv   = engine.calculate_derivative(DERIVATIVE, trend)[0]
+    tiny_iv = engine.calculate_derivative({**DERIVATIVE, "avg_iv": 0.0001}, trend)[0]
+    assert nan_iv == no_iv
+    assert nan_iv != tiny_iv
+
+    panel = derivative_panel(pd.DataFrame([{**DERIVATIVE, "avg_iv": np.nan}]), trend)
+    assert panel["score"].iloc[0] == pytest.approx(nan_iv)
+
+
+def test_aggregate_without_iv_reports_nan():
+    term = pd.DataFrame({"call_volume": [10.0, 4.0], "put_volume": [5.0, 2.0],
+                         "call_oi": [100.0, 40.0], "put_oi": [50.0, 20.0], "iv": [np.nan, np.nan]})
+    assert math.isnan(aggregate(term)["avg_iv"])
+
+
+def test_nan_fundamental_field_is_skipped_like_none():
+    engine = ScoringEngine()
+    nan_roe  = engine.calculate_fundamental({**INFO, "returnOnEquity": float("nan")})
+    none_roe = engine.calculate_fundamental({k: v for k, v in INFO.items() if k != "returnOnEquity"})
+    assert nan_roe[0] == none_roe[0]
+    assert nan_roe[1].pillar_scores == none_roe[1].pillar_scores
+
+    panel = fundamental_panel(pd.DataFrame([{**INFO, "returnOnEquity": np.nan}]))
+    assert panel["score"].iloc[0] == pytest.approx(nan_roe[0])
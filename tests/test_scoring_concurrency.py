@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import indicators
+from scorers import ScoringEngine
+
+N_TICKERS = 120
+
+
+def _inputs(i):
+    rng   = np.random.default_rng(i)
+    idx   = pd.date_range("2024-01-02", periods=260, freq="B")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 260)))
+    prices = pd.DataFrame({"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+                           "Volume": rng.integers(1e5, 1e7, 260)}, index=idx)
+    prices.attrs["ticker"] = f"T{i}"
+    info = {
+        "sector": ["Technology", "Energy", "Utilities", "Healthcare"][i % 4],
+        "trailingPE": float(rng.uniform(5, 60)), "priceToBook": float(rng.uniform(0.5, 15)),
+        "returnOnEquity": float(rng.normal(0.12, 0.15)), "returnOnAssets": float(rng.normal(0.05, 0.05)),
+        "profitMargins": float(rng.normal(0.1, 0.12)), "revenueGrowth": float(rng.normal(0.08, 0.15)),
+        "earningsGrowth": float(rng.normal(0.1, 0.3)), "debtToEquity": float(rng.uniform(0, 250)),
+        "freeCashflow": float(rng.normal(5e8, 5e8)), "marketCap": float(rng.uniform(1e9, 1e11)),
+        "operatingCashflow": float(rng.normal(7e8, 5e8)),
+        "insider_buys": int(rng.integers(0, 8)), "insider_sells": int(rng.integers(0, 30)),
+    }
+    derivative = {
+        "valid": True, "pcr_vol": float(rng.uniform(0.3, 2)), "pcr_oi": float(rng.uniform(0.3, 2)),
+        "short_float": float(rng.uniform(0, 0.3)), "short_ratio": float(rng.uniform(0.5, 10)),
+        "avg_iv": float(rng.uniform(0.1, 1.2)), "term_structure": [],
+    }
+    return prices, info, derivative
+
+
+def _score(engine, inputs):
+    prices, info, derivative = inputs
+    tech, tech_meta = engine.calculate_technical(prices)
+    deriv, deriv_meta = engine.calculate_derivative(derivative, tech_meta.get("Trend", True))
+    fund, fund_meta = engine.calculate_fundamental(info)
+    return (tech, deriv, fund), (tech_meta.to_dict(), deriv_meta.to_dict(), fund_meta.to_dict())
+
+
+def test_shared_engine_scores_in_parallel_as_it_does_serially():
+    inputs = [_inputs(i) for i in range(N_TICKERS)]
+
+    # Both runs start from a cold indicator memo, so the parallel one
+    # computes its frames concurrently rather than reading serial's
+    indicators._frames.clear()
+    engine = ScoringEngine()
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        parallel = list(pool.map(lambda x: _score(engine, x), inputs))
+
+    indicators._frames.clear()
+    serial = [_score(ScoringEngine(), x) for x in inputs]
+
+    assert parallel == serial
+    # The inputs span both trends and a range of scores, so the
+    # comparison isn't between identical results
+    assert len({s[0] for s, _ in serial}) > 10
+    assert {m[0]["Trend"] for _, m in serial} == {True, False}
@@ -0,0 +1,75 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import screener
+from sector_stats import SECTOR_STATS_PATH, SectorStats
+
+SECTORS = ["Technology", "Energy"]
+
+
+def _fake_fetch(ticker, loader=None, include=None, executor=None, **kwargs):
+    i     = int(ticker[1:])
+    idx   = pd.date_range("2025-01-02", periods=260, freq="B")
+    close = 100 + np.linspace(0, 10, 260)
+    prices = pd.DataFrame({"Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+                           "Volume": 1_000_000}, index=idx)
+    info = {"sector": SECTORS[i % 2], "trailingPE": 10.0 + i % 30, "returnOnEquity": 0.15, "currentPrice": 100.0}
+    return {"technical": prices, "fundamental": info, "derivative": {"valid": False}, "elapsed": 0.0}
+
+
+def _screen(tickers, monkeypatch):
+    monkeypatch.setattr(screener, "fetch_pillars", _fake_fetch)
+    monkeypatch.setattr(screener, "record_history", lambda result, source: None)
+    return screener.run_screen(tickers, workers=4, include=["technical", "fundamental"], progress=False)
+
+
+def test_small_screen_extends_the_sector_snapshot_instead_of_replacing_it(monkeypatch):
+    if os.path.exists(SECTOR_STATS_PATH):
+        os.remove(SECTOR_STATS_PATH)
+
+    _screen([f"T{i}" for i in range(100)], monkeypatch)
+    full = SectorStats.load()
+    assert len(full.tickers) == 100
+    medians = full.medians()
+    assert set(medians) == set(SECTORS)
+
+    # 10 tickers, 5 already in the snapshot: only the 5 new ones are added
+    _screen([f"T{i}" for i in range(95, 105)], monkeypatch)
+    extended = SectorStats.load()
+    assert len(extended.tickers) == 105
+    assert sum(extended.count(s) for s in SECTORS) == 105
+    assert extended.saved_at == full.saved_at
+    assert set(extended.medians()) == set(SECTORS)
+
+    # A screen as large as the snapshot replaces it
+    _screen([f"T{i}" for i in range(200, 305)], monkeypatch)
+    replaced = SectorStats.load()
+    assert replaced.tickers == {f"T{i}" for i in range(200, 305)}
+
+
+def test_parquet_output_without_an_engine_fails_before_screening(monkeypatch, tmp_path, capsys):
+    universe = tmp_path / "u.txt"
+    universe.write_text("T1 T2")
+    monkeypatch.setattr(screener, "parquet_engine_available", lambda: False)
+    monkeypatch.setattr(screener, "run_screen", lambda *a, **k: (_ for _ in ()).throw(AssertionError("screened")))
+    with pytest.raises(SystemExit) as exit_info:
+        screener.main(["--universe", str(universe), "--out", str(tmp_path / "out.parquet")])
+    assert exit_info.value.code == 2
+    assert "pyarrow" in capsys.readouterr().err
+
+
+def test_inner_pool_has_room_for_every_call_of_every_worker(monkeypatch):
+    sizes = []
+    real_pool = screener.ThreadPoolExecutor
+
+    def pool(max_workers, thread_name_prefix=""):
+        sizes.append((thread_name_prefix, max_workers))
+        return real_pool(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+
+    monkeypatch.setattr(screener, "ThreadPoolExecutor", pool)
+    _screen(["T1", "T2"], monkeypatch)
+    # technical + fundamental + the statements call that rides along
+    assert ("screen-fetch", 4 * 3) in sizes
@@ -0,0 +1,70 @@
+import pytest
+
+from ticker_index import TickerIndex
+
+ROWS = [
+    ("UNH",  "UnitedHealth Group Incorporated", False),
+    ("UAL",  "United Airlines Holdings, Inc.", False),
+    ("U",    "Unity Software Inc.", False),
+    ("CYH",  "Community Health Systems, Inc.", False),
+    ("BFAM", "Bright Horizons Family Solutions Inc.", False),
+    ("XYZW", "XYZ Acquisition Corp Warrants", False),
+    ("XYZU", "XYZ Acquisition Corp Units", False),
+    ("XYZR", "XYZ Acquisition Corp Rights", False),
+    ("BACP", "Bank of America Corp 6.0% Preferred", False),
+    ("BAC-L", "Bank of America Corporation Depositary Sh repstg 1/1000th Perp Pfd Ser L", False),
+    # otherlisted.txt names ADRs with the security type inline
+    ("BABA", "Alibaba Group Holding Limited American Depositary Shares, each representing eight Ordinary share", False),
+    ("TSM",  "Taiwan Semiconductor Manufacturing Company Ltd. American Depositary Shares", False),
+    ("AAPL", "Apple Inc. - Common Stock", False),
+]
+
+
+@pytest.mark.parametrize("name, symbol", [
+    ("UnitedHealth", "UNH"),
+    ("United Airlines", "UAL"),
+    ("Unity Software", "U"),
+    ("Community Health", "CYH"),
+    ("Bright Horizons", "BFAM"),
+    ("Alibaba", "BABA"),
+    ("Taiwan Semiconductor", "TSM"),
+    ("Apple", "AAPL"),
+])
+def test_common_stock_names_containing_filter_words_are_indexed(name, symbol):
+    index = TickerIndex(ROWS)
+    assert index.resolve(name) == symbol
+    assert any(label.startswith(f"{symbol} — ") for label in index.labels())
+
+
+def test_warrants_units_rights_and_preferred_are_not_indexed():
+    labels = TickerIndex(ROWS).labels()
+    assert not any(label.split(" — ")[0] in {"XYZW", "XYZU", "XYZR", "BACP", "BAC-L"} for label in labels)
+
+
+def test_display_names_drop_the_security_description():
+    index = TickerIndex(ROWS)
+    assert index.names["BABA"] == "Alibaba Group Holding Limited"
+    assert index.names["AAPL"] == "Apple Inc."
+
+
+SYMBOL_ROWS = [
+    ("AMD",  "Advanced Micro Devices, Inc. - Common Stock", False),
+    ("DOX",  "Amdocs Limited - Ordinary Shares", False),
+    ("GE",   "GE Aerospace Common Stock", False),
+    ("GEV",  "GE Vernova Inc. Common Stock", False),
+    ("F",    "Ford Motor Company Common Stock", False),
+    ("FFIV", "F5, Inc. - Common Stock", False),
+    ("C",    "Citigroup, Inc. Common Stock", False),
+]
+
+
+@pytest.mark.parametrize("query, symbol", [("amd", "AMD"), ("ge", "GE"), ("f", "F"), ("c", "C"), (" Amd ", "AMD")])
+def test_lowercase_tickers_resolve_to_their_symbol_before_name_prefixes(query, symbol):
+    assert TickerIndex(SYMBOL_ROWS).resolve(query) == symbol
+
+
+def test_names_still_resolve_by_prefix():
+    index = TickerIndex(SYMBOL_ROWS)
+    assert index.resolve("amdocs") == "DOX"
+    assert index.resolve("ge vernova") == "GEV"
+    assert index.resolve("Advanced Micro") == "AMD"
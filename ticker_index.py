@@ -0,0 +1,239 @@
+import bisect
+import difflib
+import itertools
+import json
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+
+import requests
+
+from utils import cache_path
+
+# ─────────────────────────────────────────────────────────
+#  TICKER INDEX  –  offline company-name → symbol resolution
+#
+#  Built from a listings file (NASDAQ Trader symbol directory format:
+#  pipe-delimited, "Symbol"/"ACT Symbol" + "Security Name" columns; or a
+#  plain "symbol,name" CSV). Exact and prefix lookups are a dict hit or a
+#  bisect over the sorted names; fuzzy matching only runs when those miss.
+#  Past resolutions (including ones that needed the network) are kept in
+#  a small persistent LRU.
+# ─────────────────────────────────────────────────────────
+
+LISTINGS_PATH = os.getenv("TICKER_LISTINGS") or cache_path("listings.txt")
+LISTINGS_URLS = [
+    "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt",
+    "https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt",
+]
+LRU_PATH     = cache_path("ticker_resolutions.json")
+LRU_SIZE     = 5000
+FUZZY_CUTOFF = 0.85
+
+# Legal-form words stripped from names before matching ("Apple Inc." == "apple")
+_NAME_NOISE = {
+    "inc", "incorporated", "corp", "corporation", "co", "company", "ltd", "limited",
+    "plc", "holdings", "holding", "group", "sa", "nv", "ag", "lp", "llc", "the",
+    "common", "stock", "shares", "ordinary", "class", "a", "b", "c",
+}
+# A listing's security name is "<company> - <security>" in nasdaqlisted.txt;
+# otherlisted.txt has no separator ("Ford Motor Company Common Stock"), so
+# the security part starts at the first of these words
+_SECURITY = re.compile(
+    r"\s+(?=((class [a-z] )?(common stock|ordinary shares?)|american depositary|depositary"
+    r"|(warrants?|units?|rights?|preferred|pfd|notes?|debentures?)\b|[\d.]+%))", re.I)
+# Security parts that aren't the company's common equity. ADRs ("American
+# Depositary Shares") count as common; depositary shares of preferred don't.
+_NOT_COMMON = re.compile(r"\b(warrants?|rights?|units?|preferred|pfd|notes?|debentures?)\b|%", re.I)
+
+
+# Queries that look like a ticker ("amd", "brk.b") are tried as a symbol
+# before any prefix or fuzzy name match ("amd" would prefix-match Amdocs)
+_SYMBOL_QUERY = re.compile(r"^[a-z0-9]{1,5}([.-][a-z])?$", re.I)
+
+
+def normalize_name(text):
+    words = re.sub(r"[^a-z0-9& ]+", " ", text.lower().replace(" and ", " & ")).split()
+    return " ".join(w for w in words if w not in _NAME_NOISE)
+
+
+def split_listing(name):
+    # "Alibaba Group Holding Limited American Depositary Shares" ->
+    # ("Alibaba Group Holding Limited", "American Depositary Shares")
+    if " - " in name:
+        company, security = name.split(" - ", 1)
+    else:
+        match = _SECURITY.search(name)
+        company, security = (name[:match.start()], name[match.end():]) if match else (name, "")
+    return company.strip(), security.strip()
+
+
+def _read_listings(path):
+    rows = []
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        header = None
+        for line in fh:
+            line = line.rstrip("\n")
+            if not line or line.startswith("File Creation Time"):
+                continue
+            sep = "|" if "|" in line else ","
+            cells = [c.strip() for c in line.split(sep)]
+            if header is None or cells[0] in ("Symbol", "ACT Symbol", "symbol"):
+                header = [c.lower() for c in cells]
+                continue
+            rec = dict(zip(header, cells))
+            symbol = rec.get("symbol") or rec.get("act symbol")
+            name   = rec.get("security name") or rec.get("name") or ""
+            if not symbol or rec.get("test issue") == "Y":
+                continue
+            rows.append((symbol.upper(), name, rec.get("etf") == "Y"))
+    return rows
+
+
+def refresh_listings(path=LISTINGS_PATH):
+    # Downloads the NASDAQ Trader symbol directory (NASDAQ + NYSE/other) into one file
+    parts = []
+    for url in LISTINGS_URLS:
+        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=15)
+        response.raise_for_status()
+        parts.append(response.text.strip())
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write("\n".join(parts) + "\n")
+    return path
+
+
+class TickerIndex:
+    def __init__(self, rows=()):
+        self.names   = {}     # symbol -> display name
+        self._by_key = {}     # normalised name -> symbol
+        for symbol, listing, is_etf in rows:
+            # Only the security part decides what the listing is, so company
+            # names like Bright Horizons or UnitedHealth aren't filtered
+            name, security = split_listing(listing)
+            self.names.setdefault(symbol, name)
+            key = normalize_name(name)
+            if key and not is_etf and not _NOT_COMMON.search(security):
+                # First listing wins; shorter symbols are usually the primary class
+                if key not in self._by_key or len(symbol) < len(self._by_key[key]):
+                    self._by_key[key] = symbol
+        self._keys    = sorted(self._by_key)
+        self._symbols = sorted(self.names)
+
+    @classmethod
+    def load(cls, path=LISTINGS_PATH):
+        return cls(_read_listings(path)) if os.path.exists(path) else cls()
+
+    def __len__(self):
+        return len(self.names)
+
+    @staticmethod
+    def _prefixed(keys, prefix):
+        i = bisect.bisect_left(keys, prefix)
+        while i < len(keys) and keys[i].startswith(prefix):
+            yield keys[i]
+            i += 1
+
+    def resolve(self, query):
+        symbol = query.strip().upper()
+        if _SYMBOL_QUERY.match(symbol) and symbol in self.names:
+            return symbol
+        key = normalize_name(query)
+        if not key:
+            return None
+        if key in self._by_key:
+            return self._by_key[key]
+        # Prefix: whole-word matches first ("ford" -> "ford motor", not "fordham"),
+        # then the shortest name
+        hits = list(self._prefixed(self._keys, key))
+        if hits:
+            best = min(hits, key=lambda k: (not k[len(key):].startswith(" "), len(k)))
+            return self._by_key[best]
+        if symbol in self.names:
+            return symbol
+        close = difflib.get_close_matches(key, self._keys, n=1, cutoff=FUZZY_CUTOFF)
+        return self._by_key[close[0]] if close else None
+
+    def suggestions(self, query, limit=10):
+        key, sym = normalize_name(query), query.strip().upper()
+        out = list(itertools.islice(self._prefixed(self._symbols, sym), limit)) if sym else []
+        for k in self._prefixed(self._keys, key) if key else ():
+            if len(out) >= limit:
+                break
+            if self._by_key[k] not in out:
+                out.append(self._by_key[k])
+        return [(s, self.names.get(s, "")) for s in out]
+
+    def labels(self):
+        # "AAPL — Apple Inc." for every common-stock symbol, for type-ahead widgets
+        symbols = sorted(set(self._by_key.values()))
+        return [f"{s} — {self.names[s]}" for s in symbols]
+
+
+class ResolutionCache:
+    # Persistent LRU of query -> symbol
+    def __init__(self, path=LRU_PATH, size=LRU_SIZE):
+        self.path  = path
+        self.size  = size
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+        try:
+            with open(path, encoding="utf-8") as fh:
+                self._data.update(json.load(fh))
+        except Exception:
+            pass
+
+    def get(self, query):
+        key = query.strip().lower()
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, query, symbol):
+        key = query.strip().lower()
+        with self._lock:
+            self._data[key] = symbol
+            self._data.move_to_end(key)
+            while len(self._data) > self.size:
+                self._data.popitem(last=False)
+            snapshot = dict(self._data)
+        tmp = f"{self.path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(snapshot, fh)
+            os.replace(tmp, self.path)
+        except Exception:
+            pass
+
+
+_index = None
+_cache = None
+_lock  = threading.Lock()
+
+
+def get_index():
+    global _index
+    with _lock:
+        if _index is None:
+            _index = TickerIndex.load()
+        return _index
+
+
+def get_resolution_cache():
+    global _cache
+    with _lock:
+        if _cache is None:
+            _cache = ResolutionCache()
+        return _cache
+
+
+if __name__ == "__main__":
+    # python -m ticker_index --refresh   (download listings)
+    # python -m ticker_index apple       (resolve offline)
+    if "--refresh" in sys.argv:
+        print(f"Saved listings to {refresh_listings()}")
+    for q in [a for a in sys.argv[1:] if not a.startswith("--")]:
+        print(q, "->", get_index().resolve(q))
@@ -1,3 +1,12 @@
+import os
+
+# Local on-disk caches (price store, LLM cache, ...). Override with STOCK_CACHE_DIR.
+CACHE_DIR = os.getenv("STOCK_CACHE_DIR", ".cache")
+
+def cache_path(name):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, name)
+
 def normalize(value, min_val, max_val):
     if value < min_val: return 0
     if value > max_val: return 100
@@ -8,4 +17,16 @@ def get_rating(score):
     if score >= 60: return "Bullish Bias 📈", "#00CC96"
     if score >= 40: return "Neutral / Mixed 😐", "orange"
     if score >= 20: return "Bearish Bias 📉", "#FF4B4B"
-    return "Strong Bearish 🐻", "darkred"
\ No newline at end of file
+    return "Strong Bearish 🐻", "darkred"
+
+# Composite weights: Fundamentals 40% | Sentiment 25% | Technical 20% | Derivatives 15%
+PILLAR_WEIGHTS = {"fundamental": 0.40, "social": 0.25, "technical": 0.20, "derivative": 0.15}
+
+def composite_score(scores, insider_booster=0):
+    # Weights are renormalised over the pillars supplied, so a screen that
+    # skips a pillar isn't dragged down by it; with all four this is the plain sum.
+    weights = {k: w for k, w in PILLAR_WEIGHTS.items() if k in scores}
+    if not weights:
+        return 0
+    base = sum(scores[k] * w for k, w in weights.items()) / sum(weights.values())
+    return min(100, base + insider_booster)